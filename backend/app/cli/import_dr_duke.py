@@ -0,0 +1,50 @@
+"""Import Dr. Duke's Phytochemical and Ethnobotanical Databases into SQLite
+
+Download the CSV release from the USDA (Ag Data Commons, "Dr. Duke's
+Phytochemical and Ethnobotanical Databases"), extract it, and point this
+command at the directory. The Dr. Duke client then answers plant,
+activity and concentration lookups locally instead of scraping.
+
+Usage:
+    python -m app.cli.import_dr_duke ~/Downloads/Duke-Source-CSV
+    python -m app.cli.import_dr_duke ./duke-csv --db /data/dr_duke.sqlite3
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List
+
+from app.config import settings
+from app.data.dr_duke_store import import_csv_dir
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import Dr. Duke's CSV files into a local SQLite store")
+    parser.add_argument("csv_dir", type=Path, help="Directory with FNFTAX.csv, FARMACY_NEW.csv, AGGREGAC.csv, ...")
+    parser.add_argument(
+        "--db", type=Path, default=Path(settings.dr_duke_db_path),
+        help="SQLite file to create or replace (default: DR_DUKE_DB_PATH)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if not args.csv_dir.is_dir():
+        parser.error(f"Not a directory: {args.csv_dir}")
+
+    try:
+        counts = import_csv_dir(args.csv_dir, args.db)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return 1
+
+    logger.info("Done: " + ", ".join(f"{count} {table}" for table, count in counts.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
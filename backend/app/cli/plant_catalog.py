@@ -0,0 +1,85 @@
+"""Export and rebuild the packed plant compound catalog
+
+The catalog (app/data/plant_compounds.sqlite3) is edited as JSON: export
+it, change the JSON, and build it back. The build records a new data
+version, which invalidates listings and ETags derived from the catalog.
+
+Usage:
+    python -m app.cli.plant_catalog export catalog.json
+    python -m app.cli.plant_catalog build catalog.json
+    python -m app.cli.plant_catalog info
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import List
+
+from app.data.plant_catalog import CATALOG_PATH, build_catalog
+from app.data.plant_compounds import PLANT_COMPOUNDS_DB
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_PLANT_FIELDS = ("scientific_name", "common_names", "family", "compounds", "traditional_uses", "parts_used")
+
+
+def export_catalog() -> List[dict]:
+    """Every plant as a plain dict, in catalog order"""
+    return [dataclasses.asdict(plant) for plant in PLANT_COMPOUNDS_DB.values()]
+
+
+def validate(plants: List[dict]) -> None:
+    """Reject malformed or duplicate plants before they reach the catalog"""
+    seen = set()
+    for index, plant in enumerate(plants):
+        missing = [f for f in REQUIRED_PLANT_FIELDS if f not in plant]
+        if missing:
+            raise ValueError(f"Plant #{index} is missing {', '.join(missing)}")
+        key = plant["scientific_name"].lower()
+        if key in seen:
+            raise ValueError(f"Duplicate plant: {plant['scientific_name']}")
+        seen.add(key)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export or rebuild the plant compound catalog")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Write the catalog as JSON")
+    export_parser.add_argument("output", type=Path)
+
+    build_parser = subparsers.add_parser("build", help="Rebuild the catalog from JSON")
+    build_parser.add_argument("input", type=Path)
+    build_parser.add_argument("--catalog", type=Path, default=CATALOG_PATH, help="Catalog file to write")
+
+    subparsers.add_parser("info", help="Show the catalog version and size")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if args.command == "export":
+        plants = export_catalog()
+        args.output.write_text(json.dumps(plants, indent=2) + "\n")
+        logger.info(f"Exported {len(plants)} plants to {args.output}")
+    elif args.command == "build":
+        plants = json.loads(args.input.read_text())
+        try:
+            validate(plants)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+        version = build_catalog(plants, args.catalog)
+        logger.info(f"Built {args.catalog} with {len(plants)} plants (data version {version})")
+    else:
+        logger.info(
+            f"{CATALOG_PATH}: {len(PLANT_COMPOUNDS_DB)} plants, "
+            f"data version {PLANT_COMPOUNDS_DB.data_version}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
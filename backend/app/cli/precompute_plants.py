@@ -0,0 +1,102 @@
+"""Precompute plant-level analyses for every plant in the catalog
+
+Runs the compound pipeline for each catalog plant's prioritized compounds
+and stores the reports and aggregated pathways, so /analyze_plant can
+answer for known plants right after identification. Plants whose stored
+aggregate is already current (same app and catalog version, within the
+fresh window) are skipped, so rerunning after a version bump only
+recomputes what changed.
+
+Usage:
+    python -m app.cli.precompute_plants
+    python -m app.cli.precompute_plants --plants "Hypericum perforatum" "Mentha piperita"
+    python -m app.cli.precompute_plants --force --workers 2
+"""
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
+
+from app.data.plant_compounds import PLANT_COMPOUNDS_DB, PlantCompoundInfo, get_plant_compounds
+from app.services.plant_aggregates import plant_aggregate_store
+from app.services.plant_identification import plant_identification_service
+
+logger = logging.getLogger(__name__)
+
+
+def pending_plants(plants: List[PlantCompoundInfo], enable_predictions: bool, force: bool) -> List[PlantCompoundInfo]:
+    """Plants without a current stored aggregate"""
+    if force:
+        return plants
+    pending = []
+    for plant in plants:
+        aggregate = plant_aggregate_store.load(plant.scientific_name, enable_predictions)
+        if aggregate is None or not aggregate.is_current:
+            pending.append(plant)
+    return pending
+
+
+def precompute(plants: List[PlantCompoundInfo], workers: int, enable_predictions: bool) -> dict:
+    """
+    Precompute and store aggregates for plants.
+
+    Returns:
+        Counts of stored, incomplete and failed plants
+    """
+    stats = {"stored": 0, "incomplete": 0, "failed": 0}
+    start = time.time()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="precompute") as executor:
+        futures = {
+            executor.submit(plant_identification_service.precompute_plant, plant, enable_predictions): plant
+            for plant in plants
+        }
+        for completed, future in enumerate(as_completed(futures), start=1):
+            plant = futures[future]
+            try:
+                stored = future.result()
+                stats["stored" if stored else "incomplete"] += 1
+                outcome = "stored" if stored else "incomplete (not stored; retried next run)"
+            except Exception as e:
+                stats["failed"] += 1
+                outcome = f"failed: {e}"
+
+            elapsed = time.time() - start
+            logger.info(f"[{completed}/{len(plants)}] {plant.scientific_name}: {outcome} (elapsed {elapsed:.0f}s)")
+
+    return stats
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute plant-level analyses for catalog plants")
+    parser.add_argument("--plants", nargs="*", default=[], help="Scientific names (default: whole catalog)")
+    parser.add_argument("--workers", type=int, default=1, help="Plants analyzed concurrently")
+    parser.add_argument("--enable-predictions", action="store_true", help="Precompute prediction-enabled analyses")
+    parser.add_argument("--force", action="store_true", help="Recompute even current aggregates")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if args.plants:
+        plants = [get_plant_compounds(name) for name in args.plants]
+        unknown = [name for name, plant in zip(args.plants, plants) if plant is None]
+        if unknown:
+            parser.error(f"Not in the plant catalog: {', '.join(unknown)}")
+    else:
+        plants = list(PLANT_COMPOUNDS_DB.values())
+
+    pending = pending_plants(plants, args.enable_predictions, args.force)
+    logger.info(f"Precomputing {len(pending)} of {len(plants)} plants with {args.workers} workers")
+    stats = precompute(pending, args.workers, args.enable_predictions)
+    logger.info(
+        f"Done: {stats['stored']} stored, {stats['incomplete']} incomplete, {stats['failed']} failed, "
+        f"{len(plants) - len(pending)} already current"
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
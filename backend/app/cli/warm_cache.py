@@ -0,0 +1,205 @@
+"""Pre-populate the caches for plant compounds and popular ingredients
+
+Runs the full analysis pipeline for every prioritized compound in
+PLANT_COMPOUNDS_DB (plus any user-supplied ingredient names), which fills
+the compound, targets, target_info, pathway_participants, Open Targets
+and report caches. All work shares one AnalysisService, so the configured
+per-client rate limits apply across workers.
+
+Progress is appended to a state file after each ingredient, with the time
+it was warmed; rerunning the command skips ingredients warmed within
+report_cache_stale_ttl and re-warms older ones, whose reports have expired.
+
+Usage:
+    python -m app.cli.warm_cache
+    python -m app.cli.warm_cache --ingredients top_ingredients.txt --workers 4
+    python -m app.cli.warm_cache --no-plants --ingredients caffeine curcumin
+"""
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.clients.pubchem import compound_cache_key
+from app.config import settings
+from app.data.plant_compounds import PLANT_COMPOUNDS_DB, get_prioritized_compounds
+from app.models.schemas import IngredientInput
+from app.services.analysis import AnalysisService
+from app.services.cache import cache_service
+
+logger = logging.getLogger(__name__)
+
+
+def plant_compound_names() -> List[str]:
+    """Prioritized compound names across all plants, most shared first"""
+    counts = {}
+    for plant_info in PLANT_COMPOUNDS_DB.values():
+        for compound in get_prioritized_compounds(plant_info):
+            counts[compound.name] = counts.get(compound.name, 0) + 1
+    return sorted(counts, key=lambda name: -counts[name])
+
+
+def read_ingredient_args(values: Iterable[str]) -> List[str]:
+    """Expand ingredient arguments: names, or files with one name per line"""
+    names = []
+    for value in values:
+        path = Path(value)
+        if path.is_file():
+            names.extend(
+                line.strip() for line in path.read_text().splitlines()
+                if line.strip() and not line.startswith("#")
+            )
+        else:
+            names.append(value)
+    return names
+
+
+def dedupe(names: Iterable[str]) -> List[str]:
+    """Drop case/whitespace duplicates, keeping first-seen order"""
+    seen: Set[str] = set()
+    unique = []
+    for name in names:
+        key = " ".join(name.split()).casefold()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(name.strip())
+    return unique
+
+
+class WarmState:
+    """Append-only record of when each ingredient was warmed, for resuming"""
+
+    def __init__(self, path: Path, max_age: Optional[float] = None):
+        self.path = path
+        self.max_age = settings.report_cache_stale_ttl if max_age is None else max_age
+        self._lock = Lock()
+        self.done: Dict[str, float] = {}
+        if path.exists():
+            for line in path.read_text().splitlines():
+                key, _, warmed_at = line.strip().partition("\t")
+                try:
+                    # Later lines win; entries without a timestamp are re-warmed
+                    self.done[key] = float(warmed_at)
+                except ValueError:
+                    continue
+
+    def is_done(self, name: str) -> bool:
+        warmed_at = self.done.get(" ".join(name.split()).casefold())
+        return warmed_at is not None and time.time() - warmed_at < self.max_age
+
+    def mark_done(self, name: str) -> None:
+        key = " ".join(name.split()).casefold()
+        warmed_at = time.time()
+        with self._lock:
+            self.done[key] = warmed_at
+            with open(self.path, "a") as f:
+                f.write(f"{key}\t{warmed_at:.0f}\n")
+
+    def reset(self) -> None:
+        self.done = {}
+        self.path.unlink(missing_ok=True)
+
+
+def warm(names: List[str], state: WarmState, workers: int, enable_predictions: bool) -> dict:
+    """
+    Analyze each pending ingredient, recording completions in state.
+
+    Returns:
+        Counts of warmed, unresolved, failed and skipped ingredients
+    """
+    pending = [name for name in names if not state.is_done(name)]
+    stats = {"warmed": 0, "unresolved": 0, "failed": 0, "skipped": len(names) - len(pending)}
+    if not pending:
+        return stats
+
+    service = AnalysisService()
+    start = time.time()
+    service.prefetch_compounds(pending)
+
+    def analyze(name: str):
+        return service.analyze_ingredient(
+            IngredientInput(ingredient_name=name, enable_predictions=enable_predictions)
+        )
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warm") as executor:
+        futures = {executor.submit(analyze, name): name for name in pending}
+        for completed, future in enumerate(as_completed(futures), start=1):
+            name = futures[future]
+            try:
+                report = future.result()
+                if "error" not in report.final_summary:
+                    stats["warmed"] += 1
+                    state.mark_done(name)
+                    outcome = f"{len(report.known_targets)} targets, {len(report.pathways)} pathways"
+                elif cache_service.is_negative("compound", compound_cache_key(name)):
+                    # A confirmed miss is negative-cached, so it counts as warm too
+                    stats["unresolved"] += 1
+                    state.mark_done(name)
+                    outcome = "not found"
+                else:
+                    # Transient failure (nothing cached): retried on the next run
+                    stats["failed"] += 1
+                    outcome = f"failed: {report.final_summary['error']}"
+            except Exception as e:
+                # Not marked done: retried on the next run
+                stats["failed"] += 1
+                outcome = f"failed: {e}"
+
+            elapsed = time.time() - start
+            eta = elapsed / completed * (len(pending) - completed)
+            logger.info(
+                f"[{completed}/{len(pending)}] {name}: {outcome} "
+                f"(elapsed {elapsed:.0f}s, ETA {eta:.0f}s)"
+            )
+
+    return stats
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-populate BioPath caches")
+    parser.add_argument(
+        "--ingredients", nargs="*", default=[],
+        help="Ingredient names, or files with one name per line"
+    )
+    parser.add_argument("--no-plants", action="store_true", help="Skip PLANT_COMPOUNDS_DB compounds")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent analyses (rate limits still apply)")
+    parser.add_argument("--enable-predictions", action="store_true", help="Warm prediction-enabled reports")
+    parser.add_argument(
+        "--state-file", type=Path,
+        default=Path(settings.disk_cache_dir) / "warm_cache_state.txt",
+        help="Progress file used to resume interrupted runs"
+    )
+    parser.add_argument("--restart", action="store_true", help="Ignore previous progress")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    names = read_ingredient_args(args.ingredients)
+    if not args.no_plants:
+        names.extend(plant_compound_names())
+    names = dedupe(names)
+
+    if not names:
+        parser.error("Nothing to warm: pass --ingredients or drop --no-plants")
+
+    args.state_file.parent.mkdir(parents=True, exist_ok=True)
+    state = WarmState(args.state_file)
+    if args.restart:
+        state.reset()
+
+    logger.info(f"Warming caches for {len(names)} ingredients with {args.workers} workers")
+    stats = warm(names, state, args.workers, args.enable_predictions)
+    logger.info(
+        f"Done: {stats['warmed']} warmed, {stats['unresolved']} unresolved, "
+        f"{stats['failed']} failed, {stats['skipped']} already warm"
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
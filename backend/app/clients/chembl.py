@@ -1,8 +1,9 @@
 """ChEMBL API client for target and bioactivity data"""
 
 import httpx
-from typing import List, Optional, Dict, Any
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple
+from urllib.parse import urljoin
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 import logging
 
 from app.config import settings
@@ -10,6 +11,10 @@ from app.models.schemas import TargetEvidence, AssayReference, ProvenanceRecord,
 from app.utils import RateLimiter
 from app.utils.concurrent import fetch_concurrent
 from app.services.cache import cache_service
+from app.utils.deadline import clamp_timeout, expired as deadline_expired, stop_at_deadline, wait_within_deadline
+from app.utils.hedging import hedged_call
+from app.utils.retry import is_retryable
+from app.utils.circuit_breaker import get_breaker
 
 # Disease/indication to biological pathway mapping
 # Maps common disease categories to Reactome pathway IDs and biological systems
@@ -176,6 +181,21 @@ INDICATION_PATHWAY_MAP = {
     },
 }
 
+# Activity fields actually read; requested with only= so pages skip bulky unused columns
+ACTIVITY_FIELDS = (
+    "target_chembl_id",
+    "pchembl_value",
+    "standard_type",
+    "standard_value",
+    "standard_units",
+    "assay_chembl_id",
+    "assay_description",
+    "document_chembl_id",
+)
+
+# Target fields needed for names and UniProt accessions
+TARGET_FIELDS = ("target_chembl_id", "pref_name", "target_type", "organism", "target_components")
+
 logger = logging.getLogger(__name__)
 
 
@@ -186,10 +206,12 @@ class ChEMBLClient:
         self.base_url = settings.chembl_base_url
         self.rate_limiter = RateLimiter(settings.chembl_rate_limit)
         self.timeout = 60.0
+        self.breaker = get_breaker("chembl")
 
     @retry(
-        stop=stop_after_attempt(settings.max_retries),
-        wait=wait_exponential(multiplier=settings.retry_backoff_factor)
+        stop=stop_after_attempt(settings.max_retries) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=settings.retry_backoff_factor)),
+        retry=retry_if_exception(is_retryable)
     )
     def _get(self, url: str) -> Dict[str, Any]:
         """Make GET request with retry logic"""
@@ -197,7 +219,7 @@ class ChEMBLClient:
         logger.info(f"ChEMBL GET: {url}")
 
         headers = {"Accept": "application/json"}
-        with httpx.Client(timeout=self.timeout) as client:
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
             response = client.get(url, headers=headers)
             response.raise_for_status()
             return response.json()
@@ -212,6 +234,12 @@ class ChEMBLClient:
         Returns:
             ChEMBL molecule ID (e.g., "CHEMBL521") or None
         """
+        cached = cache_service.get("chembl_molecule", inchikey)
+        if cached:
+            return cached
+        if cache_service.is_negative("chembl_molecule", inchikey):
+            return None
+
         try:
             url = f"{self.base_url}/molecule.json?molecule_structures__standard_inchi_key={inchikey}"
             data = self._get(url)
@@ -220,9 +248,11 @@ class ChEMBLClient:
             if molecules:
                 chembl_id = molecules[0]["molecule_chembl_id"]
                 logger.info(f"Found ChEMBL ID {chembl_id} for InChIKey {inchikey}")
+                cache_service.set("chembl_molecule", inchikey, chembl_id)
                 return chembl_id
 
             logger.warning(f"No ChEMBL molecule found for InChIKey {inchikey}")
+            cache_service.set_negative("chembl_molecule", inchikey, "No molecule for InChIKey")
             return None
 
         except Exception as e:
@@ -239,6 +269,12 @@ class ChEMBLClient:
         Returns:
             ChEMBL molecule ID or None
         """
+        cached = cache_service.get("chembl_molecule_smiles", smiles)
+        if cached:
+            return cached
+        if cache_service.is_negative("chembl_molecule_smiles", smiles):
+            return None
+
         try:
             # Use similarity search with threshold 100 (exact match)
             url = f"{self.base_url}/similarity/{smiles}/100.json"
@@ -248,14 +284,63 @@ class ChEMBLClient:
             if molecules:
                 chembl_id = molecules[0]["molecule_chembl_id"]
                 logger.info(f"Found ChEMBL ID {chembl_id} via SMILES similarity")
+                cache_service.set("chembl_molecule_smiles", smiles, chembl_id)
                 return chembl_id
 
+            cache_service.set_negative("chembl_molecule_smiles", smiles, "No molecule for SMILES")
             return None
 
         except Exception as e:
             logger.error(f"Error finding ChEMBL compound by SMILES: {e}")
             return None
 
+    def iter_activities(
+        self,
+        chembl_id: str,
+        fields: Sequence[str] = ACTIVITY_FIELDS
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream human potency activities (IC50/Ki/Kd/EC50) for a molecule.
+
+        Pages are fetched lazily by following ``page_meta.next``, so callers
+        can stop early by breaking out of the loop. Pagination also stops at
+        ``chembl_max_activity_pages`` or when the request deadline expires.
+
+        Args:
+            chembl_id: ChEMBL molecule ID
+            fields: Activity fields to request (server-side projection)
+
+        Yields:
+            Activity dicts containing only the requested fields
+        """
+        url = (
+            f"{self.base_url}/activity.json?"
+            f"molecule_chembl_id={chembl_id}&"
+            "target_organism=Homo+sapiens&"
+            "standard_type__in=IC50,Ki,Kd,EC50&"
+            "pchembl_value__isnull=False&"
+            f"only={','.join(fields)}&"
+            f"limit={settings.chembl_activity_page_size}"
+        )
+        pages = 0
+
+        while url:
+            data = self._get(url)
+            pages += 1
+            yield from data.get("activities", [])
+
+            next_page = (data.get("page_meta") or {}).get("next")
+            if not next_page:
+                return
+            if pages >= settings.chembl_max_activity_pages:
+                logger.warning(f"Stopping {chembl_id} activities at {pages} pages (chembl_max_activity_pages)")
+                return
+            if deadline_expired():
+                logger.warning(f"Request deadline reached, stopping {chembl_id} activities after {pages} pages")
+                return
+            # next is a server-relative path that keeps the filters and only=
+            url = urljoin(self.base_url, next_page)
+
     def get_target_activities(
         self,
         inchikey: str,
@@ -285,28 +370,21 @@ class ChEMBLClient:
                 chembl_id = self.find_compound_by_smiles(smiles)
 
             if not chembl_id:
+                # Only a confirmed miss counts as not_found; lookup errors stay errors
+                confirmed_miss = cache_service.is_negative("chembl_molecule", inchikey) and (
+                    not smiles or cache_service.is_negative("chembl_molecule_smiles", smiles)
+                )
                 provenance.status = "error"
+                provenance.not_found = confirmed_miss
                 provenance.error_message = "Compound not found in ChEMBL"
                 provenance.duration_ms = (time.time() - start_time) * 1000
                 return [], provenance
 
-            # Get bioactivities
-            # Filter for human targets with IC50/Ki/Kd data
-            url = (
-                f"{self.base_url}/activity.json?"
-                f"molecule_chembl_id={chembl_id}&"
-                "target_organism=Homo+sapiens&"
-                "standard_type__in=IC50,Ki,Kd,EC50&"
-                "pchembl_value__isnull=False&"
-                "limit=100"
-            )
-            data = self._get(url)
-            activities = data.get("activities", [])
-
-            # Group by target and get best (lowest) potency for each
+            # Stream bioactivities and group by target as pages arrive,
+            # keeping the best (lowest) potency for each
             target_map: Dict[str, Dict[str, Any]] = {}
 
-            for activity in activities:
+            for activity in self.iter_activities(chembl_id):
                 target_chembl_id = activity.get("target_chembl_id")
                 if not target_chembl_id:
                     continue
@@ -396,49 +474,73 @@ class ChEMBLClient:
             logger.error(f"Error getting ChEMBL activities: {e}")
             return [], provenance
 
-    def _get_target_info(self, target_chembl_id: str) -> Optional[Dict[str, Any]]:
-        """Get target details from ChEMBL"""
-        try:
-            url = f"{self.base_url}/target/{target_chembl_id}.json"
-            data = self._get(url)
+    def _get_target_info_chunk(self, chunk: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get target details for a comma-separated chunk of IDs in one request.
 
-            # Extract UniProt ID - try multiple approaches
-            uniprot_id = None
-            components = data.get("target_components", [])
+        Uses a ``target_chembl_id__in`` filter and follows pagination.
 
-            for component in components:
-                # Approach 1: Get directly from accession field (most reliable)
-                accession = component.get("accession")
-                if accession and self._is_valid_uniprot_id(accession):
-                    uniprot_id = accession
-                    logger.info(f"Found UniProt ID {uniprot_id} from accession for {target_chembl_id}")
-                    break
+        Args:
+            chunk: Comma-separated ChEMBL target IDs
 
-                # Approach 2: Try target_component_xrefs
-                xrefs = component.get("target_component_xrefs", [])
-                for xref in xrefs:
-                    if xref.get("xref_src_db") == "UniProt":
-                        uniprot_id = xref.get("xref_id")
-                        logger.info(f"Found UniProt ID {uniprot_id} from xrefs for {target_chembl_id}")
-                        break
+        Returns:
+            Dict mapping target_chembl_id -> target_info dict
+        """
+        results = {}
+        url = (
+            f"{self.base_url}/target.json?"
+            f"target_chembl_id__in={chunk}&"
+            f"only={','.join(TARGET_FIELDS)}&"
+            f"limit={settings.chembl_target_batch_size}"
+        )
+
+        while url:
+            data = hedged_call("chembl.target_info_batch", lambda: self._get(url), self.rate_limiter)
+            for target in data.get("targets", []):
+                target_chembl_id = target.get("target_chembl_id")
+                if target_chembl_id:
+                    results[target_chembl_id] = self._parse_target_info(target, target_chembl_id)
+
+            next_page = (data.get("page_meta") or {}).get("next")
+            url = urljoin(self.base_url, next_page) if next_page else None
 
-                if uniprot_id:
+        return results
+
+    def _parse_target_info(self, data: Dict[str, Any], target_chembl_id: str) -> Dict[str, Any]:
+        """Build a target_info dict (name, type, organism, UniProt ID) from a ChEMBL target record"""
+        # Extract UniProt ID - try multiple approaches
+        uniprot_id = None
+        components = data.get("target_components", [])
+
+        for component in components:
+            # Approach 1: Get directly from accession field (most reliable)
+            accession = component.get("accession")
+            if accession and self._is_valid_uniprot_id(accession):
+                uniprot_id = accession
+                logger.debug(f"Found UniProt ID {uniprot_id} from accession for {target_chembl_id}")
+                break
+
+            # Approach 2: Try target_component_xrefs
+            xrefs = component.get("target_component_xrefs", [])
+            for xref in xrefs:
+                if xref.get("xref_src_db") == "UniProt":
+                    uniprot_id = xref.get("xref_id")
+                    logger.debug(f"Found UniProt ID {uniprot_id} from xrefs for {target_chembl_id}")
                     break
 
-            if not uniprot_id:
-                logger.warning(f"No UniProt ID found for target {target_chembl_id}")
+            if uniprot_id:
+                break
 
-            return {
-                "target_name": data.get("pref_name", "Unknown"),
-                "target_type": data.get("target_type"),
-                "organism": data.get("organism"),
-                "uniprot_id": uniprot_id,
-                "target_chembl_id": target_chembl_id,
-            }
+        if not uniprot_id:
+            logger.warning(f"No UniProt ID found for target {target_chembl_id}")
 
-        except Exception as e:
-            logger.error(f"Error getting target info for {target_chembl_id}: {e}")
-            return None
+        return {
+            "target_name": data.get("pref_name", "Unknown"),
+            "target_type": data.get("target_type"),
+            "organism": data.get("organism"),
+            "uniprot_id": uniprot_id,
+            "target_chembl_id": target_chembl_id,
+        }
 
     def _is_valid_uniprot_id(self, identifier: str) -> bool:
         """Check if an identifier looks like a valid UniProt ID"""
@@ -455,7 +557,8 @@ class ChEMBLClient:
         """
         Get target details for multiple targets with caching.
 
-        Uses cache first, then fetches missing targets.
+        Uses cache first, then fetches missing targets in chunks of
+        ``chembl_target_batch_size`` IDs per request.
 
         Args:
             target_chembl_ids: List of ChEMBL target IDs
@@ -481,8 +584,12 @@ class ChEMBLClient:
 
         logger.info(f"Target info cache hit: {len(cached_targets)}, fetching: {len(missing_ids)}")
 
-        # Step 3: Fetch missing targets concurrently
-        newly_fetched = fetch_concurrent(self._get_target_info, missing_ids, max_workers=5)
+        # Step 3: Fetch missing targets in __in chunks (one request per chunk)
+        size = settings.chembl_target_batch_size
+        chunks = [",".join(missing_ids[i:i + size]) for i in range(0, len(missing_ids), size)]
+        newly_fetched: Dict[str, Dict[str, Any]] = {}
+        for chunk_results in fetch_concurrent(self._get_target_info_chunk, chunks, max_workers=3).values():
+            newly_fetched.update(chunk_results)
         results.update(newly_fetched)
 
         # Step 4: Cache newly fetched targets
@@ -497,6 +604,14 @@ class ChEMBLClient:
         inchikey: str,
         smiles: Optional[str] = None
     ) -> List[Dict[str, Any]]:
+        """Potency summary for dosage context (see fetch_potency_summary)"""
+        return self.fetch_potency_summary(inchikey, smiles)[0]
+
+    def fetch_potency_summary(
+        self,
+        inchikey: str,
+        smiles: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """
         Get potency summary (IC50/EC50/Ki values) for dosage context.
 
@@ -505,13 +620,15 @@ class ChEMBLClient:
             smiles: Optional SMILES for fallback search
 
         Returns:
-            List of dicts with target_name, pchembl_value, standard_type,
-            standard_value, standard_units, effective_concentration_nm, potency_category
+            Tuple of (list of dicts with target_name, pchembl_value,
+            standard_type, standard_value, standard_units,
+            effective_concentration_nm, potency_category; False if a lookup
+            failed, so an empty list is not a definitive answer)
         """
         cached = cache_service.get("potency_summary", inchikey)
         if cached:
             logger.debug(f"Cache hit for potency summary: {inchikey}")
-            return cached
+            return cached, True
 
         try:
             chembl_id = self.find_compound_by_inchikey(inchikey)
@@ -519,23 +636,17 @@ class ChEMBLClient:
                 chembl_id = self.find_compound_by_smiles(smiles)
 
             if not chembl_id:
-                return []
-
-            url = (
-                f"{self.base_url}/activity.json?"
-                f"molecule_chembl_id={chembl_id}&"
-                "target_organism=Homo+sapiens&"
-                "standard_type__in=IC50,Ki,Kd,EC50&"
-                "pchembl_value__isnull=False&"
-                "limit=100"
-            )
-            data = self._get(url)
-            activities = data.get("activities", [])
+                # Only negative-cached lookups are confirmed misses; others errored
+                confirmed = cache_service.is_negative("chembl_molecule", inchikey) and (
+                    not smiles or cache_service.is_negative("chembl_molecule_smiles", smiles)
+                )
+                return [], confirmed
 
-            # Group by target, keep best pchembl per target
+            # Group by target as pages arrive, keep best pchembl per target
             target_map: Dict[str, Dict[str, Any]] = {}
+            fields = ("target_chembl_id", "pchembl_value", "standard_type", "standard_value", "standard_units")
 
-            for activity in activities:
+            for activity in self.iter_activities(chembl_id, fields):
                 target_chembl_id = activity.get("target_chembl_id")
                 pchembl_raw = activity.get("pchembl_value")
                 if not target_chembl_id or pchembl_raw is None:
@@ -604,11 +715,11 @@ class ChEMBLClient:
             results.sort(key=lambda x: x["pchembl_value"], reverse=True)
             cache_service.set("potency_summary", inchikey, results)
             logger.info(f"Potency summary: {len(results)} targets for {chembl_id}")
-            return results
+            return results, True
 
         except Exception as e:
             logger.error(f"Error getting potency summary: {e}")
-            return []
+            return [], False
 
     def get_drug_indications(self, chembl_id: str) -> List[Dict[str, Any]]:
         """
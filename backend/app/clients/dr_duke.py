@@ -4,16 +4,36 @@ USDA database containing plant-chemical-activity relationships.
 Source: https://phytochem.nal.usda.gov/
 """
 
+import asyncio
 import httpx
 import re
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from app.config import settings
+from app.data.dr_duke_store import dr_duke_store
 from app.services.cache import cache_service
+from app.utils.circuit_breaker import get_breaker
+from app.utils.concurrent import run_sync
 
 logger = logging.getLogger(__name__)
 
+SEARCH_PATH = "/phytochem/search/list"
+
+# Extraction patterns, compiled once and reused for every page
+PLANT_LINK = re.compile(r'<a[^>]*href="[^"]*plant/([^"]+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
+CHEMICAL_LINK = re.compile(r'<a[^>]*href="[^"]*chemical/([^"]+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
+ACTIVITY_LINK = re.compile(r'<a[^>]*href="[^"]*activity/([^"]+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
+CONCENTRATION_PATTERNS = (
+    re.compile(r'([\d,.]+)\s*(?:to|-)\s*([\d,.]+)\s*(ppm|mg/kg|%)', re.IGNORECASE),
+    re.compile(r'([\d,.]+)\s*(ppm|mg/kg|%)', re.IGNORECASE),
+)
+PLANT_PART = re.compile(
+    r'(?:in\s+|from\s+)(leaf|root|seed|bark|flower|fruit|stem|rhizome|whole plant|aerial part|bulb|peel)',
+    re.IGNORECASE
+)
+
 
 @dataclass
 class DrDukeChemical:
@@ -55,12 +75,23 @@ class DrDukeClient:
 
     This USDA database contains comprehensive plant-chemical relationships
     with biological activity data. Free public access, no API key required.
+
+    Pages are fetched with an async client; independent searches (a plant
+    and its chemicals, activities for each chemical) run concurrently, up to
+    ``scraper_max_concurrency`` at a time. The ``*_async`` methods are the
+    implementation; the plain methods are sync wrappers.
+
+    When the database has been imported locally (``app.cli.import_dr_duke``)
+    lookups are answered from the SQLite store, and the website is only
+    scraped for names the store does not know.
     """
 
     def __init__(self):
         self.base_url = "https://phytochem.nal.usda.gov"
         self.timeout = 30.0
+        self.breaker = get_breaker("dr_duke")
         self.cache_ttl = 86400 * 7  # Cache for 7 days (static data)
+        self.store = dr_duke_store
 
     def _get_cached(self, cache_key: str) -> Optional[Any]:
         """Get cached result"""
@@ -70,69 +101,98 @@ class DrDukeClient:
         """Cache a result"""
         cache_service.set("dr_duke", cache_key, value, ttl=self.cache_ttl)
 
+    def _client(self) -> httpx.AsyncClient:
+        """Async client whose connection pool bounds parallel page fetches"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=settings.scraper_max_concurrency)
+        )
+
+    async def _search(self, client: httpx.AsyncClient, query: str, result_type: str) -> str:
+        """Fetch one search results page through the circuit breaker"""
+        with self.breaker.guard():
+            response = await client.get(
+                SEARCH_PATH,
+                params={"search_api_fulltext": query, "type": result_type}
+            )
+            response.raise_for_status()
+        return response.text
+
     def search_plant(self, plant_name: str) -> Optional[DrDukePlantResult]:
+        """Sync wrapper for search_plant_async"""
+        return run_sync(self.search_plant_async(plant_name))
+
+    async def search_plant_async(
+        self,
+        plant_name: str,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[DrDukePlantResult]:
         """
         Search for a plant by scientific or common name.
 
         Args:
             plant_name: Plant name to search for
+            client: Async client to reuse (a new one is opened otherwise)
 
         Returns:
             DrDukePlantResult with chemicals and activities, or None if not found
         """
+        local = self.store.search_plant(plant_name)
+        if local:
+            return DrDukePlantResult(
+                scientific_name=local["scientific_name"],
+                common_names=local["common_names"],
+                chemicals=[DrDukeChemical(**c) for c in local["chemicals"]],
+                activities=[]
+            )
+
         cache_key = f"plant_{plant_name.lower().replace(' ', '_')}"
         cached = self._get_cached(cache_key)
         if cached:
             logger.info(f"Dr. Duke's cache hit for plant: {plant_name}")
             return DrDukePlantResult(**cached) if isinstance(cached, dict) else cached
 
+        if client is None:
+            async with self._client() as client:
+                return await self.search_plant_async(plant_name, client)
+
         try:
-            # Search for the plant
-            search_url = f"{self.base_url}/phytochem/search/list"
-
-            with httpx.Client(timeout=self.timeout) as client:
-                # First, search for the plant
-                response = client.get(
-                    search_url,
-                    params={
-                        "search_api_fulltext": plant_name,
-                        "type": "plant"
-                    }
-                )
-                response.raise_for_status()
-                html = response.text
-
-                # Parse plant results from HTML
-                result = self._parse_plant_search(html, plant_name)
-
-                if result:
-                    # Get detailed chemicals for this plant
-                    chemicals = self._get_plant_chemicals(client, plant_name)
-                    result.chemicals = chemicals
-
-                    # Cache the result
-                    self._set_cached(cache_key, {
-                        "scientific_name": result.scientific_name,
-                        "common_names": result.common_names,
-                        "chemicals": [
-                            {
-                                "name": c.name,
-                                "cas_number": c.cas_number,
-                                "activities": c.activities,
-                                "plant_parts": c.plant_parts,
-                                "concentration_low": c.concentration_low,
-                                "concentration_high": c.concentration_high
-                            }
-                            for c in result.chemicals
-                        ],
-                        "activities": result.activities
-                    })
-
-                    logger.info(f"Dr. Duke's found {len(chemicals)} chemicals for {plant_name}")
-                    return result
-
-                logger.info(f"Dr. Duke's: plant not found - {plant_name}")
-                return None
+            # The plant and its chemicals are separate searches; run them together
+            html, chemicals = await asyncio.gather(
+                self._search(client, plant_name, "plant"),
+                self._get_plant_chemicals(client, plant_name)
+            )
+
+            # Parse plant results from HTML
+            result = self._parse_plant_search(html, plant_name)
+
+            if result:
+                result.chemicals = chemicals
+
+                # Cache the result
+                self._set_cached(cache_key, {
+                    "scientific_name": result.scientific_name,
+                    "common_names": result.common_names,
+                    "chemicals": [
+                        {
+                            "name": c.name,
+                            "cas_number": c.cas_number,
+                            "activities": c.activities,
+                            "plant_parts": c.plant_parts,
+                            "concentration_low": c.concentration_low,
+                            "concentration_high": c.concentration_high
+                        }
+                        for c in result.chemicals
+                    ],
+                    "activities": result.activities
+                })
+
+                logger.info(f"Dr. Duke's found {len(chemicals)} chemicals for {plant_name}")
+                return result
+
+            logger.info(f"Dr. Duke's: plant not found - {plant_name}")
+            return None
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Dr. Duke's API error: {e.response.status_code}")
@@ -143,107 +203,81 @@ class DrDukeClient:
 
     def _parse_plant_search(self, html: str, search_term: str) -> Optional[DrDukePlantResult]:
         """Parse plant search results from HTML"""
-        # Look for plant entries in the search results
-        # Pattern: link to plant page with scientific name
-        plant_pattern = r'<a[^>]*href="[^"]*plant/([^"]+)"[^>]*>([^<]+)</a>'
-        matches = re.findall(plant_pattern, html, re.IGNORECASE)
+        matches = PLANT_LINK.findall(html)
 
         if not matches:
             return None
 
-        # Find best match for search term
+        # Best match for the search term, else the first result
         search_lower = search_term.lower()
-        for plant_id, name in matches:
-            if search_lower in name.lower():
-                return DrDukePlantResult(
-                    scientific_name=name.strip(),
-                    common_names=[],
-                    chemicals=[],
-                    activities=[]
-                )
-
-        # Return first match if no exact match
-        if matches:
-            return DrDukePlantResult(
-                scientific_name=matches[0][1].strip(),
-                common_names=[],
-                chemicals=[],
-                activities=[]
-            )
-
-        return None
-
-    def _get_plant_chemicals(self, client: httpx.Client, plant_name: str) -> List[DrDukeChemical]:
-        """Get chemicals for a specific plant"""
+        name = next((n for _, n in matches if search_lower in n.lower()), matches[0][1])
+        return DrDukePlantResult(
+            scientific_name=name.strip(),
+            common_names=[],
+            chemicals=[],
+            activities=[]
+        )
+
+    def _parse_chemical_links(self, html: str, limit: int, activities: List[str]) -> List[DrDukeChemical]:
+        """Distinct chemicals linked from a search results page"""
         chemicals = []
+        seen_names = set()
+        for chem_id, name in CHEMICAL_LINK.findall(html)[:limit]:
+            name = name.strip()
+            if name.lower() not in seen_names:
+                seen_names.add(name.lower())
+                chemicals.append(DrDukeChemical(name=name, activities=list(activities)))
+        return chemicals
 
+    async def _get_plant_chemicals(self, client: httpx.AsyncClient, plant_name: str) -> List[DrDukeChemical]:
+        """Get chemicals for a specific plant"""
         try:
-            # Query for chemicals in this plant
-            response = client.get(
-                f"{self.base_url}/phytochem/search/list",
-                params={
-                    "search_api_fulltext": plant_name,
-                    "type": "chemical"
-                }
-            )
-            response.raise_for_status()
-            html = response.text
-
-            # Parse chemical names from results
-            chemical_pattern = r'<a[^>]*href="[^"]*chemical/([^"]+)"[^>]*>([^<]+)</a>'
-            matches = re.findall(chemical_pattern, html, re.IGNORECASE)
-
-            seen_names = set()
-            for chem_id, name in matches[:50]:  # Limit to 50 chemicals
-                name = name.strip()
-                if name.lower() not in seen_names:
-                    seen_names.add(name.lower())
-                    chemicals.append(DrDukeChemical(
-                        name=name,
-                        activities=[]
-                    ))
-
+            html = await self._search(client, plant_name, "chemical")
         except Exception as e:
             logger.error(f"Error getting chemicals for {plant_name}: {e}")
+            return []
 
-        return chemicals
+        return self._parse_chemical_links(html, 50, [])  # Limit to 50 chemicals
 
     def get_chemical_activities(self, chemical_name: str) -> List[str]:
+        """Sync wrapper for get_chemical_activities_async"""
+        return run_sync(self.get_chemical_activities_async(chemical_name))
+
+    async def get_chemical_activities_async(
+        self,
+        chemical_name: str,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[str]:
         """
         Get biological activities for a chemical.
 
         Args:
             chemical_name: Name of the chemical
+            client: Async client to reuse (a new one is opened otherwise)
 
         Returns:
             List of biological activity names
         """
+        local = self.store.chemical_activities(chemical_name)
+        if local:
+            return local
+
         cache_key = f"activities_{chemical_name.lower().replace(' ', '_')}"
         cached = self._get_cached(cache_key)
         if cached:
             return cached
 
+        if client is None:
+            async with self._client() as client:
+                return await self.get_chemical_activities_async(chemical_name, client)
+
         activities = []
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{self.base_url}/phytochem/search/list",
-                    params={
-                        "search_api_fulltext": chemical_name,
-                        "type": "activity"
-                    }
-                )
-                response.raise_for_status()
-                html = response.text
-
-                # Parse activity names
-                activity_pattern = r'<a[^>]*href="[^"]*activity/([^"]+)"[^>]*>([^<]+)</a>'
-                matches = re.findall(activity_pattern, html, re.IGNORECASE)
+            html = await self._search(client, chemical_name, "activity")
+            activities = list(dict.fromkeys(name.strip() for _, name in ACTIVITY_LINK.findall(html)))[:30]
 
-                activities = list(set(m[1].strip() for m in matches))[:30]
-
-                self._set_cached(cache_key, activities)
+            self._set_cached(cache_key, activities)
 
         except Exception as e:
             logger.error(f"Error getting activities for {chemical_name}: {e}")
@@ -251,6 +285,18 @@ class DrDukeClient:
         return activities
 
     def get_compound_concentrations(self, chemical_name: str) -> List[Dict[str, Any]]:
+        """Sync wrapper for get_compound_concentrations_async"""
+        return run_sync(self.get_compound_concentrations_async(chemical_name))
+
+    def fetch_compound_concentrations(self, chemical_name: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """Sync wrapper for fetch_compound_concentrations_async"""
+        return run_sync(self.fetch_compound_concentrations_async(chemical_name))
+
+    async def get_compound_concentrations_async(self, chemical_name: str) -> List[Dict[str, Any]]:
+        """Plant tissue concentrations for a chemical (see fetch_compound_concentrations_async)"""
+        return (await self.fetch_compound_concentrations_async(chemical_name))[0]
+
+    async def fetch_compound_concentrations_async(self, chemical_name: str) -> Tuple[List[Dict[str, Any]], bool]:
         """
         Get plant tissue concentrations for a chemical compound.
 
@@ -258,79 +304,77 @@ class DrDukeClient:
             chemical_name: Name of the chemical
 
         Returns:
-            List of dicts with plant_part, concentration_low, concentration_high, unit
+            Tuple of (list of dicts with plant_part, concentration_low,
+            concentration_high, unit; False if the lookup failed)
         """
+        local = self.store.compound_concentrations(chemical_name)
+        if local:
+            return local, True
+
         cache_key = f"concentrations_{chemical_name.lower().replace(' ', '_')}"
         cached = self._get_cached(cache_key)
         if cached:
-            return cached
+            return cached, True
 
         concentrations = []
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{self.base_url}/phytochem/search/list",
-                    params={
-                        "search_api_fulltext": chemical_name,
-                        "type": "chemical"
-                    }
-                )
-                response.raise_for_status()
-                html = response.text
-
-                # Parse concentration data from search results
-                conc_patterns = [
-                    r'([\d,.]+)\s*(?:to|-)\s*([\d,.]+)\s*(ppm|mg/kg|%)',
-                    r'([\d,.]+)\s*(ppm|mg/kg|%)',
-                ]
-
-                part_pattern = r'(?:in\s+|from\s+)(leaf|root|seed|bark|flower|fruit|stem|rhizome|whole plant|aerial part|bulb|peel)'
-
-                for pattern in conc_patterns:
-                    matches = re.finditer(pattern, html, re.IGNORECASE)
-                    for match in matches:
-                        groups = match.groups()
-                        try:
-                            if len(groups) == 3:
-                                low = float(groups[0].replace(",", ""))
-                                high = float(groups[1].replace(",", ""))
-                                unit = groups[2]
-                            else:
-                                low = float(groups[0].replace(",", ""))
-                                high = None
-                                unit = groups[1]
-
-                            # Look for plant part near this match
-                            context_start = max(0, match.start() - 100)
-                            context = html[context_start:match.end() + 50]
-                            part_match = re.search(part_pattern, context, re.IGNORECASE)
-                            plant_part = part_match.group(1).capitalize() if part_match else None
-
-                            entry = {
-                                "plant_part": plant_part,
-                                "concentration_low": low,
-                                "concentration_high": high,
-                                "unit": unit,
-                            }
-                            if entry not in concentrations:
-                                concentrations.append(entry)
-                        except (ValueError, TypeError):
-                            pass
-
-                    if concentrations:
-                        break
-
-            concentrations = concentrations[:10]
+            async with self._client() as client:
+                html = await self._search(client, chemical_name, "chemical")
+
+            concentrations = self._parse_concentrations(html)[:10]
             self._set_cached(cache_key, concentrations)
             logger.info(f"Dr. Duke concentrations: {len(concentrations)} for {chemical_name}")
 
         except Exception as e:
             logger.warning(f"Error getting concentrations for {chemical_name}: {e}")
+            return concentrations, False
+
+        return concentrations, True
+
+    def _parse_concentrations(self, html: str) -> List[Dict[str, Any]]:
+        """Parse concentration ranges (and nearby plant parts) from a results page"""
+        concentrations = []
+
+        # Prefer ranges; fall back to single values
+        for pattern in CONCENTRATION_PATTERNS:
+            for match in pattern.finditer(html):
+                groups = match.groups()
+                try:
+                    if len(groups) == 3:
+                        low = float(groups[0].replace(",", ""))
+                        high = float(groups[1].replace(",", ""))
+                        unit = groups[2]
+                    else:
+                        low = float(groups[0].replace(",", ""))
+                        high = None
+                        unit = groups[1]
+                except (ValueError, TypeError):
+                    continue
+
+                # Look for plant part near this match
+                part_match = PLANT_PART.search(html, max(0, match.start() - 100), match.end() + 50)
+                plant_part = part_match.group(1).capitalize() if part_match else None
+
+                entry = {
+                    "plant_part": plant_part,
+                    "concentration_low": low,
+                    "concentration_high": high,
+                    "unit": unit,
+                }
+                if entry not in concentrations:
+                    concentrations.append(entry)
+
+            if concentrations:
+                break
 
         return concentrations
 
     def search_chemicals_by_activity(self, activity: str) -> List[DrDukeChemical]:
+        """Sync wrapper for search_chemicals_by_activity_async"""
+        return run_sync(self.search_chemicals_by_activity_async(activity))
+
+    async def search_chemicals_by_activity_async(self, activity: str) -> List[DrDukeChemical]:
         """
         Find chemicals that have a specific biological activity.
 
@@ -340,6 +384,10 @@ class DrDukeClient:
         Returns:
             List of chemicals with that activity
         """
+        local = self.store.chemicals_by_activity(activity)
+        if local:
+            return [DrDukeChemical(**c) for c in local]
+
         cache_key = f"by_activity_{activity.lower().replace(' ', '_')}"
         cached = self._get_cached(cache_key)
         if cached:
@@ -348,71 +396,61 @@ class DrDukeClient:
         chemicals = []
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{self.base_url}/phytochem/search/list",
-                    params={
-                        "search_api_fulltext": activity,
-                        "type": "chemical"
-                    }
-                )
-                response.raise_for_status()
-                html = response.text
-
-                # Parse chemical results
-                chemical_pattern = r'<a[^>]*href="[^"]*chemical/([^"]+)"[^>]*>([^<]+)</a>'
-                matches = re.findall(chemical_pattern, html, re.IGNORECASE)
-
-                seen_names = set()
-                for chem_id, name in matches[:30]:
-                    name = name.strip()
-                    if name.lower() not in seen_names:
-                        seen_names.add(name.lower())
-                        chemicals.append(DrDukeChemical(
-                            name=name,
-                            activities=[activity]
-                        ))
-
-                # Cache results
-                self._set_cached(cache_key, [
-                    {"name": c.name, "activities": c.activities, "plant_parts": c.plant_parts}
-                    for c in chemicals
-                ])
+            async with self._client() as client:
+                html = await self._search(client, activity, "chemical")
+
+            chemicals = self._parse_chemical_links(html, 30, [activity])
+
+            # Cache results
+            self._set_cached(cache_key, [
+                {"name": c.name, "activities": c.activities, "plant_parts": c.plant_parts}
+                for c in chemicals
+            ])
 
         except Exception as e:
             logger.error(f"Error searching by activity {activity}: {e}")
 
         return chemicals
 
-    def get_plant_compounds_for_species(
+    def get_plant_compounds_for_species(self, scientific_name: str) -> Dict[str, Any]:
+        """Sync wrapper for get_plant_compounds_for_species_async"""
+        return run_sync(self.get_plant_compounds_for_species_async(scientific_name))
+
+    async def get_plant_compounds_for_species_async(
         self,
         scientific_name: str
     ) -> Dict[str, Any]:
         """
         Get compound data formatted for integration with plant_compounds.py
 
+        Activities for the top compounds are looked up concurrently.
+
         Args:
             scientific_name: Plant scientific name
 
         Returns:
             Dict with compound names and any available metadata
         """
-        result = self.search_plant(scientific_name)
+        async with self._client() as client:
+            result = await self.search_plant_async(scientific_name, client)
 
-        if not result:
-            return {"found": False, "compounds": []}
+            if not result:
+                return {"found": False, "compounds": []}
 
-        compounds = []
-        for chem in result.chemicals[:20]:  # Top 20 compounds
-            # Get activities for this chemical
-            activities = self.get_chemical_activities(chem.name)
+            top_chemicals = result.chemicals[:20]  # Top 20 compounds
+            activities = await asyncio.gather(
+                *(self.get_chemical_activities_async(chem.name, client) for chem in top_chemicals)
+            )
 
-            compounds.append({
+        compounds = [
+            {
                 "name": chem.name,
                 "cas_number": chem.cas_number,
-                "activities": activities,
+                "activities": chem_activities,
                 "source": "dr_duke"
-            })
+            }
+            for chem, chem_activities in zip(top_chemicals, activities)
+        ]
 
         return {
             "found": True,
@@ -8,14 +8,18 @@ free sources to provide similar drug-pathway information:
 """
 
 import httpx
-from typing import List, Optional, Dict, Any
-from tenacity import retry, stop_after_attempt, wait_exponential
+import time
+from typing import List, Optional, Dict, Any, Tuple
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 import logging
 
 from app.config import settings
-from app.models.schemas import PathwayMatch, ConfidenceTier, TargetEvidence, AssayReference
+from app.models.schemas import PathwayMatch, ConfidenceTier, TargetEvidence, AssayReference, ProvenanceRecord
 from app.services.cache import cache_service
 from app.utils import fetch_concurrent
+from app.utils.deadline import clamp_timeout, stop_at_deadline, wait_within_deadline
+from app.utils.retry import is_retryable
+from app.utils.circuit_breaker import get_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -36,16 +40,18 @@ class DrugBankClient:
         self.wikipathways_url = "https://webservice.wikipathways.org"
         self.dgidb_url = "https://dgidb.org/api/v2"
         self.timeout = 60.0
+        self.breaker = get_breaker("open_targets")
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2)
+        stop=stop_after_attempt(3) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=2)),
+        retry=retry_if_exception(is_retryable)
     )
     def _graphql_query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         """Make GraphQL query to Open Targets"""
         logger.info(f"Open Targets GraphQL query")
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
             response = client.post(
                 self.open_targets_url,
                 json={"query": query, "variables": variables},
@@ -55,14 +61,15 @@ class DrugBankClient:
             return response.json()
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2)
+        stop=stop_after_attempt(3) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=2)),
+        retry=retry_if_exception(is_retryable)
     )
     def _get(self, url: str) -> Dict[str, Any]:
         """Make GET request"""
         logger.info(f"GET: {url}")
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
             response = client.get(url, headers={"Accept": "application/json"})
             response.raise_for_status()
             return response.json()
@@ -75,13 +82,24 @@ class DrugBankClient:
             drug_name: Drug/compound name
 
         Returns:
-            Drug info dict with ID and name, or None
+            Drug info dict with ID and name, or None (also on errors)
         """
+        try:
+            return self._search_drug(drug_name)
+        except Exception as e:
+            logger.error(f"Error searching Open Targets for {drug_name}: {e}")
+            return None
+
+    def _search_drug(self, drug_name: str) -> Optional[Dict[str, Any]]:
+        """search_drug_by_name, raising on upstream errors instead of returning None"""
         cache_key = drug_name.lower()
         cached = cache_service.get("open_targets_drug", cache_key)
         if cached:
             logger.debug(f"Cache hit for drug search: {drug_name}")
             return cached
+        if cache_service.is_negative("open_targets_drug", cache_key):
+            logger.debug(f"Cached miss for drug search: {drug_name}")
+            return None
 
         query = """
         query SearchDrug($queryString: String!) {
@@ -96,26 +114,22 @@ class DrugBankClient:
         }
         """
 
-        try:
-            result = self._graphql_query(query, {"queryString": drug_name})
-            hits = result.get("data", {}).get("search", {}).get("hits", [])
-
-            if hits:
-                # Find best match
-                drug_name_lower = drug_name.lower()
-                for hit in hits:
-                    if hit.get("name", "").lower() == drug_name_lower:
-                        cache_service.set("open_targets_drug", cache_key, hit)
-                        return hit
-                # Return first result if no exact match
-                cache_service.set("open_targets_drug", cache_key, hits[0])
-                return hits[0]
+        result = self._graphql_query(query, {"queryString": drug_name})
+        hits = result.get("data", {}).get("search", {}).get("hits", [])
 
-            return None
+        if hits:
+            # Find best match
+            drug_name_lower = drug_name.lower()
+            for hit in hits:
+                if hit.get("name", "").lower() == drug_name_lower:
+                    cache_service.set("open_targets_drug", cache_key, hit)
+                    return hit
+            # Return first result if no exact match
+            cache_service.set("open_targets_drug", cache_key, hits[0])
+            return hits[0]
 
-        except Exception as e:
-            logger.error(f"Error searching Open Targets for {drug_name}: {e}")
-            return None
+        cache_service.set_negative("open_targets_drug", cache_key, "No Open Targets drug hit")
+        return None
 
     def get_drug_mechanisms(self, drug_id: str) -> List[Dict[str, Any]]:
         """
@@ -125,8 +139,16 @@ class DrugBankClient:
             drug_id: Open Targets drug ID (e.g., "CHEMBL521")
 
         Returns:
-            List of mechanism dicts with target and action info
+            List of mechanism dicts with target and action info (empty on errors)
         """
+        try:
+            return self._drug_mechanisms(drug_id)
+        except Exception as e:
+            logger.error(f"Error getting mechanisms for {drug_id}: {e}")
+            return []
+
+    def _drug_mechanisms(self, drug_id: str) -> List[Dict[str, Any]]:
+        """get_drug_mechanisms, raising on upstream errors"""
         cached = cache_service.get("open_targets_mechanisms", drug_id)
         if cached:
             logger.debug(f"Cache hit for drug mechanisms: {drug_id}")
@@ -165,17 +187,12 @@ class DrugBankClient:
         }
         """
 
-        try:
-            result = self._graphql_query(query, {"chemblId": drug_id})
-            drug_data = result.get("data", {}).get("drug", {})
-
-            mechanisms = drug_data.get("mechanismsOfAction", {}).get("rows", [])
-            cache_service.set("open_targets_mechanisms", drug_id, mechanisms)
-            return mechanisms
+        result = self._graphql_query(query, {"chemblId": drug_id})
+        drug_data = result.get("data", {}).get("drug") or {}
 
-        except Exception as e:
-            logger.error(f"Error getting mechanisms for {drug_id}: {e}")
-            return []
+        mechanisms = (drug_data.get("mechanismsOfAction") or {}).get("rows", [])
+        cache_service.set("open_targets_mechanisms", drug_id, mechanisms)
+        return mechanisms
 
     def get_target_pathways(self, target_id: str) -> List[Dict[str, Any]]:
         """
@@ -345,23 +362,46 @@ class DrugBankClient:
             drug_name: Drug/compound name (e.g., "ibuprofen")
 
         Returns:
-            List of TargetEvidence objects with Open Targets data
+            List of TargetEvidence objects with Open Targets data (empty on errors)
+        """
+        return self.fetch_drug_targets(drug_name)[0]
+
+    def fetch_drug_targets(self, drug_name: str) -> Tuple[List[TargetEvidence], ProvenanceRecord]:
+        """
+        Get drug targets from Open Targets, with provenance telling misses from errors.
+
+        Args:
+            drug_name: Drug/compound name (e.g., "ibuprofen")
+
+        Returns:
+            (targets, provenance); provenance is ``not_found`` when Open Targets
+            definitively has no targets and ``error`` when a request failed
         """
+        start_time = time.time()
+
+        def provenance(**kwargs) -> ProvenanceRecord:
+            return ProvenanceRecord(
+                service="Open Targets",
+                endpoint="/graphql (drug targets fallback)",
+                duration_ms=(time.time() - start_time) * 1000,
+                **kwargs
+            )
+
         try:
             # Step 1: Search for the drug
-            drug_info = self.search_drug_by_name(drug_name)
+            drug_info = self._search_drug(drug_name)
             if not drug_info:
                 logger.warning(f"Drug {drug_name} not found in Open Targets")
-                return []
+                return [], provenance(not_found=True)
 
             drug_id = drug_info.get("id", "")
             logger.info(f"Found drug {drug_name} with ID {drug_id}")
 
             # Step 2: Get mechanisms of action (which includes targets)
-            mechanisms = self.get_drug_mechanisms(drug_id)
+            mechanisms = self._drug_mechanisms(drug_id)
             if not mechanisms:
                 logger.warning(f"No mechanisms found for {drug_name}")
-                return []
+                return [], provenance(not_found=True)
 
             # Step 3: Build TargetEvidence objects from mechanisms
             targets = []
@@ -408,11 +448,11 @@ class DrugBankClient:
                     targets.append(evidence)
 
             logger.info(f"Found {len(targets)} targets for {drug_name} via Open Targets")
-            return targets
+            return targets, provenance(not_found=not targets)
 
         except Exception as e:
             logger.error(f"Error getting targets for drug {drug_name}: {e}")
-            return []
+            return [], provenance(status="error", error_message=str(e))
 
     def get_drug_interactions(self, drug_name: str) -> List[Dict[str, Any]]:
         """
@@ -7,16 +7,56 @@ secondary metabolites found in foods.
 Source: https://phytohub.eu/
 """
 
+import asyncio
 import httpx
 import re
 import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+from app.config import settings
 from app.services.cache import cache_service
+from app.utils.circuit_breaker import get_breaker
+from app.utils.concurrent import run_sync
 
 logger = logging.getLogger(__name__)
 
+# Extraction patterns, compiled once and reused for every page
+FOOD_LINK = re.compile(r'<a[^>]*href="[^"]*/foods/([^"/]+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
+FOOD_ID_LINK = re.compile(r'href="[^"]*food[^"]*id=(\d+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
+FOOD_NAME_LINK = re.compile(r'<a[^>]*href="[^"]*/foods/[^"]*"[^>]*>([^<]+)</a>', re.IGNORECASE)
+COMPOUND_LINK = re.compile(r'<a[^>]*href="[^"]*/compounds/([^"/]+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
+METABOLITE_LINK = re.compile(r'metabolite[^>]*>([^<]+)</a>', re.IGNORECASE)
+FORMULA = re.compile(r'Formula[^:]*:\s*</[^>]+>\s*([A-Z][A-Za-z0-9]+)')
+MONOISOTOPIC_MASS = re.compile(r'Monoisotopic[^:]*:\s*</[^>]+>\s*([\d.]+)')
+COMPOUND_CLASS = re.compile(r'Class[^:]*:\s*</[^>]+>\s*([^<]+)')
+PUBCHEM_ID = re.compile(r'PubChem[^:]*:\s*</[^>]+>\s*(\d+)', re.IGNORECASE)
+CHEBI_ID = re.compile(r'ChEBI[^:]*:\s*</[^>]+>\s*CHEBI:?(\d+)', re.IGNORECASE)
+
+
+def _unique(values: List[str], limit: int) -> List[str]:
+    """Stripped, de-duplicated non-empty values in page order"""
+    return list(dict.fromkeys(v.strip() for v in values if v.strip()))[:limit]
+
+
+def parse_compound_page(html: str) -> Dict[str, Any]:
+    """Extract compound details from a PhytoHub compound page"""
+    formula = FORMULA.search(html)
+    mass = MONOISOTOPIC_MASS.search(html)
+    compound_class = COMPOUND_CLASS.search(html)
+    pubchem = PUBCHEM_ID.search(html)
+    chebi = CHEBI_ID.search(html)
+
+    return {
+        "formula": formula.group(1) if formula else None,
+        "monoisotopic_mass": float(mass.group(1)) if mass else None,
+        "compound_class": compound_class.group(1).strip() if compound_class else None,
+        "food_sources": _unique(FOOD_NAME_LINK.findall(html), 10),
+        "metabolites": _unique(METABOLITE_LINK.findall(html), 10),
+        "pubchem_id": pubchem.group(1) if pubchem else None,
+        "chebi_id": f"CHEBI:{chebi.group(1)}" if chebi else None,
+    }
+
 
 @dataclass
 class PhytoHubCompound:
@@ -49,12 +89,18 @@ class PhytoHubClient:
     information. Useful for understanding how plant compounds are metabolized
     in humans.
 
+    Pages are fetched with an async client: compound detail pages for a
+    food are requested concurrently (up to ``scraper_max_concurrency`` at a
+    time) and their parsed contents are cached per compound. The ``*_async``
+    methods are the implementation; the plain methods are sync wrappers.
+
     Free public access, no API key required.
     """
 
     def __init__(self):
         self.base_url = "https://phytohub.eu"
         self.timeout = 30.0
+        self.breaker = get_breaker("phytohub")
         self.cache_ttl = 86400 * 7  # Cache for 7 days
 
     def _get_cached(self, cache_key: str) -> Optional[Any]:
@@ -65,7 +111,31 @@ class PhytoHubClient:
         """Cache a result"""
         cache_service.set("phytohub", cache_key, value, ttl=self.cache_ttl)
 
+    def _client(self) -> httpx.AsyncClient:
+        """Async client whose connection pool bounds parallel page fetches"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=settings.scraper_max_concurrency)
+        )
+
+    async def _get_page(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Fetch one HTML page through the circuit breaker"""
+        with self.breaker.guard():
+            response = await client.get(path, params=params)
+            response.raise_for_status()
+        return response.text
+
     def search_food(self, food_name: str) -> Optional[PhytoHubFoodResult]:
+        """Sync wrapper for search_food_async"""
+        return run_sync(self.search_food_async(food_name))
+
+    async def search_food_async(self, food_name: str) -> Optional[PhytoHubFoodResult]:
         """
         Search for a food/plant and get its phytochemicals.
 
@@ -82,26 +152,23 @@ class PhytoHubClient:
             return self._dict_to_food_result(cached)
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
+            async with self._client() as client:
                 # Search for the food
-                response = client.get(
-                    f"{self.base_url}/search/foods",
-                    params={"query": food_name}
-                )
-                response.raise_for_status()
-                html = response.text
+                html = await self._get_page(client, "/search/foods", {"query": food_name})
 
                 # Parse food results
                 result = self._parse_food_search(html, food_name)
 
                 if result and result.phytohub_id:
-                    # Get compounds for this food
-                    compounds = self._get_food_compounds(client, result.phytohub_id, food_name)
+                    # Get compounds for this food, then their details concurrently
+                    compounds = await self._get_food_compounds(client, result.phytohub_id, food_name)
+                    enriched = await self._enrich_compounds(client, compounds[:settings.phytohub_enrich_limit])
                     result.compounds = compounds
                     result.compound_count = len(compounds)
 
-                    # Cache the result
-                    self._set_cached(cache_key, self._food_result_to_dict(result))
+                    # Cache the result; partly enriched ones are retried (finished pages are cached)
+                    if enriched:
+                        self._set_cached(cache_key, self._food_result_to_dict(result))
 
                     logger.info(f"PhytoHub found {len(compounds)} compounds for {food_name}")
                     return result
@@ -118,15 +185,8 @@ class PhytoHubClient:
 
     def _parse_food_search(self, html: str, search_term: str) -> Optional[PhytoHubFoodResult]:
         """Parse food search results from HTML"""
-        # Look for food entries in search results
-        # Pattern: link to food detail page
-        food_pattern = r'<a[^>]*href="[^"]*/foods/([^"/]+)"[^>]*>([^<]+)</a>'
-        matches = re.findall(food_pattern, html, re.IGNORECASE)
-
-        if not matches:
-            # Try alternative pattern
-            food_pattern2 = r'href="[^"]*food[^"]*id=(\d+)"[^>]*>([^<]+)</a>'
-            matches = re.findall(food_pattern2, html, re.IGNORECASE)
+        # Links to food detail pages, or the older id= style
+        matches = FOOD_LINK.findall(html) or FOOD_ID_LINK.findall(html)
 
         if not matches:
             return None
@@ -141,53 +201,90 @@ class PhytoHubClient:
                 )
 
         # Return first match if no exact match
-        if matches:
-            return PhytoHubFoodResult(
-                food_name=matches[0][1].strip(),
-                phytohub_id=matches[0][0]
-            )
+        return PhytoHubFoodResult(
+            food_name=matches[0][1].strip(),
+            phytohub_id=matches[0][0]
+        )
 
-        return None
+    def _parse_compound_links(self, html: str, limit: int, **fields: Any) -> List[PhytoHubCompound]:
+        """Distinct compounds linked from a page, in page order"""
+        compounds = []
+        seen_names = set()
+        for comp_id, name in COMPOUND_LINK.findall(html)[:limit]:
+            name = name.strip()
+            if name.lower() not in seen_names and len(name) > 2:
+                seen_names.add(name.lower())
+                compounds.append(PhytoHubCompound(name=name, phytohub_id=comp_id, **fields))
+        return compounds
 
-    def _get_food_compounds(
+    async def _get_food_compounds(
         self,
-        client: httpx.Client,
+        client: httpx.AsyncClient,
         food_id: str,
         food_name: str
     ) -> List[PhytoHubCompound]:
         """Get compounds for a specific food"""
-        compounds = []
-
         try:
-            # Try to get food detail page
-            response = client.get(
-                f"{self.base_url}/foods/{food_id}"
-            )
-            response.raise_for_status()
-            html = response.text
-
-            # Parse compound entries
-            # Look for compound links
-            compound_pattern = r'<a[^>]*href="[^"]*/compounds/([^"/]+)"[^>]*>([^<]+)</a>'
-            matches = re.findall(compound_pattern, html, re.IGNORECASE)
-
-            seen_names = set()
-            for comp_id, name in matches[:50]:  # Limit to 50
-                name = name.strip()
-                if name.lower() not in seen_names and len(name) > 2:
-                    seen_names.add(name.lower())
-                    compounds.append(PhytoHubCompound(
-                        name=name,
-                        phytohub_id=comp_id,
-                        food_sources=[food_name]
-                    ))
-
+            html = await self._get_page(client, f"/foods/{food_id}")
         except Exception as e:
             logger.error(f"Error getting compounds for food {food_id}: {e}")
+            return []
 
-        return compounds
+        return self._parse_compound_links(html, 50, food_sources=[food_name])  # Limit to 50
+
+    async def _get_compound_details(self, client: httpx.AsyncClient, phytohub_id: str) -> Dict[str, Any]:
+        """Parsed compound detail page (cached per compound)"""
+        cache_key = f"page_compound_{phytohub_id}"
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        details = parse_compound_page(await self._get_page(client, f"/compounds/{phytohub_id}"))
+        self._set_cached(cache_key, details)
+        return details
+
+    async def _enrich_compounds(self, client: httpx.AsyncClient, compounds: List[PhytoHubCompound]) -> bool:
+        """
+        Enrich compounds with details from their detail pages, fetched concurrently.
+
+        Fetching stops after ``phytohub_enrich_timeout``; compounds whose
+        pages haven't arrived by then are left unenriched.
+
+        Returns:
+            True if every detail page was fetched in time
+        """
+        compounds = [c for c in compounds if c.phytohub_id]
+        if not compounds:
+            return True
+
+        tasks = {
+            asyncio.ensure_future(self._get_compound_details(client, c.phytohub_id)): c
+            for c in compounds
+        }
+        done, pending = await asyncio.wait(tasks, timeout=settings.phytohub_enrich_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(
+                f"PhytoHub enrichment budget spent: {len(pending)}/{len(compounds)} compounds left unenriched"
+            )
+
+        for task in done:
+            compound = tasks[task]
+            if task.exception() is not None:
+                logger.debug(f"Could not enrich compound {compound.name}: {task.exception()}")
+                continue
+            for key, value in task.result().items():
+                if value:
+                    setattr(compound, key, value)
+        return not pending
 
     def search_compound(self, compound_name: str) -> Optional[PhytoHubCompound]:
+        """Sync wrapper for search_compound_async"""
+        return run_sync(self.search_compound_async(compound_name))
+
+    async def search_compound_async(self, compound_name: str) -> Optional[PhytoHubCompound]:
         """
         Search for a specific compound.
 
@@ -204,102 +301,34 @@ class PhytoHubClient:
             return PhytoHubCompound(**cached)
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{self.base_url}/search/compounds",
-                    params={"query": compound_name}
-                )
-                response.raise_for_status()
-                html = response.text
-
-                # Parse compound results
-                compound_pattern = r'<a[^>]*href="[^"]*/compounds/([^"/]+)"[^>]*>([^<]+)</a>'
-                matches = re.findall(compound_pattern, html, re.IGNORECASE)
+            async with self._client() as client:
+                html = await self._get_page(client, "/search/compounds", {"query": compound_name})
+                matches = COMPOUND_LINK.findall(html)
 
                 if not matches:
                     return None
 
-                # Find best match
+                # Best match for the search term, else the first result
                 search_lower = compound_name.lower()
-                for comp_id, name in matches:
-                    if search_lower in name.lower():
-                        compound = PhytoHubCompound(
-                            name=name.strip(),
-                            phytohub_id=comp_id
-                        )
-                        # Get more details
-                        self._enrich_compound(client, compound)
-
-                        # Cache it
-                        self._set_cached(cache_key, self._compound_to_dict(compound))
-                        return compound
-
-                # Return first match
-                if matches:
-                    compound = PhytoHubCompound(
-                        name=matches[0][1].strip(),
-                        phytohub_id=matches[0][0]
-                    )
-                    self._enrich_compound(client, compound)
-                    self._set_cached(cache_key, self._compound_to_dict(compound))
-                    return compound
+                comp_id, name = next(
+                    (m for m in matches if search_lower in m[1].lower()),
+                    matches[0]
+                )
+                compound = PhytoHubCompound(name=name.strip(), phytohub_id=comp_id)
+                await self._enrich_compounds(client, [compound])
 
-                return None
+                self._set_cached(cache_key, self._compound_to_dict(compound))
+                return compound
 
         except Exception as e:
             logger.error(f"PhytoHub error searching compound {compound_name}: {e}")
             return None
 
-    def _enrich_compound(self, client: httpx.Client, compound: PhytoHubCompound) -> None:
-        """Enrich compound with additional details from its detail page"""
-        if not compound.phytohub_id:
-            return
-
-        try:
-            response = client.get(
-                f"{self.base_url}/compounds/{compound.phytohub_id}"
-            )
-            response.raise_for_status()
-            html = response.text
-
-            # Extract formula
-            formula_match = re.search(r'Formula[^:]*:\s*</[^>]+>\s*([A-Z][A-Za-z0-9]+)', html)
-            if formula_match:
-                compound.formula = formula_match.group(1)
-
-            # Extract mass
-            mass_match = re.search(r'Monoisotopic[^:]*:\s*</[^>]+>\s*([\d.]+)', html)
-            if mass_match:
-                compound.monoisotopic_mass = float(mass_match.group(1))
-
-            # Extract compound class
-            class_match = re.search(r'Class[^:]*:\s*</[^>]+>\s*([^<]+)', html)
-            if class_match:
-                compound.compound_class = class_match.group(1).strip()
-
-            # Extract food sources
-            food_pattern = r'<a[^>]*href="[^"]*/foods/[^"]*"[^>]*>([^<]+)</a>'
-            food_matches = re.findall(food_pattern, html, re.IGNORECASE)
-            compound.food_sources = list(set(f.strip() for f in food_matches if f.strip()))[:10]
-
-            # Extract metabolites
-            metabolite_pattern = r'metabolite[^>]*>([^<]+)</a>'
-            metabolite_matches = re.findall(metabolite_pattern, html, re.IGNORECASE)
-            compound.metabolites = list(set(m.strip() for m in metabolite_matches if m.strip()))[:10]
-
-            # Extract external IDs
-            pubchem_match = re.search(r'PubChem[^:]*:\s*</[^>]+>\s*(\d+)', html, re.IGNORECASE)
-            if pubchem_match:
-                compound.pubchem_id = pubchem_match.group(1)
-
-            chebi_match = re.search(r'ChEBI[^:]*:\s*</[^>]+>\s*CHEBI:?(\d+)', html, re.IGNORECASE)
-            if chebi_match:
-                compound.chebi_id = f"CHEBI:{chebi_match.group(1)}"
-
-        except Exception as e:
-            logger.debug(f"Could not enrich compound {compound.name}: {e}")
-
     def get_compounds_by_class(self, compound_class: str) -> List[PhytoHubCompound]:
+        """Sync wrapper for get_compounds_by_class_async"""
+        return run_sync(self.get_compounds_by_class_async(compound_class))
+
+    async def get_compounds_by_class_async(self, compound_class: str) -> List[PhytoHubCompound]:
         """
         Get compounds belonging to a specific class.
 
@@ -317,28 +346,13 @@ class PhytoHubClient:
         compounds = []
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{self.base_url}/search/compounds",
-                    params={"query": compound_class, "class": compound_class}
+            async with self._client() as client:
+                html = await self._get_page(
+                    client,
+                    "/search/compounds",
+                    {"query": compound_class, "class": compound_class}
                 )
-                response.raise_for_status()
-                html = response.text
-
-                # Parse compound results
-                compound_pattern = r'<a[^>]*href="[^"]*/compounds/([^"/]+)"[^>]*>([^<]+)</a>'
-                matches = re.findall(compound_pattern, html, re.IGNORECASE)
-
-                seen_names = set()
-                for comp_id, name in matches[:30]:
-                    name = name.strip()
-                    if name.lower() not in seen_names and len(name) > 2:
-                        seen_names.add(name.lower())
-                        compounds.append(PhytoHubCompound(
-                            name=name,
-                            phytohub_id=comp_id,
-                            compound_class=compound_class
-                        ))
+                compounds = self._parse_compound_links(html, 30, compound_class=compound_class)
 
                 # Cache results
                 self._set_cached(cache_key, [self._compound_to_dict(c) for c in compounds])
@@ -348,7 +362,11 @@ class PhytoHubClient:
 
         return compounds
 
-    def get_plant_compounds_for_species(
+    def get_plant_compounds_for_species(self, plant_common_name: str) -> Dict[str, Any]:
+        """Sync wrapper for get_plant_compounds_for_species_async"""
+        return run_sync(self.get_plant_compounds_for_species_async(plant_common_name))
+
+    async def get_plant_compounds_for_species_async(
         self,
         plant_common_name: str
     ) -> Dict[str, Any]:
@@ -363,7 +381,7 @@ class PhytoHubClient:
         Returns:
             Dict with compound names and available metadata
         """
-        result = self.search_food(plant_common_name)
+        result = await self.search_food_async(plant_common_name)
 
         if not result:
             return {"found": False, "compounds": []}
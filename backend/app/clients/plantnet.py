@@ -8,6 +8,13 @@ import logging
 
 from app.config import settings
 from app.services.cache import cache_service
+from app.utils.image_preprocessing import (
+    ImageBuffer,
+    PreparedImage,
+    buffer_reader,
+    hamming_distance,
+    preprocess_image,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,17 +32,52 @@ class PlantNetClient:
         self.api_key = settings.plantnet_api_key
         self.timeout = 30.0
 
+    def _cached_identification(self, image: PreparedImage, query_key: str) -> Optional[Dict[str, Any]]:
+        """Cached result for this exact image, else for the nearest near-duplicate"""
+        cached = cache_service.get("plantnet", f"{query_key}:{image.content_hash}")
+        if cached or image.perceptual_hash is None:
+            return cached
+
+        best = None
+        for hash_hex, content_hash in cache_service.get("plantnet_phash_index", query_key) or []:
+            distance = hamming_distance(int(hash_hex, 16), image.perceptual_hash)
+            if distance <= settings.plantnet_phash_max_distance and (best is None or distance < best[0]):
+                best = (distance, content_hash)
+
+        if best is None:
+            return None
+        logger.info(f"PlantNet near-duplicate cache hit (distance {best[0]})")
+        return cache_service.get("plantnet", f"{query_key}:{best[1]}")
+
+    def _store_identification(self, image: PreparedImage, query_key: str, result: Dict[str, Any]) -> None:
+        """Cache a result under the image's content hash and index its perceptual hash"""
+        cache_service.set("plantnet", f"{query_key}:{image.content_hash}", result, ttl=settings.plantnet_cache_ttl)
+        if image.perceptual_hash is None:
+            return
+
+        def add_entry(index):
+            index = [entry for entry in index or [] if entry[1] != image.content_hash]
+            index.append([f"{image.perceptual_hash:016x}", image.content_hash])
+            return index[-settings.plantnet_phash_index_size:]
+
+        # Shared by every worker identifying images for this query
+        cache_service.update("plantnet_phash_index", query_key, add_entry, ttl=settings.plantnet_cache_ttl)
+
     def identify_plant(
         self,
-        image_data: bytes,
+        image_data: ImageBuffer,
         organs: List[str] = None,
         lang: str = "en"
     ) -> Dict[str, Any]:
         """
         Identify a plant from an image.
 
+        The image is downscaled and re-encoded before upload, and results
+        are cached by content hash and perceptual hash, so re-scans of the
+        same plant are answered locally.
+
         Args:
-            image_data: Raw image bytes (JPEG, PNG)
+            image_data: Raw image bytes or buffer (JPEG, PNG, ...)
             organs: Plant organs visible in image (leaf, flower, fruit, bark, root)
             lang: Language for common names
 
@@ -53,12 +95,22 @@ class PlantNetClient:
         # Since we send 1 image, use only the first organ
         primary_organ = organs[0] if organs else "auto"
 
+        query_key = f"{primary_organ}:{lang}"
+
         try:
+            image = preprocess_image(image_data)
+
+            cached = self._cached_identification(image, query_key)
+            if cached:
+                return {**cached, "cached": True}
+
             # PlantNet API endpoint
             url = f"{self.base_url}/all"
 
+            # Unprocessed buffers (e.g. a memoryview over the upload spool) are streamed, not copied
+            upload = image.data if isinstance(image.data, bytes) else buffer_reader(image.data)
             files = {
-                "images": ("plant.jpg", image_data, "image/jpeg")
+                "images": (image.filename, upload, image.content_type)
             }
 
             # Send single organ matching the single image
@@ -98,7 +150,7 @@ class PlantNetClient:
                 f"(score: {(best_match['score'] if best_match else 0):.2f})"
             )
 
-            return {
+            identification = {
                 "success": True,
                 "best_match": best_match,
                 "results": species_results,
@@ -107,6 +159,8 @@ class PlantNetClient:
                     "language": lang
                 }
             }
+            self._store_identification(image, query_key, identification)
+            return identification
 
         except httpx.HTTPStatusError as e:
             logger.error(f"PlantNet API error: {e.response.status_code} - {e.response.text}")
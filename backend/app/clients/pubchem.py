@@ -1,40 +1,235 @@
 """PubChem API client for compound resolution"""
 
+import re
 import httpx
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Dict, Any, List
-from tenacity import retry, stop_after_attempt, wait_exponential
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 import logging
 
+try:
+    import ijson
+except ImportError:  # Optional: falls back to parsing the (heading-filtered) JSON in one go
+    ijson = None
+
 from app.config import settings
 from app.models.schemas import CompoundIdentity, ProvenanceRecord
 from app.utils import RateLimiter
+from app.utils.concurrent import iter_concurrent
+from app.services.cache import cache_service
+from app.utils.deadline import clamp_timeout, run_in_context, stop_at_deadline, wait_within_deadline
+from app.utils.hedging import hedged_call
+from app.utils.retry import is_retryable, is_not_found
+from app.utils.circuit_breaker import get_breaker
 
 logger = logging.getLogger(__name__)
 
+# Properties requested for every resolved compound
+COMPOUND_PROPERTIES = "CanonicalSMILES,InChIKey,MolecularFormula,MolecularWeight,IUPACName"
+
+# Top-level PUG View headings requested for toxicity/dosage extraction
+PUG_VIEW_HEADINGS = ("Toxicity", "Drug and Medication Information", "Pharmacology and Biochemistry")
+
+# Section headings (matched as substrings at any depth) that hold the text we parse
+TOXICITY_HEADINGS = ["Toxicity", "Acute Effects", "LD50"]
+PHARMACOLOGY_HEADINGS = ["Drug and Medication", "Therapeutic", "Pharmacology", "Dosage", "Administration"]
+
+LD50_PATTERNS = [
+    re.compile(
+        r'LD50\s*(?:\(|:)?\s*(oral|dermal|intravenous|intraperitoneal|subcutaneous|i\.v\.|i\.p\.|s\.c\.)\s*(?:\)|:)?\s*(?:in\s+)?(rat|mouse|rabbit|dog|human|guinea pig)?\s*(?::|\)|\s)\s*([\d,.]+)\s*(mg/kg|g/kg|mg/L|mL/kg)',
+        re.IGNORECASE
+    ),
+    re.compile(
+        r'LD50\s*(?:=|:)\s*([\d,.]+)\s*(mg/kg|g/kg)\s*\((oral|dermal|i\.v\.)[,;]\s*(rat|mouse|rabbit)\)',
+        re.IGNORECASE
+    ),
+]
+
+DOSE_PATTERNS = [
+    re.compile(
+        r'(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(mg|mg/kg|g|mcg|μg)\s*(?:per day|daily|orally|by mouth)',
+        re.IGNORECASE
+    ),
+    re.compile(
+        r'(?:dose|dosage)(?:\s+is)?\s*[:=]?\s*(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(mg|mg/kg|g)',
+        re.IGNORECASE
+    ),
+    re.compile(
+        r'(\d+(?:\.\d+)?)\s*(mg|g|mcg)\s*(?:orally|by mouth|per day|daily)',
+        re.IGNORECASE
+    ),
+]
+
+
+class _ByteStream:
+    """File-like adapter that lets ijson read from an httpx byte iterator"""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+
+def _find_sections(sections: List[Dict[str, Any]], target_headings: List[str]) -> List[Dict[str, Any]]:
+    """Recursively find sections whose heading matches any target heading"""
+    found = []
+    for section in sections:
+        heading = section.get("TOCHeading", "").lower()
+        if any(t.lower() in heading for t in target_headings):
+            # _extract_text already covers the subsections of a match
+            found.append(section)
+            continue
+        subsections = section.get("Section", [])
+        if subsections:
+            found.extend(_find_sections(subsections, target_headings))
+    return found
+
+
+def _extract_text(section: Dict[str, Any]) -> List[str]:
+    """Extract text from section information, including subsections"""
+    texts = []
+    for info in section.get("Information", []):
+        value = info.get("Value", {})
+        for string_val in value.get("StringWithMarkup", []):
+            text = string_val.get("String", "")
+            if text:
+                texts.append(text)
+    for sub in section.get("Section", []):
+        texts.extend(_extract_text(sub))
+    return texts
+
+
+def _parse_toxicity_texts(tox_texts: List[str], pharm_texts: List[str]) -> Dict[str, Any]:
+    """Parse LD50 values, therapeutic doses and toxicity notes from section texts"""
+    result = {
+        "ld50_values": [],
+        "therapeutic_doses": [],
+        "toxicity_notes": [],
+    }
+
+    for text in tox_texts:
+        # Parse LD50 values
+        for pattern in LD50_PATTERNS:
+            for match in pattern.finditer(text):
+                groups = match.groups()
+                if pattern is LD50_PATTERNS[0]:
+                    route = groups[0]
+                    species = groups[1] or "unknown"
+                    value_str = groups[2].replace(",", "")
+                    unit = groups[3]
+                else:
+                    value_str = groups[0].replace(",", "")
+                    unit = groups[1]
+                    route = groups[2]
+                    species = groups[3]
+
+                try:
+                    value = float(value_str)
+                    result["ld50_values"].append({
+                        "value": value,
+                        "unit": unit,
+                        "route": route.strip(),
+                        "species": species.strip() if species else "unknown",
+                        "raw_text": text[:200],
+                    })
+                except (ValueError, TypeError):
+                    pass
+
+        # Add general toxicity notes (limit length)
+        if len(text) > 20 and len(text) < 500:
+            if any(kw in text.lower() for kw in ["toxic", "lethal", "ld50", "acute", "poison"]):
+                result["toxicity_notes"].append(text[:300])
+
+    for text in pharm_texts:
+        # Look for dosage information
+        for pattern in DOSE_PATTERNS:
+            for match in pattern.finditer(text):
+                groups = match.groups()
+                try:
+                    if len(groups) >= 3:
+                        result["therapeutic_doses"].append({
+                            "value_low": float(groups[0]),
+                            "value_high": float(groups[1]),
+                            "unit": groups[2],
+                            "raw_text": text[:200],
+                        })
+                    elif len(groups) >= 2:
+                        result["therapeutic_doses"].append({
+                            "value_low": float(groups[0]),
+                            "unit": groups[1],
+                            "raw_text": text[:200],
+                        })
+                except (ValueError, TypeError):
+                    pass
+
+    # Deduplicate
+    result["toxicity_notes"] = list(set(result["toxicity_notes"]))[:5]
+    return result
+
+
+def compound_cache_key(ingredient_name: str) -> str:
+    """Key for an ingredient name in the "compound" cache"""
+    return ingredient_name.strip().lower()
+
 
 class PubChemClient:
     """Client for PubChem PUG REST API"""
 
     def __init__(self):
         self.base_url = settings.pubchem_base_url
+        self.pug_view_url = settings.pubchem_pug_view_url
         self.rate_limiter = RateLimiter(settings.pubchem_rate_limit)
         self.timeout = 60.0
+        self.breaker = get_breaker("pubchem")
 
     @retry(
-        stop=stop_after_attempt(settings.max_retries),
-        wait=wait_exponential(multiplier=settings.retry_backoff_factor)
+        stop=stop_after_attempt(settings.max_retries) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=settings.retry_backoff_factor)),
+        retry=retry_if_exception(is_retryable)
     )
     def _get(self, url: str) -> Dict[str, Any]:
         """Make GET request with retry logic"""
         self.rate_limiter.wait()
         logger.info(f"PubChem GET: {url}")
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
             response = client.get(url)
             response.raise_for_status()
             return response.json()
 
+    @retry(
+        stop=stop_after_attempt(settings.max_retries) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=settings.retry_backoff_factor)),
+        retry=retry_if_exception(is_retryable)
+    )
+    def _post(self, url: str, data: Dict[str, str]) -> Dict[str, Any]:
+        """Make form-encoded POST request (PUG REST list input) with retry logic"""
+        self.rate_limiter.wait()
+        logger.info(f"PubChem POST: {url}")
+
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
+            response = client.post(url, data=data)
+            response.raise_for_status()
+            return response.json()
+
+    def _get_properties(self, url: str) -> Dict[str, Any]:
+        """Property lookup, hedged against PubChem's slow tail (idempotent GET)"""
+        return hedged_call("pubchem.properties", lambda: self._get(url), self.rate_limiter)
+
     def resolve_compound(
         self,
         ingredient_name: str
@@ -62,21 +257,19 @@ class PubChemClient:
 
             if not cid_data.get("IdentifierList", {}).get("CID"):
                 provenance.status = "error"
+                provenance.not_found = True
                 provenance.error_message = "No CID found"
                 return None, provenance
 
             cid = cid_data["IdentifierList"]["CID"][0]
 
             # Steps 2 & 3: Fetch properties and synonyms concurrently
-            props_url = (
-                f"{self.base_url}/compound/cid/{cid}/property/"
-                "CanonicalSMILES,InChIKey,MolecularFormula,MolecularWeight,IUPACName/JSON"
-            )
+            props_url = f"{self.base_url}/compound/cid/{cid}/property/{COMPOUND_PROPERTIES}/JSON"
             synonyms_url = f"{self.base_url}/compound/cid/{cid}/synonyms/JSON"
 
             with ThreadPoolExecutor(max_workers=2) as executor:
-                props_future = executor.submit(self._get, props_url)
-                synonyms_future = executor.submit(self._get, synonyms_url)
+                props_future = executor.submit(run_in_context(self._get_properties), props_url)
+                synonyms_future = executor.submit(run_in_context(self._get), synonyms_url)
                 props_data = props_future.result()
                 synonyms_data = synonyms_future.result()
 
@@ -103,6 +296,8 @@ class PubChemClient:
 
         except httpx.HTTPStatusError as e:
             provenance.status = "error"
+            # PubChem answers 404 for names it has no compound for
+            provenance.not_found = is_not_found(e)
             provenance.error_message = f"HTTP {e.response.status_code}: {str(e)}"
             provenance.duration_ms = (time.time() - start_time) * 1000
             logger.error(f"PubChem error for {ingredient_name}: {e}")
@@ -115,153 +310,203 @@ class PubChemClient:
             logger.error(f"Unexpected error resolving {ingredient_name}: {e}")
             return None, provenance
 
-    def get_toxicity_data(self, cid: int) -> Dict[str, Any]:
+    def resolve_compounds_batch(self, ingredient_names: List[str]) -> Dict[str, CompoundIdentity]:
         """
-        Get toxicity and pharmacology data from PubChem PUG View.
+        Resolve many ingredient names at once, filling the per-name compound cache.
+
+        Names already cached (or negative-cached) cost nothing. PUG REST only
+        accepts one name per name -> CID query, so those lookups run
+        concurrently; properties and synonyms for all CIDs are then fetched
+        with POSTed CID lists of ``pubchem_batch_size``.
 
         Args:
-            cid: PubChem CID
+            ingredient_names: Common names or synonyms
 
         Returns:
-            Dict with keys: ld50_values, therapeutic_doses, toxicity_notes
+            Dict mapping compound_cache_key(name) -> CompoundIdentity for every resolved name
         """
-        import re
-
-        result = {
-            "ld50_values": [],
-            "therapeutic_doses": [],
-            "toxicity_notes": [],
+        names: Dict[str, str] = {}
+        for name in ingredient_names:
+            if name and name.strip():
+                names.setdefault(compound_cache_key(name), name.strip())
+
+        results = {
+            key: CompoundIdentity(**value)
+            for key, value in cache_service.get_many("compound", list(names)).items()
         }
+        missing = [
+            key for key in names
+            if key not in results and not cache_service.is_negative("compound", key)
+        ]
+        if not missing:
+            return results
+
+        logger.info(f"PubChem batch: {len(results)} cached, resolving {len(missing)} names")
+
+        # Step 1: name -> CID (failed lookups are left uncached and retried later).
+        # Lookups are paced by the rate limit, so the wait grows with the batch;
+        # if it still runs out, the names resolved so far are kept.
+        name_to_cid = {}
+        try:
+            for key, cids in iter_concurrent(
+                lambda key: self._lookup_cids(names[key]),
+                missing,
+                max_workers=settings.pubchem_batch_workers,
+                timeout=120.0 + len(missing) / settings.pubchem_rate_limit
+            ):
+                if cids:
+                    name_to_cid[key] = cids[0]
+                else:
+                    cache_service.set_negative("compound", key, "No CID found")
+        except FuturesTimeoutError:
+            logger.warning(f"PubChem batch: CID lookups timed out after {len(name_to_cid)}/{len(missing)} names")
+
+        # Step 2: properties and synonyms for all CIDs with POSTed lists
+        cids = sorted(set(name_to_cid.values()))
+        size = settings.pubchem_batch_size
+        properties: Dict[int, Dict[str, Any]] = {}
+        synonyms: Dict[int, List[str]] = {}
+        for i in range(0, len(cids), size):
+            cid_list = ",".join(str(cid) for cid in cids[i:i + size])
+            try:
+                props_data = self._post(
+                    f"{self.base_url}/compound/cid/property/{COMPOUND_PROPERTIES}/JSON",
+                    {"cid": cid_list}
+                )
+                for props in props_data.get("PropertyTable", {}).get("Properties", []):
+                    properties[props["CID"]] = props
+
+                synonyms_data = self._post(f"{self.base_url}/compound/cid/synonyms/JSON", {"cid": cid_list})
+                for info in synonyms_data.get("InformationList", {}).get("Information", []):
+                    synonyms[info["CID"]] = info.get("Synonym", [])
+            except Exception as e:
+                logger.error(f"PubChem batch property lookup failed for {cid_list}: {e}")
+
+        # Step 3: build identities and fill the per-name cache
+        resolved = {}
+        for key, cid in name_to_cid.items():
+            props = properties.get(cid)
+            if not props:
+                continue
+            resolved[key] = CompoundIdentity(
+                ingredient_name=names[key],
+                pubchem_cid=cid,
+                canonical_smiles=props.get("CanonicalSMILES"),
+                inchikey=props.get("InChIKey"),
+                molecular_formula=props.get("MolecularFormula"),
+                molecular_weight=props.get("MolecularWeight"),
+                iupac_name=props.get("IUPACName"),
+                synonyms=synonyms.get(cid, [])[:10]
+            )
 
+        if resolved:
+            cache_service.set_many("compound", {key: c.model_dump() for key, c in resolved.items()})
+        logger.info(f"PubChem batch resolved {len(resolved)}/{len(missing)} names")
+
+        results.update(resolved)
+        return results
+
+    def _lookup_cids(self, ingredient_name: str) -> List[int]:
+        """CIDs for one name (empty when PubChem has no match); the name is POSTed to avoid URL escaping"""
         try:
-            url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/compound/{cid}/JSON"
-            self.rate_limiter.wait()
-            logger.info(f"PubChem PUG View GET: {url}")
+            data = self._post(f"{self.base_url}/compound/name/cids/JSON", {"name": ingredient_name})
+        except httpx.HTTPStatusError as e:
+            if is_not_found(e):
+                return []
+            raise
+        return data.get("IdentifierList", {}).get("CID", [])
+
+    def _iter_pug_view_sections(self, cid: int, heading: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the top-level sections of a heading-filtered PUG View record.
+
+        With ijson available the response body is parsed incrementally, so
+        only one top-level section is materialized at a time.
+        """
+        url = f"{self.pug_view_url}/data/compound/{cid}/JSON"
+        self.rate_limiter.wait()
+        logger.info(f"PubChem PUG View GET: {url} (heading: {heading})")
 
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url)
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
+            with client.stream("GET", url, params={"heading": heading}) as response:
+                if response.status_code == 404:
+                    # Compound has no section with this heading
+                    return
                 response.raise_for_status()
-                data = response.json()
-
-            record = data.get("Record", {})
-            sections = record.get("Section", [])
-
-            # Recursively search sections for toxicity data
-            def find_sections(sections, target_headings):
-                found = []
-                for section in sections:
-                    heading = section.get("TOCHeading", "")
-                    if any(t.lower() in heading.lower() for t in target_headings):
-                        found.append(section)
-                    # Recurse into subsections
-                    subsections = section.get("Section", [])
-                    if subsections:
-                        found.extend(find_sections(subsections, target_headings))
-                return found
-
-            # Extract text from section information
-            def extract_text(section):
-                texts = []
-                for info in section.get("Information", []):
-                    value = info.get("Value", {})
-                    for string_val in value.get("StringWithMarkup", []):
-                        text = string_val.get("String", "")
-                        if text:
-                            texts.append(text)
-                # Recurse into subsections
-                for sub in section.get("Section", []):
-                    texts.extend(extract_text(sub))
-                return texts
-
-            # Search for toxicity sections
-            tox_sections = find_sections(sections, ["Toxicity", "Acute Effects", "LD50"])
-            for sec in tox_sections:
-                texts = extract_text(sec)
-                for text in texts:
-                    # Parse LD50 values
-                    ld50_patterns = [
-                        r'LD50\s*(?:\(|:)?\s*(oral|dermal|intravenous|intraperitoneal|subcutaneous|i\.v\.|i\.p\.|s\.c\.)\s*(?:\)|:)?\s*(?:in\s+)?(rat|mouse|rabbit|dog|human|guinea pig)?\s*(?::|\)|\s)\s*([\d,.]+)\s*(mg/kg|g/kg|mg/L|mL/kg)',
-                        r'LD50\s*(?:=|:)\s*([\d,.]+)\s*(mg/kg|g/kg)\s*\((oral|dermal|i\.v\.)[,;]\s*(rat|mouse|rabbit)\)',
-                    ]
-                    for pattern in ld50_patterns:
-                        matches = re.finditer(pattern, text, re.IGNORECASE)
-                        for match in matches:
-                            groups = match.groups()
-                            if len(groups) >= 4:
-                                route = groups[0]
-                                species = groups[1] or "unknown"
-                                value_str = groups[2].replace(",", "")
-                                unit = groups[3]
-                            elif len(groups) >= 3:
-                                value_str = groups[0].replace(",", "")
-                                unit = groups[1]
-                                route = groups[2] if len(groups) > 2 else "unknown"
-                                species = groups[3] if len(groups) > 3 else "unknown"
-                            else:
-                                continue
-
-                            try:
-                                value = float(value_str)
-                                result["ld50_values"].append({
-                                    "value": value,
-                                    "unit": unit,
-                                    "route": route.strip(),
-                                    "species": species.strip() if species else "unknown",
-                                    "raw_text": text[:200],
-                                })
-                            except (ValueError, TypeError):
-                                pass
-
-                    # Add general toxicity notes (limit length)
-                    if len(text) > 20 and len(text) < 500:
-                        if any(kw in text.lower() for kw in ["toxic", "lethal", "ld50", "acute", "poison"]):
-                            result["toxicity_notes"].append(text[:300])
-
-            # Search for pharmacology/drug information sections
-            pharm_sections = find_sections(sections, [
-                "Drug and Medication", "Therapeutic", "Pharmacology",
-                "Dosage", "Administration"
-            ])
-            for sec in pharm_sections:
-                texts = extract_text(sec)
-                for text in texts:
-                    # Look for dosage information
-                    dose_patterns = [
-                        r'(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(mg|mg/kg|g|mcg|μg)\s*(?:per day|daily|orally|by mouth)',
-                        r'(?:dose|dosage)(?:\s+is)?\s*[:=]?\s*(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(mg|mg/kg|g)',
-                        r'(\d+(?:\.\d+)?)\s*(mg|g|mcg)\s*(?:orally|by mouth|per day|daily)',
-                    ]
-                    for pattern in dose_patterns:
-                        matches = re.finditer(pattern, text, re.IGNORECASE)
-                        for match in matches:
-                            groups = match.groups()
-                            try:
-                                if len(groups) >= 3:
-                                    result["therapeutic_doses"].append({
-                                        "value_low": float(groups[0]),
-                                        "value_high": float(groups[1]),
-                                        "unit": groups[2],
-                                        "raw_text": text[:200],
-                                    })
-                                elif len(groups) >= 2:
-                                    result["therapeutic_doses"].append({
-                                        "value_low": float(groups[0]),
-                                        "unit": groups[1],
-                                        "raw_text": text[:200],
-                                    })
-                            except (ValueError, TypeError):
-                                pass
-
-            # Deduplicate
-            result["toxicity_notes"] = list(set(result["toxicity_notes"]))[:5]
-            logger.info(f"PubChem toxicity: {len(result['ld50_values'])} LD50, {len(result['therapeutic_doses'])} doses for CID {cid}")
 
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"PubChem PUG View error for CID {cid}: {e.response.status_code}")
-        except Exception as e:
-            logger.warning(f"PubChem toxicity data error for CID {cid}: {e}")
+                if ijson is not None:
+                    stream = _ByteStream(response.iter_bytes())
+                    yield from ijson.items(stream, "Record.Section.item", use_float=True)
+                else:
+                    response.read()
+                    yield from response.json().get("Record", {}).get("Section", [])
+
+    def _fetch_pug_view_texts(self, cid: int, heading: str) -> tuple[List[str], List[str]]:
+        """Extract toxicity and pharmacology texts for one PUG View heading"""
+        tox_texts: List[str] = []
+        pharm_texts: List[str] = []
+
+        for section in self._iter_pug_view_sections(cid, heading):
+            for sec in _find_sections([section], TOXICITY_HEADINGS):
+                tox_texts.extend(_extract_text(sec))
+            for sec in _find_sections([section], PHARMACOLOGY_HEADINGS):
+                pharm_texts.extend(_extract_text(sec))
 
-        return result
+        return tox_texts, pharm_texts
+
+    def get_toxicity_data(self, cid: int) -> Dict[str, Any]:
+        """Toxicity and pharmacology data for a CID (see fetch_toxicity_data)"""
+        return self.fetch_toxicity_data(cid)[0]
+
+    def fetch_toxicity_data(self, cid: int) -> Tuple[Dict[str, Any], bool]:
+        """
+        Get toxicity and pharmacology data from PubChem PUG View with caching.
+
+        Requests only the headings we parse instead of the full record and
+        extracts their text as the response streams in. Only complete
+        extractions are cached; transient errors return what was parsed so
+        the next request retries.
+
+        Args:
+            cid: PubChem CID
+
+        Returns:
+            Tuple of (dict with keys ld50_values, therapeutic_doses,
+            toxicity_notes; True if every heading was fetched)
+        """
+        cached = cache_service.get("pubchem_toxicity", str(cid))
+        if cached is not None:
+            logger.debug(f"Cache hit for PubChem toxicity: {cid}")
+            return cached, True
+
+        tox_texts: List[str] = []
+        pharm_texts: List[str] = []
+        complete = True
+
+        with ThreadPoolExecutor(max_workers=len(PUG_VIEW_HEADINGS)) as executor:
+            futures = {
+                heading: executor.submit(run_in_context(self._fetch_pug_view_texts), cid, heading)
+                for heading in PUG_VIEW_HEADINGS
+            }
+            for heading, future in futures.items():
+                try:
+                    heading_tox, heading_pharm = future.result()
+                    tox_texts.extend(heading_tox)
+                    pharm_texts.extend(heading_pharm)
+                except httpx.HTTPStatusError as e:
+                    complete = False
+                    logger.warning(f"PubChem PUG View error for CID {cid} ({heading}): {e.response.status_code}")
+                except Exception as e:
+                    complete = False
+                    logger.warning(f"PubChem toxicity data error for CID {cid} ({heading}): {e}")
+
+        result = _parse_toxicity_texts(tox_texts, pharm_texts)
+        logger.info(f"PubChem toxicity: {len(result['ld50_values'])} LD50, {len(result['therapeutic_doses'])} doses for CID {cid}")
+
+        if complete:
+            cache_service.set("pubchem_toxicity", str(cid), result)
+
+        return result, complete
 
     def get_cid_from_inchikey(self, inchikey: str) -> Optional[int]:
         """Get PubChem CID from InChIKey"""
@@ -2,13 +2,17 @@
 
 import httpx
 from typing import List, Dict, Any, Set
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 import logging
 
 from app.config import settings
 from app.models.schemas import ProvenanceRecord
 from app.utils import RateLimiter, fetch_concurrent
 from app.services.cache import cache_service
+from app.utils.deadline import clamp_timeout, stop_at_deadline, wait_within_deadline
+from app.utils.hedging import hedged_call
+from app.utils.retry import is_retryable
+from app.utils.circuit_breaker import get_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,7 @@ class ReactomeClient:
         self.analysis_url = "https://reactome.org/AnalysisService"
         self.rate_limiter = RateLimiter(settings.reactome_rate_limit)
         self.timeout = 60.0
+        self.breaker = get_breaker("reactome")
 
     def _is_valid_uniprot_id(self, identifier: str) -> bool:
         """Check if an identifier looks like a valid UniProt ID"""
@@ -37,8 +42,9 @@ class ReactomeClient:
         return first_char in 'PQOABCDEFGHIJKLMNR' and identifier[1:].isalnum()
 
     @retry(
-        stop=stop_after_attempt(settings.max_retries),
-        wait=wait_exponential(multiplier=settings.retry_backoff_factor)
+        stop=stop_after_attempt(settings.max_retries) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=settings.retry_backoff_factor)),
+        retry=retry_if_exception(is_retryable)
     )
     def _get(self, url: str) -> Any:
         """Make GET request with retry logic"""
@@ -46,14 +52,15 @@ class ReactomeClient:
         logger.info(f"Reactome GET: {url}")
 
         headers = {"Accept": "application/json"}
-        with httpx.Client(timeout=self.timeout) as client:
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
             response = client.get(url, headers=headers)
             response.raise_for_status()
             return response.json()
 
     @retry(
-        stop=stop_after_attempt(settings.max_retries),
-        wait=wait_exponential(multiplier=settings.retry_backoff_factor)
+        stop=stop_after_attempt(settings.max_retries) | stop_at_deadline(),
+        wait=wait_within_deadline(wait_exponential(multiplier=settings.retry_backoff_factor)),
+        retry=retry_if_exception(is_retryable)
     )
     def _post(self, url: str, data: Any) -> Any:
         """Make POST request with retry logic"""
@@ -64,7 +71,7 @@ class ReactomeClient:
             "Accept": "application/json",
             "Content-Type": "text/plain"
         }
-        with httpx.Client(timeout=self.timeout) as client:
+        with self.breaker.guard(self.timeout), httpx.Client(timeout=clamp_timeout(self.timeout)) as client:
             response = client.post(url, content=data, headers=headers)
             response.raise_for_status()
             return response.json()
@@ -218,7 +225,7 @@ class ReactomeClient:
 
         try:
             url = f"{self.base_url}/data/participants/{pathway_id}"
-            participants = self._get(url)
+            participants = hedged_call("reactome.participants", lambda: self._get(url), self.rate_limiter)
 
             uniprot_ids = []
             for participant in participants:
@@ -20,18 +20,85 @@ class Settings(BaseSettings):
     celery_broker_url: str = "memory://"
     celery_result_backend: str = "cache+memory://"
     celery_task_time_limit: int = 600  # 10 minutes
+    celery_worker_pool: str = "threads"  # I/O-bound tasks share one service per process
+    celery_worker_concurrency: int = 16
+    celery_worker_prefetch_multiplier: int = 1  # Don't let one worker hoard long batches
+    celery_batch_chunk_size: int = 50  # Ingredients per bulk batch task
+    celery_batch_concurrency: int = 4  # Ingredients analyzed concurrently within a batch
+    celery_interactive_queue: str = "interactive"  # UI-driven /analyze jobs
+    celery_bulk_queue: str = "bulk"  # Backfills and batch re-scoring
+    celery_interactive_concurrency: int = 16  # Worker threads for the interactive pool
+    celery_bulk_concurrency: int = 8  # Worker threads for the bulk pool
+    celery_max_priority: int = 9  # Priorities run 0 (lowest) to this value (highest)
+    celery_default_priority: int = 5
+    celery_bulk_priority: int = 1
+    job_dedup_ttl: int = 3600  # Identical /analyze submissions attach to a job this recent
 
     # Cache settings
     cache_ttl: int = 86400  # 24 hours
+    negative_cache_ttl: int = 3600  # Upstream misses (no CID, no molecule, no hit)
+    cache_schema_version: int = 1  # Bump when cached data shapes change; old entries become misses
+    cache_codec: str = "auto"  # json+zlib, orjson+zlib, orjson+zstd, ... ("auto" = best installed)
     disk_cache_dir: str = "/tmp/biopath_cache"  # Use /tmp for Railway compatibility
 
+    # Whole-report cache (stale-while-revalidate)
+    report_cache_enabled: bool = True
+    report_cache_fresh_ttl: int = 3600 * 6  # Served as-is within this age
+    report_cache_stale_ttl: int = 86400 * 7  # Served while refreshing in background until this age
+    report_refresh_workers: int = 2
+
+    # Precomputed analyses of catalog plants (compound reports + aggregate pathways)
+    plant_aggregates_enabled: bool = True
+    plant_aggregate_fresh_ttl: int = 86400  # Older aggregates are served while refreshed in background
+    plant_aggregate_ttl: int = 86400 * 30
+
+    # Response compression (zstd and br need the optional zstandard/brotli packages)
+    compression_enabled: bool = True
+    compression_min_size: int = 1024  # Smaller bodies are sent as-is
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5  # Higher qualities are too slow for per-request use
+    compression_zstd_level: int = 6
+
+    # Dosage aggregation
+    dosage_deadline_seconds: float = 30.0  # Shared budget for all dosage sources
+    dosage_max_workers: int = 6  # Long-lived pool shared across dosage requests
+    dosage_cache_ttl: int = 86400 * 7  # Toxicity/potency data changes rarely
+
     # API rate limiting (requests per second)
     pubchem_rate_limit: float = 5.0  # PubChem allows 5 req/sec
     chembl_rate_limit: float = 10.0
     reactome_rate_limit: float = 10.0
 
+    # PubChem batch resolution (POSTed CID lists)
+    pubchem_batch_size: int = 100  # CIDs per property/synonym POST
+    pubchem_batch_workers: int = 4  # Concurrent name -> CID lookups
+
+    # ChEMBL activity pagination
+    chembl_activity_page_size: int = 1000  # ChEMBL's maximum page size
+    chembl_max_activity_pages: int = 20  # Safety cap for very well-studied compounds
+    chembl_target_batch_size: int = 50  # Target IDs per target_chembl_id__in request
+
+    # HTML scrapers (PhytoHub, Dr. Duke's)
+    scraper_max_concurrency: int = 6  # Detail pages fetched in parallel per lookup
+    phytohub_enrich_limit: int = 20  # Food compounds whose detail pages are fetched
+    phytohub_enrich_timeout: float = 10.0  # Budget for those pages; the rest stay unenriched
+    dr_duke_db_path: str = "/tmp/biopath_data/dr_duke.sqlite3"  # Built by app.cli.import_dr_duke
+
+    # Request hedging for idempotent upstream GETs with long latency tails
+    enable_request_hedging: bool = True
+    hedge_min_samples: int = 20  # Latency samples needed before p95 is trusted
+    hedge_min_delay_seconds: float = 0.2  # Never hedge sooner than this
+    hedge_budget_ratio: float = 0.1  # At most this fraction of calls get a hedge
+    hedge_max_workers: int = 16  # Threads for hedges
+    hedge_primary_max_workers: int = 64  # Threads for primaries; beyond this calls run unhedged inline
+
+    # Circuit breakers (per upstream service)
+    circuit_failure_threshold: int = 5  # Consecutive failures that open the circuit
+    circuit_recovery_seconds: float = 30.0  # Open time before a half-open probe
+
     # API endpoints
     pubchem_base_url: str = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+    pubchem_pug_view_url: str = "https://pubchem.ncbi.nlm.nih.gov/rest/pug_view"
     chembl_base_url: str = "https://www.ebi.ac.uk/chembl/api/data"
     reactome_base_url: str = "https://reactome.org/ContentService"
     open_targets_url: str = "https://api.platform.opentargets.org/api/v4/graphql"
@@ -55,6 +122,11 @@ class Settings(BaseSettings):
     deeplearning_model_path: str = "/tmp/biopath_models"  # Use /tmp for Railway compatibility
     deeplearning_use_gpu: bool = False  # Disabled for Railway (no GPU available)
 
+    # Request deadlines (seconds) applied at the API boundary; optional stages
+    # are skipped and a partial report is returned when they run out
+    analyze_sync_deadline_seconds: float = 45.0
+    plant_analysis_deadline_seconds: float = 90.0
+
     # Retry configuration
     max_retries: int = 3
     retry_backoff_factor: float = 2.0
@@ -65,6 +137,13 @@ class Settings(BaseSettings):
 
     # PlantNet API (for plant identification from images)
     plantnet_api_key: Optional[str] = None
+    max_upload_bytes: int = 15 * 1024 * 1024  # Largest accepted image (decoded size)
+    upload_spool_max_memory: int = 1024 * 1024  # Uploads beyond this spool to disk
+    plantnet_max_image_side: int = 1280  # Longest side uploaded; PlantNet downsizes beyond this
+    plantnet_jpeg_quality: int = 85
+    plantnet_cache_ttl: int = 86400 * 30  # Identification results per image
+    plantnet_phash_max_distance: int = 6  # dHash bits that may differ for a near-duplicate hit
+    plantnet_phash_index_size: int = 2000  # Recent image hashes scanned for near-duplicates
 
     # Scoring weights
     measured_target_weight: float = 1.0
@@ -8,6 +8,7 @@ from app.data.plant_compounds import (
     search_plant_fuzzy,
     get_all_compound_names,
     get_plants_by_compound,
+    get_catalog_version,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "search_plant_fuzzy",
     "get_all_compound_names",
     "get_plants_by_compound",
+    "get_catalog_version",
 ]
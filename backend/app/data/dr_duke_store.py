@@ -0,0 +1,405 @@
+"""Local SQLite copy of Dr. Duke's Phytochemical and Ethnobotanical Databases
+
+The USDA publishes the full database as CSV downloads. ``import_csv_dir``
+loads the tables BioPath uses into one indexed SQLite file, and
+``DrDukeStore`` answers the Dr. Duke client's lookups from it:
+
+    FNFTAX.csv        plants (FNFNUM, TAXON, FAMILY)
+    COMMON_NAMES.csv  plant common names (FNFNUM, CNNAM)
+    FARMACY_NEW.csv   chemicals per plant, with part and ppm range
+    CHEMICALS.csv     chemical names and CAS numbers
+    AGGREGAC.csv      biological activities per chemical
+
+Column names are matched case-insensitively, with the aliases below for
+the spellings used across releases. The store is read-only at runtime;
+without an imported file every lookup returns None and the client falls
+back to scraping.
+"""
+
+import csv
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = "1"
+
+SCHEMA = """
+CREATE TABLE plants (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    family TEXT
+);
+CREATE TABLE common_names (
+    plant_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL
+);
+CREATE TABLE chemicals (
+    chemical_key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    cas_number TEXT
+);
+CREATE TABLE plant_chemicals (
+    plant_id TEXT NOT NULL,
+    chemical_key TEXT NOT NULL,
+    plant_part TEXT,
+    ppm_low REAL,
+    ppm_high REAL
+);
+CREATE TABLE chemical_activities (
+    chemical_key TEXT NOT NULL,
+    activity TEXT NOT NULL,
+    activity_key TEXT NOT NULL,
+    dosage TEXT
+);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+INDEXES = """
+CREATE INDEX idx_plants_name ON plants(name_key);
+CREATE INDEX idx_common_names_name ON common_names(name_key);
+CREATE INDEX idx_common_names_plant ON common_names(plant_id);
+CREATE INDEX idx_plant_chemicals_plant ON plant_chemicals(plant_id);
+CREATE INDEX idx_plant_chemicals_chemical ON plant_chemicals(chemical_key);
+CREATE INDEX idx_activities_chemical ON chemical_activities(chemical_key);
+CREATE INDEX idx_activities_activity ON chemical_activities(activity_key);
+"""
+
+# Accepted column names per field (first present wins)
+COLUMNS = {
+    "plant_id": ("FNFNUM", "FNF_NUM", "PLANT_ID"),
+    "taxon": ("TAXON", "PLANT", "SCIENTIFIC_NAME"),
+    "family": ("FAMILY",),
+    "common_name": ("CNNAM", "COMMON_NAME", "CNNAME"),
+    "chemical": ("CHEM", "CHEMICAL"),
+    "cas_number": ("CASNUM", "CAS", "CAS_NUMBER"),
+    "plant_part": ("PPLNTPART", "PLNTPART", "PLANT_PART", "PART"),
+    "ppm_low": ("PPMLOW", "PPM_LOW", "LOW"),
+    "ppm_high": ("PPMHIGH", "PPM_HIGH", "HIGH"),
+    "activity": ("ACTIVITY",),
+    "dosage": ("DOSAGE",),
+}
+
+
+def name_key(value: str) -> str:
+    """Normalized lookup key: case- and whitespace-insensitive"""
+    return " ".join(value.split()).casefold()
+
+
+def _float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value.replace(",", "")) if value and value.strip() else None
+    except ValueError:
+        return None
+
+
+def _read_rows(path: Path, fields: Sequence[str]) -> Iterator[Dict[str, Optional[str]]]:
+    """Rows of a Dr. Duke CSV mapped to the requested fields"""
+    with open(path, newline="", encoding="utf-8", errors="replace") as f:
+        reader = csv.DictReader(f)
+        header = {column.strip().upper(): column for column in reader.fieldnames or []}
+        mapping = {
+            field: next((header[alias] for alias in COLUMNS[field] if alias in header), None)
+            for field in fields
+        }
+        missing = [field for field, column in mapping.items() if column is None]
+        if missing:
+            logger.warning(f"{path.name}: no column for {', '.join(missing)}")
+
+        for row in reader:
+            yield {
+                field: (row.get(column) or "").strip() or None if column else None
+                for field, column in mapping.items()
+            }
+
+
+def _find_csv(directory: Path, stem: str) -> Optional[Path]:
+    """Case-insensitive lookup of <stem>.csv in directory"""
+    for path in directory.iterdir():
+        if path.suffix.lower() == ".csv" and path.stem.upper() == stem:
+            return path
+    return None
+
+
+def import_csv_dir(directory: Path, db_path: Path) -> Dict[str, int]:
+    """
+    Build the SQLite store from a directory of Dr. Duke CSV files.
+
+    The database is written to a temporary file and moved into place when
+    complete, so a running API never sees a half-imported store.
+
+    Args:
+        directory: Directory containing the extracted CSV files
+        db_path: Destination SQLite file (replaced if it exists)
+
+    Returns:
+        Row counts per table
+
+    Raises:
+        FileNotFoundError: FNFTAX.csv or FARMACY_NEW.csv is missing
+    """
+    directory = Path(directory)
+    db_path = Path(db_path)
+    required = {stem: _find_csv(directory, stem) for stem in ("FNFTAX", "FARMACY_NEW")}
+    for stem, path in required.items():
+        if path is None:
+            raise FileNotFoundError(f"{stem}.csv not found in {directory}")
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_suffix(db_path.suffix + ".importing")
+    tmp_path.unlink(missing_ok=True)
+
+    counts = {}
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + SCHEMA)
+
+        def load(table: str, sql: str, rows: Iterable[tuple]) -> None:
+            cursor = conn.executemany(sql, rows)
+            counts[table] = counts.get(table, 0) + cursor.rowcount
+
+        load("plants", "INSERT OR IGNORE INTO plants VALUES (?, ?, ?, ?)", (
+            (row["plant_id"], row["taxon"], name_key(row["taxon"]), row["family"])
+            for row in _read_rows(required["FNFTAX"], ("plant_id", "taxon", "family"))
+            if row["plant_id"] and row["taxon"]
+        ))
+
+        common_names = _find_csv(directory, "COMMON_NAMES")
+        if common_names:
+            load("common_names", "INSERT INTO common_names VALUES (?, ?, ?)", (
+                (row["plant_id"], row["common_name"], name_key(row["common_name"]))
+                for row in _read_rows(common_names, ("plant_id", "common_name"))
+                if row["plant_id"] and row["common_name"]
+            ))
+
+        chemicals = _find_csv(directory, "CHEMICALS")
+        if chemicals:
+            load("chemicals", "INSERT OR IGNORE INTO chemicals VALUES (?, ?, ?)", (
+                (name_key(row["chemical"]), row["chemical"], row["cas_number"])
+                for row in _read_rows(chemicals, ("chemical", "cas_number"))
+                if row["chemical"]
+            ))
+
+        # Chemicals only named in FARMACY_NEW still need a display name
+        chemical_names: Dict[str, str] = {}
+
+        def plant_chemicals() -> Iterator[tuple]:
+            fields = ("plant_id", "chemical", "plant_part", "ppm_low", "ppm_high")
+            for row in _read_rows(required["FARMACY_NEW"], fields):
+                if row["plant_id"] and row["chemical"]:
+                    key = name_key(row["chemical"])
+                    chemical_names.setdefault(key, row["chemical"])
+                    yield (row["plant_id"], key, row["plant_part"], _float(row["ppm_low"]), _float(row["ppm_high"]))
+
+        load("plant_chemicals", "INSERT INTO plant_chemicals VALUES (?, ?, ?, ?, ?)", plant_chemicals())
+        conn.executemany(
+            "INSERT OR IGNORE INTO chemicals (chemical_key, name) VALUES (?, ?)", chemical_names.items()
+        )
+
+        activities = _find_csv(directory, "AGGREGAC")
+        if activities:
+            load("chemical_activities", "INSERT INTO chemical_activities VALUES (?, ?, ?, ?)", (
+                (name_key(row["chemical"]), row["activity"], name_key(row["activity"]), row["dosage"])
+                for row in _read_rows(activities, ("chemical", "activity", "dosage"))
+                if row["chemical"] and row["activity"]
+            ))
+
+        conn.executescript(INDEXES)
+        conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (SCHEMA_VERSION,))
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    logger.info(f"Imported Dr. Duke's database into {db_path}: {counts}")
+    return counts
+
+
+class DrDukeStore:
+    """
+    Read-only queries against the imported Dr. Duke's database.
+
+    Each lookup returns None when no store has been imported (or the
+    schema is outdated), so callers can fall back to scraping.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._available: Optional[bool] = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Per-thread read-only connection, or None without a usable store"""
+        if self._available is False:
+            return None
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        if not self.path.exists():
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Dr. Duke store at {self.path} is unusable: {e}")
+            self._available = False
+            return None
+        if not version or version[0] != SCHEMA_VERSION:
+            logger.warning(f"Dr. Duke store at {self.path} has an outdated schema; re-run the import")
+            conn.close()
+            self._available = False
+            return None
+
+        self._available = True
+        self._local.conn = conn
+        return conn
+
+    @property
+    def available(self) -> bool:
+        return self._connection() is not None
+
+    def reset(self) -> None:
+        """Forget connections and availability (after a re-import or path change)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local = threading.local()
+        self._available = None
+
+    def search_plant(self, plant_name: str, limit: int = 50) -> Optional[Dict[str, Any]]:
+        """
+        Find a plant by scientific or common name, with its chemicals.
+
+        Exact names win; otherwise the first scientific name starting with
+        the query. Chemicals are ordered by highest reported concentration.
+
+        Returns:
+            Dict with scientific_name, common_names and chemicals (name,
+            cas_number, plant_parts, concentration_low/high), or None
+        """
+        conn = self._connection()
+        if conn is None:
+            return None
+
+        key = name_key(plant_name)
+        row = (
+            conn.execute("SELECT id, name FROM plants WHERE name_key = ? LIMIT 1", (key,)).fetchone()
+            or conn.execute(
+                "SELECT p.id, p.name FROM common_names c JOIN plants p ON p.id = c.plant_id "
+                "WHERE c.name_key = ? LIMIT 1", (key,)
+            ).fetchone()
+            or conn.execute(
+                "SELECT id, name FROM plants WHERE name_key LIKE ? ESCAPE '\\' ORDER BY length(name_key) LIMIT 1",
+                (key.replace("%", "\\%").replace("_", "\\_") + "%",)
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        plant_id, scientific_name = row
+
+        common_names = [
+            name for (name,) in conn.execute(
+                "SELECT DISTINCT name FROM common_names WHERE plant_id = ? LIMIT 10", (plant_id,)
+            )
+        ]
+        chemicals = [
+            {
+                "name": name,
+                "cas_number": cas_number,
+                "plant_parts": parts.split(",") if parts else [],
+                "concentration_low": low,
+                "concentration_high": high,
+            }
+            for name, cas_number, parts, low, high in conn.execute(
+                """
+                SELECT c.name, c.cas_number, group_concat(DISTINCT pc.plant_part),
+                       min(pc.ppm_low), max(pc.ppm_high)
+                FROM plant_chemicals pc JOIN chemicals c ON c.chemical_key = pc.chemical_key
+                WHERE pc.plant_id = ?
+                GROUP BY pc.chemical_key
+                ORDER BY max(coalesce(pc.ppm_high, pc.ppm_low)) IS NULL,
+                         max(coalesce(pc.ppm_high, pc.ppm_low)) DESC, c.name
+                LIMIT ?
+                """,
+                (plant_id, limit)
+            )
+        ]
+
+        return {
+            "scientific_name": scientific_name,
+            "common_names": common_names,
+            "chemicals": chemicals,
+        }
+
+    def chemical_activities(self, chemical_name: str, limit: int = 30) -> Optional[List[str]]:
+        """Biological activities recorded for a chemical, or None without a store"""
+        conn = self._connection()
+        if conn is None:
+            return None
+        return [
+            activity for (activity,) in conn.execute(
+                "SELECT activity FROM chemical_activities WHERE chemical_key = ? "
+                "GROUP BY activity_key ORDER BY activity LIMIT ?",
+                (name_key(chemical_name), limit)
+            )
+        ]
+
+    def compound_concentrations(self, chemical_name: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """Reported plant tissue concentrations (ppm) of a chemical, highest first"""
+        conn = self._connection()
+        if conn is None:
+            return None
+        return [
+            {
+                "plant_part": part.capitalize() if part else None,
+                "concentration_low": low,
+                "concentration_high": high,
+                "unit": "ppm",
+            }
+            for part, low, high in conn.execute(
+                """
+                SELECT DISTINCT plant_part, ppm_low, ppm_high FROM plant_chemicals
+                WHERE chemical_key = ? AND (ppm_low IS NOT NULL OR ppm_high IS NOT NULL)
+                ORDER BY coalesce(ppm_high, ppm_low) DESC
+                LIMIT ?
+                """,
+                (name_key(chemical_name), limit)
+            )
+        ]
+
+    def chemicals_by_activity(self, activity: str, limit: int = 30) -> Optional[List[Dict[str, Any]]]:
+        """Chemicals with an activity (exact, else containing the query)"""
+        conn = self._connection()
+        if conn is None:
+            return None
+
+        key = name_key(activity)
+        query = """
+            SELECT c.name, c.cas_number, ca.activity FROM chemical_activities ca
+            JOIN chemicals c ON c.chemical_key = ca.chemical_key
+            WHERE ca.activity_key {condition}
+            GROUP BY ca.chemical_key ORDER BY c.name LIMIT ?
+        """
+        rows = conn.execute(query.format(condition="= ?"), (key, limit)).fetchall()
+        if not rows:
+            pattern = "%" + key.replace("%", "\\%").replace("_", "\\_") + "%"
+            rows = conn.execute(query.format(condition="LIKE ? ESCAPE '\\'"), (pattern, limit)).fetchall()
+
+        return [
+            {"name": name, "cas_number": cas_number, "activities": [matched]}
+            for name, cas_number, matched in rows
+        ]
+
+
+# Singleton instance
+dr_duke_store = DrDukeStore(settings.dr_duke_db_path)
@@ -0,0 +1,252 @@
+"""Packed, versioned storage for the plant compound catalog
+
+The catalog lives in ``plant_compounds.sqlite3`` next to this module
+rather than in Python literals. It is opened read-only and memory-mapped,
+so importing costs nothing. Pages are shared between workers through the
+OS page cache, and plant records are built only when they are looked up.
+Scientific names, common names, families and compound names are stored
+lowercased for indexed and substring lookups.
+
+``data_version`` is a hash of the catalog contents. Anything derived from
+the catalog (listings, ETags, aggregates) can key off it. Rebuild the file
+with ``python -m app.cli.plant_catalog build catalog.json``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = Path(__file__).with_name("plant_compounds.sqlite3")
+
+SCHEMA_VERSION = "1"
+
+# Memory-map up to this many bytes of the file (shared across processes)
+MMAP_BYTES = 256 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE plants (
+    id INTEGER PRIMARY KEY,
+    name_key TEXT NOT NULL UNIQUE,
+    scientific_name TEXT NOT NULL,
+    family TEXT NOT NULL,
+    family_key TEXT NOT NULL,
+    common_names TEXT NOT NULL,
+    common_names_key TEXT NOT NULL,
+    traditional_uses TEXT NOT NULL,
+    parts_used TEXT NOT NULL
+);
+CREATE TABLE compounds (
+    plant_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    chembl_id TEXT,
+    research_level REAL NOT NULL,
+    drug_interaction_risk REAL NOT NULL,
+    bioactivity_strength REAL NOT NULL,
+    health_impact_potential REAL NOT NULL,
+    lifestyle_categories TEXT NOT NULL,
+    PRIMARY KEY (plant_id, position)
+) WITHOUT ROWID;
+CREATE INDEX idx_compounds_name ON compounds(name_key);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+COMPOUND_COLUMNS = (
+    "name", "chembl_id", "research_level", "drug_interaction_risk",
+    "bioactivity_strength", "health_impact_potential", "lifestyle_categories",
+)
+
+
+def content_version(plants: List[Dict[str, Any]]) -> str:
+    """Short hash of catalog contents, used as its data version"""
+    canonical = json.dumps(plants, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def build_catalog(plants: Iterable[Dict[str, Any]], path: Path = CATALOG_PATH) -> str:
+    """
+    Write a catalog file from plant dicts (the shape of ``export_catalog``).
+
+    Plants keep the given order. The file is written under a temporary
+    name and then swapped in.
+
+    Returns:
+        The new data version
+    """
+    plants = list(plants)
+    version = content_version(plants)
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".building")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        for plant_id, plant in enumerate(plants, start=1):
+            conn.execute(
+                "INSERT INTO plants VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    plant_id,
+                    plant["scientific_name"].lower(),
+                    plant["scientific_name"],
+                    plant["family"],
+                    plant["family"].lower(),
+                    json.dumps(plant["common_names"]),
+                    "\n".join(name.lower() for name in plant["common_names"]),
+                    json.dumps(plant["traditional_uses"]),
+                    json.dumps(plant["parts_used"]),
+                )
+            )
+            conn.executemany(
+                "INSERT INTO compounds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        plant_id, position, compound["name"], compound["name"].lower(),
+                        compound.get("chembl_id"), compound["research_level"],
+                        compound["drug_interaction_risk"], compound["bioactivity_strength"],
+                        compound["health_impact_potential"], json.dumps(compound["lifestyle_categories"]),
+                    )
+                    for position, compound in enumerate(plant["compounds"])
+                )
+            )
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [("schema_version", SCHEMA_VERSION), ("data_version", version)]
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    return version
+
+
+class PlantCatalog(Mapping):
+    """
+    Read-only mapping of lowercase scientific name -> PlantCompoundInfo.
+
+    Behaves like the dict it replaces (``get``, ``items``, ``values``, ``in``,
+    ``len``, in catalog order). Lookups and searches run as SQLite queries,
+    and records are built on demand through a bounded LRU cache.
+
+    Args:
+        path: Catalog file
+        record_factory: Builds a record from (plant row, compound rows)
+    """
+
+    def __init__(self, path: Path, record_factory):
+        self.path = Path(path)
+        self._record_factory = record_factory
+        self._local = threading.local()
+        self._record = lru_cache(maxsize=4096)(self._load_record)
+        self._version: Optional[str] = None
+        self._modified_at: Optional[float] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread read-only connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+            conn.execute(f"PRAGMA mmap_size={MMAP_BYTES}")
+            schema = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if not schema or schema[0] != SCHEMA_VERSION:
+                conn.close()
+                raise RuntimeError(f"Plant catalog {self.path} has schema {schema}, expected {SCHEMA_VERSION}")
+            self._local.conn = conn
+        return conn
+
+    @property
+    def data_version(self) -> str:
+        """Content hash of the catalog"""
+        if self._version is None:
+            self._version = self._connection().execute(
+                "SELECT value FROM meta WHERE key = 'data_version'"
+            ).fetchone()[0]
+        return self._version
+
+    @property
+    def modified_at(self) -> float:
+        """When the catalog file was last written (Unix time)"""
+        if self._modified_at is None:
+            self._modified_at = self.path.stat().st_mtime
+        return self._modified_at
+
+    def reload(self) -> None:
+        """Drop connections and cached records (after the file is rebuilt)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local = threading.local()
+        self._record.cache_clear()
+        self._version = None
+        self._modified_at = None
+
+    def _load_record(self, plant_id: int):
+        conn = self._connection()
+        plant = conn.execute(
+            "SELECT scientific_name, common_names, family, traditional_uses, parts_used "
+            "FROM plants WHERE id = ?", (plant_id,)
+        ).fetchone()
+        compounds = conn.execute(
+            f"SELECT {', '.join(COMPOUND_COLUMNS)} FROM compounds WHERE plant_id = ? ORDER BY position",
+            (plant_id,)
+        ).fetchall()
+        return self._record_factory(plant, compounds)
+
+    def _records(self, sql: str, params: tuple = ()) -> List[Any]:
+        """Records for the plant ids a query returns, in its order"""
+        return [self._record(plant_id) for (plant_id,) in self._connection().execute(sql, params)]
+
+    def __getitem__(self, key: str):
+        row = self._connection().execute("SELECT id FROM plants WHERE name_key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._record(row[0])
+
+    def __iter__(self) -> Iterator[str]:
+        for (key,) in self._connection().execute("SELECT name_key FROM plants ORDER BY id"):
+            yield key
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT count(*) FROM plants").fetchone()[0]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._connection().execute(
+            "SELECT 1 FROM plants WHERE name_key = ?", (key,)
+        ).fetchone() is not None
+
+    def search_common_name(self, query: str) -> List[Any]:
+        """Plants with a common name containing query (lowercase)"""
+        return self._records(
+            "SELECT id FROM plants WHERE instr(common_names_key, ?) > 0 ORDER BY id", (query,)
+        )
+
+    def search_fuzzy(self, query: str) -> List[Any]:
+        """Plants whose scientific name, a common name or family contains query (lowercase)"""
+        return self._records(
+            "SELECT id FROM plants WHERE instr(name_key, ?) > 0 OR instr(common_names_key, ?) > 0 "
+            "OR instr(family_key, ?) > 0 ORDER BY id",
+            (query, query, query)
+        )
+
+    def plants_with_compound(self, query: str) -> List[Any]:
+        """Plants with a compound whose name contains query (lowercase)"""
+        return self._records(
+            "SELECT DISTINCT plant_id FROM compounds WHERE instr(name_key, ?) > 0 ORDER BY plant_id",
+            (query,)
+        )
+
+    def compound_names(self) -> List[str]:
+        """Distinct compound names, sorted"""
+        return [name for (name,) in self._connection().execute("SELECT DISTINCT name FROM compounds ORDER BY name")]
@@ -1,12 +1,16 @@
 """FastAPI application for BioPath"""
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, File, UploadFile, Form, Request
-from fastapi.responses import JSONResponse, FileResponse, Response
+from fastapi import FastAPI, HTTPException, BackgroundTasks, File, UploadFile, Form, Request, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 import uuid
+import asyncio
 import logging
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import Optional, List
 from pathlib import Path
 
@@ -24,10 +28,22 @@ from app.services.plant_identification import plant_identification_service
 from app.services.drug_interaction_service import drug_interaction_service
 from app.services.side_effects_service import side_effects_service
 from app.services.dosage_service import dosage_service
+from app.services.job_dedup import canonical_input_hash, job_deduplicator
+from app.utils.circuit_breaker import breaker_states
+from app.utils.compression import CompressionMiddleware
+from app.utils.deadline import request_deadline, run_in_context
+from app.utils.metrics import metrics
+from app.utils.uploads import UploadLimitMiddleware, image_buffer, read_base64_image_request
 
 # Try to import Celery, but don't fail if it's unavailable
 try:
-    from app.tasks.celery_tasks import analyze_ingredient_task, celery_app
+    from app.tasks.celery_tasks import (
+        analyze_ingredient_task,
+        celery_app,
+        broker_priority,
+        enqueue_headers,
+        get_queue_depths,
+    )
 except Exception as e:
     logger_temp = logging.getLogger(__name__)
     logger_temp.warning(f"Could not import Celery: {e}. Async tasks will be unavailable.")
@@ -36,13 +52,14 @@ except Exception as e:
 
 from app.clients.reactome import ReactomeClient
 from app.data.plant_compounds import (
-    get_plant_compounds,
     search_plant_fuzzy,
     get_plants_by_compound,
     get_prioritized_compounds,
     compound_to_dict,
-    PLANT_COMPOUNDS_DB
 )
+from app.services.plant_listing import InvalidListingRequest, plant_listing_service
+from app.utils.http_cache import cached_response
+from app.utils.responses import FastJSONResponse, RawJSONResponse, dumps, model_json
 
 # Configure logging
 logging.basicConfig(
@@ -57,9 +74,15 @@ app = FastAPI(
     version=settings.app_version,
     description="Chemical-Target-Pathway Analysis Framework",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse
 )
 
+# Reject oversized image uploads before their bodies are parsed. Added first so
+# it sits inside the CORS middleware and size errors surface as plain 413s.
+app.add_middleware(UploadLimitMiddleware)
+
+
 # Custom middleware to handle CORS
 @app.middleware("http")
 async def cors_middleware(request: Request, call_next):
@@ -87,6 +110,12 @@ async def cors_middleware(request: Request, call_next):
     return response
 
 
+# Compress large JSON/NDJSON bodies per Accept-Encoding. Added last so it is the
+# outermost middleware and sees the final headers (ETag, CORS).
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+
+
 # In-memory job store (in production, use Redis)
 jobs_store = {}
 
@@ -96,6 +125,7 @@ class AnalyzeResponse(BaseModel):
     job_id: str
     status: str
     message: str
+    deduplicated: bool = False
 
 
 @app.get("/health")
@@ -152,21 +182,28 @@ async def analyze_sync(ingredient_input: IngredientInput):
         logger.info(f"Sync analysis request: {ingredient_input.ingredient_name}")
 
         service = AnalysisService()
-        report = service.analyze_ingredient(ingredient_input)
-
-        # Check personalized drug interactions if medications provided
-        if ingredient_input.user_medications:
-            logger.info(f"Checking interactions with {len(ingredient_input.user_medications)} medications")
-            personalized_interactions = drug_interaction_service.check_compound_medication_interactions(
-                compound_name=report.ingredient_name,
-                medication_names=ingredient_input.user_medications,
-                targets=report.known_targets,
-                pathways=report.pathways
-            )
-            report.personalized_interactions = personalized_interactions
-            logger.info(f"Found {len(personalized_interactions)} interactions")
+        if not ingredient_input.user_medications:
+            # Nothing to add to the report: send its encoded JSON (as cached) directly
+            with request_deadline(settings.analyze_sync_deadline_seconds):
+                body = service.analyze_ingredient_json(ingredient_input)
+            return RawJSONResponse(body)
+
+        with request_deadline(settings.analyze_sync_deadline_seconds):
+            report = service.analyze_ingredient(ingredient_input)
+
+        # Check personalized drug interactions
+        logger.info(f"Checking interactions with {len(ingredient_input.user_medications)} medications")
+        personalized_interactions = drug_interaction_service.check_compound_medication_interactions(
+            compound_name=report.ingredient_name,
+            medication_names=ingredient_input.user_medications,
+            targets=report.known_targets,
+            pathways=report.pathways
+        )
+        report.personalized_interactions = personalized_interactions
+        logger.info(f"Found {len(personalized_interactions)} interactions")
 
-        return report
+        # Built here from validated parts: skip response_model re-validation
+        return FastJSONResponse(report)
 
     except Exception as e:
         logger.error(f"Sync analysis error: {e}", exc_info=True)
@@ -177,15 +214,24 @@ async def analyze_sync(ingredient_input: IngredientInput):
 
 
 @app.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_async(ingredient_input: IngredientInput):
+async def analyze_async(
+    ingredient_input: IngredientInput,
+    priority: int = Query(
+        default=settings.celery_default_priority,
+        ge=0,
+        le=settings.celery_max_priority,
+        description="Job priority on the interactive queue (higher runs first)"
+    )
+):
     """
     Asynchronous analysis endpoint.
 
-    Submits analysis job to Celery queue and returns job_id.
+    Submits analysis job to the interactive Celery queue and returns job_id.
     Use /results/{job_id} to retrieve results.
 
     Args:
         ingredient_input: Ingredient name and options
+        priority: Job priority (0 = lowest)
 
     Returns:
         AnalyzeResponse with job_id
@@ -198,8 +244,39 @@ async def analyze_async(ingredient_input: IngredientInput):
                 detail="Async analysis not available. Use /analyze_sync for synchronous analysis."
             )
 
-        # Generate job ID
+        # Attach to an identical in-flight or recently completed job if there is one
+        input_hash = canonical_input_hash(ingredient_input)
         job_id = str(uuid.uuid4())
+        existing_job_id = job_deduplicator.claim(input_hash, job_id)
+
+        if existing_job_id:
+            state = celery_app.AsyncResult(existing_job_id).state
+            if not job_deduplicator.is_reusable(input_hash, existing_job_id, state):
+                # The failed job was released; claim the hash for the new job unless
+                # a concurrent request got there first, in which case attach to its job
+                existing_job_id = job_deduplicator.claim(input_hash, job_id)
+                if existing_job_id:
+                    state = celery_app.AsyncResult(existing_job_id).state
+
+        if existing_job_id:
+            logger.info(
+                f"Async analysis request: {ingredient_input.ingredient_name} "
+                f"attached to existing job {existing_job_id} ({state})"
+            )
+            # The job may have been submitted through another API process
+            jobs_store.setdefault(existing_job_id, {
+                "job_id": existing_job_id,
+                "status": "pending",
+                "ingredient_name": ingredient_input.ingredient_name,
+                "task_id": existing_job_id,
+                "priority": priority
+            })
+            return AnalyzeResponse(
+                job_id=existing_job_id,
+                status="completed" if state == "SUCCESS" else "pending",
+                message="Identical analysis already submitted. Use GET /results/{job_id} to retrieve results.",
+                deduplicated=True
+            )
 
         logger.info(
             f"Async analysis request: {ingredient_input.ingredient_name} "
@@ -207,17 +284,26 @@ async def analyze_async(ingredient_input: IngredientInput):
         )
 
         # Submit to Celery
-        task = analyze_ingredient_task.apply_async(
-            args=[ingredient_input.model_dump()],
-            task_id=job_id
-        )
+        try:
+            task = analyze_ingredient_task.apply_async(
+                args=[ingredient_input.model_dump()],
+                task_id=job_id,
+                queue=settings.celery_interactive_queue,
+                priority=broker_priority(priority),
+                headers=enqueue_headers()
+            )
+        except Exception:
+            # Don't let later submissions attach to a job that was never queued
+            job_deduplicator.release(input_hash, job_id)
+            raise
 
         # Store job info
         jobs_store[job_id] = {
             "job_id": job_id,
             "status": "pending",
             "ingredient_name": ingredient_input.ingredient_name,
-            "task_id": task.id
+            "task_id": task.id,
+            "priority": priority
         }
 
         return AnalyzeResponse(
@@ -270,7 +356,8 @@ async def get_results(job_id: str):
         if task_result.ready():
             if task_result.successful():
                 status = "completed"
-                result = BodyImpactReport(**task_result.result)
+                # Dumped from a BodyImpactReport by our own worker; sent as-is
+                result = task_result.result
             else:
                 status = "failed"
                 error = str(task_result.info)
@@ -279,13 +366,14 @@ async def get_results(job_id: str):
 
         job_info = jobs_store[job_id]
 
-        return AnalysisJob(
+        job = AnalysisJob(
             job_id=job_id,
             status=status,
             ingredient_name=job_info["ingredient_name"],
-            result=result,
             error=error
-        )
+        ).model_dump(mode="json")
+        job["result"] = result
+        return FastJSONResponse(job)
 
     except HTTPException:
         raise
@@ -313,35 +401,89 @@ async def list_jobs():
     return {"jobs": list(jobs_store.values())}
 
 
+@app.get("/metrics")
+def process_metrics():
+    """Latency percentiles, counters (upstream latencies, hedges) and circuit states for this API process"""
+    return {**metrics.snapshot(), "circuits": breaker_states()}
+
+
+@app.get("/metrics/queues")
+def queue_metrics():
+    """
+    Queue depth per analysis queue plus per-worker wait-time metrics.
+
+    Wait times (time from enqueue to task start) are reported by each
+    worker, so interactive p95 can be watched while a bulk backfill runs.
+    """
+    if not celery_app:
+        raise HTTPException(status_code=503, detail="Async analysis not available.")
+
+    try:
+        depths = get_queue_depths()
+    except Exception as e:
+        logger.warning(f"Could not read queue depths: {e}")
+        depths = {}
+
+    try:
+        replies = celery_app.control.broadcast("queue_metrics", reply=True, timeout=1.0) or []
+        workers = {name: snapshot for reply in replies for name, snapshot in reply.items()}
+    except Exception as e:
+        logger.warning(f"Could not collect worker metrics: {e}")
+        workers = {}
+
+    return {"queue_depths": depths, "workers": workers}
+
+
 # ============================================
 # Plant Identification API Endpoints
 # ============================================
 
-class PlantIdentifyRequest(BaseModel):
-    """Request for plant identification from base64 image"""
-    image_base64: str
+class PlantIdentifyOptions(BaseModel):
+    """Plant identification options (everything but the image)"""
     organs: Optional[List[str]] = None  # leaf, flower, fruit, bark, root
 
 
-class PlantAnalyzeRequest(BaseModel):
-    """Request for full plant analysis from base64 image"""
+class PlantIdentifyRequest(PlantIdentifyOptions):
+    """Request for plant identification from base64 image"""
     image_base64: str
+
+
+class PlantAnalyzeOptions(BaseModel):
+    """Full plant analysis options (everything but the image)"""
     organs: Optional[List[str]] = None
     max_compounds: int = 5
     enable_predictions: bool = False
     user_medications: Optional[List[str]] = None
 
 
-@app.post("/identify_plant")
-async def identify_plant(request: PlantIdentifyRequest):
+class PlantAnalyzeRequest(PlantAnalyzeOptions):
+    """Request for full plant analysis from base64 image"""
+    image_base64: str
+
+
+def json_body_schema(model) -> dict:
+    """OpenAPI request body for endpoints that stream their JSON body themselves"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+@app.post("/identify_plant", openapi_extra=json_body_schema(PlantIdentifyRequest))
+async def identify_plant(request: Request):
     """
     Identify a plant species from an image.
 
     Uses PlantNet API to identify the plant species, then looks up
     the plant in our compounds database.
 
+    The body (a PlantIdentifyRequest) is spooled and its base64 image
+    decoded incrementally rather than parsed into memory whole.
+
     Args:
-        request: PlantIdentifyRequest with base64 image data
+        request: Request with a PlantIdentifyRequest JSON body
 
     Returns:
         Plant identification results with species name and known compounds
@@ -349,10 +491,12 @@ async def identify_plant(request: PlantIdentifyRequest):
     try:
         logger.info("Plant identification request received")
 
-        result = plant_identification_service.identify_from_base64(
-            request.image_base64,
-            request.organs
-        )
+        options, image = await read_base64_image_request(request, PlantIdentifyOptions)
+        with image, image_buffer(image) as image_data:
+            result = plant_identification_service.identify_plant_from_image(
+                image_data,
+                options.organs
+            )
 
         if not result.success:
             return {
@@ -378,6 +522,8 @@ async def identify_plant(request: PlantIdentifyRequest):
 
         return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Plant identification error: {e}", exc_info=True)
         raise HTTPException(
@@ -410,9 +556,6 @@ async def identify_plant_upload(
                 detail="Invalid file type. Only JPEG and PNG images are supported."
             )
 
-        # Read file content
-        image_data = await file.read()
-
         # Parse organs if provided
         organs_list = None
         if organs:
@@ -420,10 +563,12 @@ async def identify_plant_upload(
 
         logger.info(f"Plant identification upload: {file.filename}")
 
-        result = plant_identification_service.identify_plant_from_image(
-            image_data,
-            organs_list
-        )
+        # The upload is already spooled (size-limited by UploadLimitMiddleware); view it in place
+        with image_buffer(file.file) as image_data:
+            result = plant_identification_service.identify_plant_from_image(
+                image_data,
+                organs_list
+            )
 
         if not result.success:
             return {
@@ -459,8 +604,148 @@ async def identify_plant_upload(
         )
 
 
-@app.post("/analyze_plant")
-async def analyze_plant(request: PlantAnalyzeRequest):
+def identification_to_dict(identification) -> dict:
+    """Serialize a PlantIdentificationResult for plant analysis responses"""
+    return {
+        "success": identification.success,
+        "scientific_name": identification.scientific_name,
+        "common_names": identification.common_names,
+        "family": identification.family,
+        "confidence": identification.confidence,
+        "error": identification.error
+    }
+
+
+def compound_analysis_to_dict(report, medications: Optional[List[str]]) -> dict:
+    """Summarize one compound's report, with personalized interactions if medications are given"""
+    compound_analysis = {
+        "compound_name": report.ingredient_name,
+        "targets_found": len(report.known_targets),
+        "pathways_found": len(report.pathways),
+        "top_pathways": [
+            {
+                "name": p.pathway_name,
+                "impact_score": p.impact_score,
+                "url": p.pathway_url
+            }
+            for p in report.pathways[:5]
+        ]
+    }
+
+    # Check personalized interactions if medications provided
+    if medications:
+        personalized_interactions = drug_interaction_service.check_compound_medication_interactions(
+            compound_name=report.ingredient_name,
+            medication_names=medications,
+            targets=report.known_targets,
+            pathways=report.pathways
+        )
+        compound_analysis["personalized_interactions"] = [
+            {
+                "medication_name": interaction.medication_name,
+                "severity": interaction.severity,
+                "mechanism": interaction.mechanism,
+                "clinical_effect": interaction.clinical_effect,
+                "recommendation": interaction.recommendation,
+                "evidence_level": interaction.evidence_level,
+                "shared_targets": interaction.shared_targets,
+                "shared_pathways": interaction.shared_pathways
+            }
+            for interaction in personalized_interactions
+        ]
+
+    return compound_analysis
+
+
+def plant_analysis_response(result, medications: Optional[List[str]]) -> FastJSONResponse:
+    """Format a PlantAnalysisResult with serialized compounds"""
+    return FastJSONResponse({
+        "identification": identification_to_dict(result.identification),
+        "compounds_found": [compound_to_dict(c) for c in result.compounds_found],
+        "compound_analyses": [compound_analysis_to_dict(r, medications) for r in result.compound_reports],
+        "aggregate_pathways": result.aggregate_pathways,
+        "summary": result.summary,
+    })
+
+
+def plant_analysis_stream(options: PlantAnalyzeOptions, image) -> StreamingResponse:
+    """
+    Stream a plant analysis as NDJSON events.
+
+    Lines, in order: one "identification" event (with compounds_found), one
+    "compound" event per compound as its analysis completes, and a final
+    "aggregate" event with aggregate_pathways and summary.
+    """
+    async def events():
+        # The analysis generator runs on one dedicated thread that also owns its
+        # cleanup: a disconnect cancels this coroutine mid-step, but the step
+        # itself keeps running, so closing the generator and releasing the
+        # image must wait until it returns (closing a running generator raises,
+        # and releasing the buffer would pull memory out from under it)
+        worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plant-stream")
+        resources = ExitStack()
+        resources.enter_context(image)
+        image_data = resources.enter_context(image_buffer(image))
+        stream = plant_identification_service.stream_plant_analysis(
+            image_data,
+            options.organs,
+            options.max_compounds,
+            options.enable_predictions
+        )
+        with request_deadline(settings.plant_analysis_deadline_seconds):
+            step = run_in_context(next)
+
+        def close():
+            # Cancels outstanding compound work, then frees the image
+            try:
+                stream.close()
+            finally:
+                resources.close()
+
+        try:
+            while True:
+                # Each step blocks on upstream I/O; keep it off the event loop
+                event = await asyncio.wrap_future(worker.submit(step, stream, None))
+                if event is None:
+                    break
+
+                if event.kind == "identification":
+                    line = {
+                        "event": "identification",
+                        "identification": identification_to_dict(event.identification),
+                        "compounds_found": [compound_to_dict(c) for c in event.compounds_found],
+                    }
+                elif event.kind == "compound":
+                    line = {
+                        "event": "compound",
+                        "compound_analysis": await run_in_threadpool(
+                            compound_analysis_to_dict, event.report, options.user_medications
+                        ),
+                    }
+                else:
+                    line = {
+                        "event": "aggregate",
+                        "aggregate_pathways": event.result.aggregate_pathways,
+                        "summary": event.result.summary,
+                    }
+                yield dumps(line) + b"\n"
+        except Exception as e:
+            logger.error(f"Streaming plant analysis error: {e}", exc_info=True)
+            yield dumps({"event": "error", "detail": f"Plant analysis failed: {str(e)}"}) + b"\n"
+        finally:
+            # Queued behind any in-flight step; nothing here awaits, so it
+            # also runs when the client disconnected and we were cancelled
+            worker.submit(close)
+            worker.shutdown(wait=False)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.post("/analyze_plant", openapi_extra=json_body_schema(PlantAnalyzeRequest))
+async def analyze_plant(
+    request: Request,
+    stream: bool = Query(False, description="Stream NDJSON events as each compound completes")
+):
     """
     Complete pipeline: identify plant from image and analyze its compounds.
 
@@ -471,8 +756,14 @@ async def analyze_plant(request: PlantAnalyzeRequest):
     4. Optionally checks personalized drug interactions with user medications
     5. Returns aggregated results
 
+    With ``stream=true`` the response is NDJSON: the identification first,
+    then each compound's analysis as it completes, and the aggregated
+    pathways and summary last.
+
     Args:
-        request: PlantAnalyzeRequest with base64 image and options (includes optional user_medications)
+        request: Request with a PlantAnalyzeRequest JSON body (base64 image and
+            options, including optional user_medications); streamed like /identify_plant
+        stream: Stream results as NDJSON events instead of one JSON response
 
     Returns:
         Complete plant analysis with compound pathways and personalized interactions
@@ -480,72 +771,23 @@ async def analyze_plant(request: PlantAnalyzeRequest):
     try:
         logger.info("Full plant analysis request received")
 
-        result = plant_identification_service.analyze_plant_from_base64(
-            request.image_base64,
-            request.organs,
-            request.max_compounds,
-            request.enable_predictions
-        )
-
-        # Format response with serialized compounds
-        response = {
-            "identification": {
-                "success": result.identification.success,
-                "scientific_name": result.identification.scientific_name,
-                "common_names": result.identification.common_names,
-                "family": result.identification.family,
-                "confidence": result.identification.confidence,
-                "error": result.identification.error
-            },
-            "compounds_found": [compound_to_dict(c) for c in result.compounds_found],
-            "compound_analyses": []
-        }
-
-        # Analyze each compound and optionally check interactions
-        for report in result.compound_reports:
-            compound_analysis = {
-                "compound_name": report.ingredient_name,
-                "targets_found": len(report.known_targets),
-                "pathways_found": len(report.pathways),
-                "top_pathways": [
-                    {
-                        "name": p.pathway_name,
-                        "impact_score": p.impact_score,
-                        "url": p.pathway_url
-                    }
-                    for p in report.pathways[:5]
-                ]
-            }
-
-            # Check personalized interactions if medications provided
-            if request.user_medications:
-                personalized_interactions = drug_interaction_service.check_compound_medication_interactions(
-                    compound_name=report.ingredient_name,
-                    medication_names=request.user_medications,
-                    targets=report.known_targets,
-                    pathways=report.pathways
-                )
-                compound_analysis["personalized_interactions"] = [
-                    {
-                        "medication_name": interaction.medication_name,
-                        "severity": interaction.severity,
-                        "mechanism": interaction.mechanism,
-                        "clinical_effect": interaction.clinical_effect,
-                        "recommendation": interaction.recommendation,
-                        "evidence_level": interaction.evidence_level,
-                        "shared_targets": interaction.shared_targets,
-                        "shared_pathways": interaction.shared_pathways
-                    }
-                    for interaction in personalized_interactions
-                ]
-
-            response["compound_analyses"].append(compound_analysis)
-
-        response["aggregate_pathways"] = result.aggregate_pathways
-        response["summary"] = result.summary
+        options, image = await read_base64_image_request(request, PlantAnalyzeOptions)
+        if stream:
+            return plant_analysis_stream(options, image)
+
+        with image, image_buffer(image) as image_data, \
+                request_deadline(settings.plant_analysis_deadline_seconds):
+            result = plant_identification_service.analyze_plant_from_image(
+                image_data,
+                options.organs,
+                options.max_compounds,
+                options.enable_predictions
+            )
 
-        return response
+        return plant_analysis_response(result, options.user_medications)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Plant analysis error: {e}", exc_info=True)
         raise HTTPException(
@@ -584,9 +826,6 @@ async def analyze_plant_upload(
                 detail="Invalid file type. Only JPEG and PNG images are supported."
             )
 
-        # Read file content
-        image_data = await file.read()
-
         # Parse organs if provided
         organs_list = None
         if organs:
@@ -599,71 +838,17 @@ async def analyze_plant_upload(
 
         logger.info(f"Full plant analysis upload: {file.filename}")
 
-        result = plant_identification_service.analyze_plant_from_image(
-            image_data,
-            organs_list,
-            max_compounds,
-            enable_predictions
-        )
-
-        # Format response with serialized compounds (same as analyze_plant)
-        response = {
-            "identification": {
-                "success": result.identification.success,
-                "scientific_name": result.identification.scientific_name,
-                "common_names": result.identification.common_names,
-                "family": result.identification.family,
-                "confidence": result.identification.confidence,
-                "error": result.identification.error
-            },
-            "compounds_found": [compound_to_dict(c) for c in result.compounds_found],
-            "compound_analyses": []
-        }
-
-        # Analyze each compound and optionally check interactions
-        for report in result.compound_reports:
-            compound_analysis = {
-                "compound_name": report.ingredient_name,
-                "targets_found": len(report.known_targets),
-                "pathways_found": len(report.pathways),
-                "top_pathways": [
-                    {
-                        "name": p.pathway_name,
-                        "impact_score": p.impact_score,
-                        "url": p.pathway_url
-                    }
-                    for p in report.pathways[:5]
-                ]
-            }
-
-            # Check personalized interactions if medications provided
-            if medications_list:
-                personalized_interactions = drug_interaction_service.check_compound_medication_interactions(
-                    compound_name=report.ingredient_name,
-                    medication_names=medications_list,
-                    targets=report.known_targets,
-                    pathways=report.pathways
-                )
-                compound_analysis["personalized_interactions"] = [
-                    {
-                        "medication_name": interaction.medication_name,
-                        "severity": interaction.severity,
-                        "mechanism": interaction.mechanism,
-                        "clinical_effect": interaction.clinical_effect,
-                        "recommendation": interaction.recommendation,
-                        "evidence_level": interaction.evidence_level,
-                        "shared_targets": interaction.shared_targets,
-                        "shared_pathways": interaction.shared_pathways
-                    }
-                    for interaction in personalized_interactions
-                ]
-
-            response["compound_analyses"].append(compound_analysis)
-
-        response["aggregate_pathways"] = result.aggregate_pathways
-        response["summary"] = result.summary
+        # The upload is already spooled (size-limited by UploadLimitMiddleware); view it in place
+        with image_buffer(file.file) as image_data, \
+                request_deadline(settings.plant_analysis_deadline_seconds):
+            result = plant_identification_service.analyze_plant_from_image(
+                image_data,
+                organs_list,
+                max_compounds,
+                enable_predictions
+            )
 
-        return response
+        return plant_analysis_response(result, medications_list)
 
     except HTTPException:
         raise
@@ -676,30 +861,38 @@ async def analyze_plant_upload(
 
 
 @app.get("/api/plants")
-async def list_plants():
+async def list_plants(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000, description="Plants per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields (default: scientific_name,common_names,family,compound_count)"
+    )
+):
     """
-    List all plants in the compounds database.
+    List plants in the compounds database, sorted by name.
+
+    Pages are precomputed per catalog version and carry a strong ETag and
+    the catalog's Last-Modified date; send either back (If-None-Match or
+    If-Modified-Since) to get 304 Not Modified.
 
     Returns:
-        List of plants with their scientific and common names
+        total, count, plants (projected to fields) and next_cursor (null on the last page)
     """
-    plants = []
-    for scientific_name, info in PLANT_COMPOUNDS_DB.items():
-        plants.append({
-            "scientific_name": info.scientific_name,
-            "common_names": info.common_names,
-            "family": info.family,
-            "compound_count": len(info.compounds)
-        })
-
-    return {
-        "total": len(plants),
-        "plants": sorted(plants, key=lambda x: x["scientific_name"])
-    }
+    try:
+        body, etag = plant_listing_service.listing_page(limit, cursor, fields)
+    except InvalidListingRequest as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return cached_response(request, body, etag, last_modified=plant_listing_service.last_modified)
 
 
 @app.get("/api/plants/search")
-async def search_plants(q: str):
+async def search_plants(
+    request: Request,
+    q: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return per plant")
+):
     """
     Search plants by name (scientific, common, or family).
 
@@ -709,26 +902,15 @@ async def search_plants(q: str):
     Returns:
         Matching plants with compounds sorted by priority
     """
-    results = search_plant_fuzzy(q)
-
-    return {
-        "query": q,
-        "count": len(results),
-        "results": [
-            {
-                "scientific_name": p.scientific_name,
-                "common_names": p.common_names,
-                "family": p.family,
-                "compounds": [compound_to_dict(c) for c in get_prioritized_compounds(p, max_compounds=10)],
-                "traditional_uses": p.traditional_uses
-            }
-            for p in results
-        ]
-    }
+    try:
+        body, etag = plant_listing_service.search(q, fields)
+    except InvalidListingRequest as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return cached_response(request, body, etag, last_modified=plant_listing_service.last_modified)
 
 
 @app.get("/api/plants/{scientific_name}")
-async def get_plant_info(scientific_name: str):
+async def get_plant_info(request: Request, scientific_name: str):
     """
     Get detailed information about a plant.
 
@@ -738,30 +920,20 @@ async def get_plant_info(scientific_name: str):
     Returns:
         Plant details including compounds sorted by priority and traditional uses
     """
-    plant = get_plant_compounds(scientific_name)
+    found = plant_listing_service.plant(scientific_name)
 
-    if not plant:
+    if found is None:
         # Try fuzzy search
         results = search_plant_fuzzy(scientific_name)
-        if results:
-            plant = results[0]
-        else:
+        if not results:
             raise HTTPException(
                 status_code=404,
                 detail=f"Plant '{scientific_name}' not found in database"
             )
+        found = plant_listing_service.plant(results[0].scientific_name)
 
-    # Get prioritized compounds with full details
-    prioritized = get_prioritized_compounds(plant, max_compounds=20)
-
-    return {
-        "scientific_name": plant.scientific_name,
-        "common_names": plant.common_names,
-        "family": plant.family,
-        "compounds": [compound_to_dict(c) for c in prioritized],
-        "traditional_uses": plant.traditional_uses,
-        "parts_used": plant.parts_used
-    }
+    body, etag = found
+    return cached_response(request, body, etag, last_modified=plant_listing_service.last_modified)
 
 
 # ============================================
@@ -775,6 +947,38 @@ class SideEffectsRequest(BaseModel):
     targets: List[str] = Field(default_factory=list, description="List of affected target names")
 
 
+def side_effects_response(compound_name: str, pathways: List[str], targets: List[str]) -> SideEffectsResponse:
+    """Side effects for a compound's affected pathways and targets"""
+    # Get side effects from pathways and targets
+    side_effects = side_effects_service.get_side_effects_combined(
+        pathway_names=pathways,
+        target_names=targets
+    )
+
+    # Convert SideEffect dataclass objects to Pydantic models
+    side_effects_models = [
+        SideEffect(
+            name=effect.name,
+            description=effect.description,
+            severity=effect.severity,
+            frequency=effect.frequency,
+            body_system=effect.body_system,
+            mechanism_basis=effect.mechanism_basis,
+            management_tips=effect.management_tips,
+            when_to_seek_help=effect.when_to_seek_help,
+            effect_type=effect.effect_type
+        )
+        for effect in side_effects
+    ]
+
+    logger.info(f"Found {len(side_effects_models)} side effects for {compound_name}")
+
+    return SideEffectsResponse(
+        compound_name=compound_name,
+        side_effects=side_effects_models
+    )
+
+
 @app.post("/api/side-effects", response_model=SideEffectsResponse)
 async def get_side_effects(request: SideEffectsRequest):
     """
@@ -794,35 +998,36 @@ async def get_side_effects(request: SideEffectsRequest):
     """
     try:
         logger.info(f"Side effects request: {request.compound_name}")
+        return side_effects_response(request.compound_name, request.pathways, request.targets)
 
-        # Get side effects from pathways and targets
-        side_effects = side_effects_service.get_side_effects_combined(
-            pathway_names=request.pathways,
-            target_names=request.targets
+    except Exception as e:
+        logger.error(f"Side effects error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve side effects: {str(e)}"
         )
 
-        # Convert SideEffect dataclass objects to Pydantic models
-        side_effects_models = [
-            SideEffect(
-                name=effect.name,
-                description=effect.description,
-                severity=effect.severity,
-                frequency=effect.frequency,
-                body_system=effect.body_system,
-                mechanism_basis=effect.mechanism_basis,
-                management_tips=effect.management_tips,
-                when_to_seek_help=effect.when_to_seek_help,
-                effect_type=effect.effect_type
-            )
-            for effect in side_effects
-        ]
 
-        logger.info(f"Found {len(side_effects_models)} side effects for {request.compound_name}")
+@app.get("/api/side-effects", response_model=SideEffectsResponse)
+async def get_side_effects_cached(
+    request: Request,
+    compound_name: str,
+    pathways: List[str] = Query([], description="Affected pathway names (repeat the parameter)"),
+    targets: List[str] = Query([], description="Affected target names (repeat the parameter)")
+):
+    """
+    Cacheable form of POST /api/side-effects.
+
+    The response is deterministic for its query, so it carries a strong
+    ETag; send it back in If-None-Match to get 304 Not Modified.
 
-        return SideEffectsResponse(
-            compound_name=request.compound_name,
-            side_effects=side_effects_models
-        )
+    Returns:
+        SideEffectsResponse with list of potential side effects
+    """
+    try:
+        logger.info(f"Side effects request: {compound_name}")
+        body = model_json(side_effects_response(compound_name, pathways, targets))
+        return cached_response(request, body)
 
     except Exception as e:
         logger.error(f"Side effects error: {e}", exc_info=True)
@@ -875,10 +1080,13 @@ async def get_dosage(request: DosageRequest):
 # ============================================
 
 @app.get("/api/reactome/pathway/{pathway_id}")
-async def get_pathway_details(pathway_id: str):
+async def get_pathway_details(request: Request, pathway_id: str):
     """
     Get detailed information about a Reactome pathway.
 
+    Reactome pathway responses carry a strong ETag; send it back in
+    If-None-Match to get 304 Not Modified.
+
     Args:
         pathway_id: Reactome stable identifier (e.g., "R-HSA-211859")
 
@@ -895,7 +1103,7 @@ async def get_pathway_details(pathway_id: str):
                 detail=f"Pathway {pathway_id} not found"
             )
 
-        return details
+        return cached_response(request, dumps(details))
     except HTTPException:
         raise
     except Exception as e:
@@ -907,7 +1115,7 @@ async def get_pathway_details(pathway_id: str):
 
 
 @app.get("/api/reactome/pathway/{pathway_id}/participants")
-async def get_pathway_participants(pathway_id: str):
+async def get_pathway_participants(request: Request, pathway_id: str):
     """
     Get all participants (proteins/genes) in a Reactome pathway.
 
@@ -921,11 +1129,11 @@ async def get_pathway_participants(pathway_id: str):
         client = ReactomeClient()
         participants = client.get_pathway_participants(pathway_id)
 
-        return {
+        return cached_response(request, dumps({
             "pathway_id": pathway_id,
             "participant_count": len(participants),
             "participants": participants
-        }
+        }))
     except Exception as e:
         logger.error(f"Error fetching pathway participants: {e}", exc_info=True)
         raise HTTPException(
@@ -935,7 +1143,7 @@ async def get_pathway_participants(pathway_id: str):
 
 
 @app.get("/api/reactome/pathway/{pathway_id}/related")
-async def get_related_pathways(pathway_id: str):
+async def get_related_pathways(request: Request, pathway_id: str):
     """
     Get related pathways (parent/child relationships).
 
@@ -949,11 +1157,11 @@ async def get_related_pathways(pathway_id: str):
         client = ReactomeClient()
         related = client.get_related_pathways(pathway_id)
 
-        return {
+        return cached_response(request, dumps({
             "pathway_id": pathway_id,
             "related_count": len(related),
             "related_pathways": related
-        }
+        }))
     except Exception as e:
         logger.error(f"Error fetching related pathways: {e}", exc_info=True)
         raise HTTPException(
@@ -963,7 +1171,7 @@ async def get_related_pathways(pathway_id: str):
 
 
 @app.get("/api/reactome/pathway/{pathway_id}/full")
-async def get_full_pathway_info(pathway_id: str):
+async def get_full_pathway_info(request: Request, pathway_id: str):
     """
     Get comprehensive information about a pathway including details,
     participants, and related pathways.
@@ -988,7 +1196,7 @@ async def get_full_pathway_info(pathway_id: str):
                 detail=f"Pathway {pathway_id} not found"
             )
 
-        return {
+        return cached_response(request, dumps({
             **details,
             "participant_count": len(participants),
             "participants": participants[:20],  # Limit to first 20
@@ -996,7 +1204,7 @@ async def get_full_pathway_info(pathway_id: str):
             "total_participants": len(participants),
             "related_pathway_count": len(related),
             "related_pathways": related[:10],  # Limit to first 10
-        }
+        }))
     except HTTPException:
         raise
     except Exception as e:
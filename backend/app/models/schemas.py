@@ -126,6 +126,7 @@ class ProvenanceRecord(BaseModel):
     cache_hit: bool = False
     response_size: Optional[int] = None
     error_message: Optional[str] = None
+    not_found: bool = False  # Upstream definitively has no record (safe to negative-cache)
 
 
 class BodyImpactReport(BaseModel):
@@ -176,6 +177,14 @@ class BodyImpactReport(BaseModel):
     analysis_version: str = "1.0.0"
     predictions_enabled: bool = False
     total_analysis_duration_seconds: Optional[float] = None
+    is_partial: bool = Field(
+        default=False,
+        description="True when the request deadline cut the analysis short"
+    )
+    skipped_stages: List[str] = Field(
+        default_factory=list,
+        description="Optional stages skipped because the deadline ran out"
+    )
 
     class Config:
         json_schema_extra = {
@@ -273,6 +282,14 @@ class DosageResponse(BaseModel):
     plant_concentrations: List[PlantConcentration] = Field(default_factory=list)
     safety_profile: SafetyProfile = Field(default_factory=SafetyProfile)
     sources_queried: List[str] = Field(default_factory=list)
+    sources_timed_out: List[str] = Field(
+        default_factory=list,
+        description="Sources that did not answer before the dosage deadline (partial result)"
+    )
+    sources_failed: List[str] = Field(
+        default_factory=list,
+        description="Sources that errored or answered only partly (partial result, not cached)"
+    )
     data_quality_note: str = ""
 
 
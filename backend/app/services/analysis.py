@@ -15,7 +15,9 @@ from app.models.schemas import (
 )
 from app.clients import PubChemClient, ChEMBLClient, ReactomeClient
 from app.clients.drugbank import DrugBankClient
+from app.clients.pubchem import compound_cache_key
 from app.services.cache import cache_service
+from app.services.report_cache import report_cache
 from app.services.scoring import ScoringEngine
 from app.services.target_prediction_service import target_prediction_service
 try:
@@ -26,6 +28,9 @@ except (ImportError, ModuleNotFoundError):
     logger_temp.warning("DeepChem ML service unavailable - optional ML features disabled")
 from app.services.pharmacophore_analysis import pharmacophore_analyzer
 from app.config import settings
+from app.utils.circuit_breaker import circuit_open
+from app.utils.deadline import expired as deadline_expired
+from app.utils.responses import model_json
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +47,58 @@ class AnalysisService:
         self.cache = cache_service
 
     def analyze_ingredient(
+        self,
+        ingredient_input: IngredientInput,
+        force_refresh: bool = False
+    ) -> BodyImpactReport:
+        """
+        Analyze an ingredient, serving whole reports from the report cache.
+
+        Cached reports older than the fresh window are returned immediately
+        and recomputed in the background.
+
+        Args:
+            ingredient_input: Input with ingredient name and options
+            force_refresh: Run the full pipeline and overwrite the cached report
+
+        Returns:
+            BodyImpactReport with full analysis
+        """
+        if force_refresh:
+            return report_cache.refresh(ingredient_input, self._run_pipeline(ingredient_input))
+
+        return report_cache.get_or_compute(
+            ingredient_input,
+            lambda: self._run_pipeline(ingredient_input)
+        )
+
+    def analyze_ingredient_json(
+        self,
+        ingredient_input: IngredientInput,
+        force_refresh: bool = False
+    ) -> bytes:
+        """
+        Analyze an ingredient and return the report as encoded JSON.
+
+        Cached reports are returned as the stored bytes, without building
+        a model, so they can be sent to the client directly.
+
+        Args:
+            ingredient_input: Input with ingredient name and options
+            force_refresh: Run the full pipeline and overwrite the cached report
+
+        Returns:
+            BodyImpactReport encoded as JSON
+        """
+        if force_refresh:
+            return model_json(report_cache.refresh(ingredient_input, self._run_pipeline(ingredient_input)))
+
+        return report_cache.get_or_compute_json(
+            ingredient_input,
+            lambda: self._run_pipeline(ingredient_input)
+        )
+
+    def _run_pipeline(
         self,
         ingredient_input: IngredientInput
     ) -> BodyImpactReport:
@@ -56,6 +113,10 @@ class AnalysisService:
         5. Calculate pathway impact scores
         6. Generate final report
 
+        Honors the request deadline (app.utils.deadline): once it runs out,
+        optional stages (predictions, fallbacks, indication inference) are
+        skipped and the report is flagged ``is_partial``.
+
         Args:
             ingredient_input: Input with ingredient name and options
 
@@ -65,6 +126,7 @@ class AnalysisService:
         start_time = time.time()
         ingredient_name = ingredient_input.ingredient_name
         provenance: list[ProvenanceRecord] = []
+        skipped_stages: list[str] = []
 
         logger.info(f"Starting analysis for: {ingredient_name}")
 
@@ -82,7 +144,7 @@ class AnalysisService:
             )
 
         # Step 2: Get target evidence
-        known_targets, prov = self._get_target_evidence(compound)
+        known_targets, prov = self._get_target_evidence(compound, skipped_stages)
         provenance.append(prov)
 
         if not known_targets:
@@ -90,7 +152,8 @@ class AnalysisService:
 
         # Step 3: Optional predictions
         predicted_targets = []
-        if ingredient_input.enable_predictions and settings.enable_docking_plugin:
+        if (ingredient_input.enable_predictions and settings.enable_docking_plugin
+                and self._has_budget("docking_prediction", skipped_stages)):
             predicted_targets, prov = self._predict_targets(compound)
             if prov:
                 provenance.append(prov)
@@ -98,7 +161,8 @@ class AnalysisService:
         # Step 3b: DeepPurpose ML prediction (if no ChEMBL targets and enabled)
         # Uses trained deep learning model (70-85% accuracy)
         ml_predicted_targets = []
-        if not known_targets and not predicted_targets and settings.enable_deeplearning_prediction:
+        if (not known_targets and not predicted_targets and settings.enable_deeplearning_prediction
+                and self._has_budget("deeplearning_prediction", skipped_stages)):
             if deepchem_ml_service.is_available():
                 logger.info(f"No ChEMBL targets found, using DeepPurpose ML prediction for {ingredient_name}")
                 ml_predicted_targets = deepchem_ml_service.predict_targets(
@@ -120,7 +184,8 @@ class AnalysisService:
 
         # Step 3c: Fallback to heuristic ML prediction if DeepPurpose unavailable
         # Lightweight pattern-based prediction (30-50% accuracy)
-        if not known_targets and not predicted_targets and settings.enable_ml_target_prediction:
+        if (not known_targets and not predicted_targets and settings.enable_ml_target_prediction
+                and self._has_budget("ml_prediction", skipped_stages)):
             logger.info(f"Using heuristic ML prediction as fallback for {ingredient_name}")
             ml_predicted_targets, prov = self._predict_targets_ml_fallback(compound)
             if prov:
@@ -132,14 +197,16 @@ class AnalysisService:
         all_targets = known_targets + predicted_targets
         pathways = []
 
-        if all_targets:
+        if all_targets and self._upstream_available("reactome", "pathway_mapping", skipped_stages):
             pathways, prov = self._map_pathways(known_targets, predicted_targets)
             provenance.append(prov)
-        else:
+        elif not all_targets:
             logger.warning(f"No targets (measured, docking, or ML-predicted) for {ingredient_name}, trying indication inference")
 
         # Step 4b: Fallback to DrugBank/Open Targets if Reactome has no pathways
-        if not pathways and settings.enable_drugbank_fallback:
+        if (not pathways and settings.enable_drugbank_fallback
+                and self._has_budget("open_targets_pathway_fallback", skipped_stages)
+                and self._upstream_available("open_targets", "open_targets_pathway_fallback", skipped_stages)):
             logger.info(f"No Reactome pathways found, trying Open Targets fallback for {ingredient_name}")
             drugbank_pathways = self.drugbank.get_pathways_for_drug(ingredient_name)
             if drugbank_pathways:
@@ -153,7 +220,8 @@ class AnalysisService:
                 logger.info(f"Found {len(pathways)} pathways via Open Targets fallback")
 
         # Step 4b2: Fallback to pharmacophore analysis if no pathways from any source
-        if not pathways and settings.enable_pharmacophore_prediction and compound and compound.canonical_smiles:
+        if (not pathways and settings.enable_pharmacophore_prediction and compound and compound.canonical_smiles
+                and self._has_budget("pharmacophore_pathway_fallback", skipped_stages)):
             logger.info(f"No pathways from Reactome/Open Targets, trying pharmacophore analysis for {ingredient_name}")
             _, pharma_pathways = pharmacophore_analyzer.analyze_compound(
                 compound.canonical_smiles,
@@ -170,7 +238,8 @@ class AnalysisService:
                 logger.info(f"Found {len(pathways)} pathways via pharmacophore analysis")
 
         # Step 4c: Infer pathways from ChEMBL drug indications (enhances results)
-        if compound and compound.inchikey:
+        if (compound and compound.inchikey and self._has_budget("indication_inference", skipped_stages)
+                and self._upstream_available("chembl", "indication_inference", skipped_stages)):
             indication_pathways = self.chembl.infer_pathways_from_indications(
                 compound.inchikey,
                 compound.canonical_smiles
@@ -203,7 +272,9 @@ class AnalysisService:
             provenance=provenance,
             predictions_enabled=ingredient_input.enable_predictions,
             total_analysis_duration_seconds=time.time() - start_time,
-            analysis_version=settings.app_version
+            analysis_version=settings.app_version,
+            is_partial=bool(skipped_stages) or deadline_expired(),
+            skipped_stages=skipped_stages
         )
 
         logger.info(
@@ -213,10 +284,29 @@ class AnalysisService:
 
         return report
 
+    def prefetch_compounds(self, ingredient_names: list[str]) -> int:
+        """
+        Resolve many ingredients with batched PubChem requests ahead of analysis.
+
+        Fills the compound cache so each later analysis skips its own PubChem
+        lookups. Failures are logged and left to the per-ingredient path.
+
+        Returns:
+            Number of names resolved (cached or fetched)
+        """
+        if not ingredient_names:
+            return 0
+        try:
+            return len(self.pubchem.resolve_compounds_batch(ingredient_names))
+        except Exception as e:
+            logger.warning(f"Batch compound prefetch failed: {e}")
+            return 0
+
     def _resolve_compound(self, ingredient_name: str) -> tuple[Optional[CompoundIdentity], ProvenanceRecord]:
         """Resolve ingredient to canonical structure with caching"""
+        key = compound_cache_key(ingredient_name)
         # Check cache
-        cached = self.cache.get("compound", ingredient_name.lower())
+        cached = self.cache.get("compound", key)
         if cached:
             prov = ProvenanceRecord(
                 service="PubChem",
@@ -226,20 +316,52 @@ class AnalysisService:
             )
             return CompoundIdentity(**cached), prov
 
+        if self.cache.is_negative("compound", key):
+            prov = ProvenanceRecord(
+                service="PubChem",
+                endpoint="/compound (cached miss)",
+                status="error",
+                cache_hit=True,
+                not_found=True,
+                error_message="No CID found"
+            )
+            return None, prov
+
         # Fetch from PubChem
         compound, prov = self.pubchem.resolve_compound(ingredient_name)
 
-        # Cache if successful
+        # Cache if successful; remember definitive misses (not transient errors)
         if compound:
-            self.cache.set("compound", ingredient_name.lower(), compound.model_dump())
+            self.cache.set("compound", key, compound.model_dump())
+        elif prov.not_found:
+            self.cache.set_negative("compound", key, prov.error_message or "not found")
 
         return compound, prov
 
+    def _has_budget(self, stage: str, skipped_stages: list[str]) -> bool:
+        """Check the request deadline before an optional stage, recording skips"""
+        if deadline_expired():
+            logger.warning(f"Request deadline reached, skipping {stage}")
+            skipped_stages.append(stage)
+            return False
+        return True
+
+    def _upstream_available(self, upstream: str, stage: str, skipped_stages: list[str]) -> bool:
+        """Check an upstream's circuit breaker before a stage, recording skips"""
+        if circuit_open(upstream):
+            logger.warning(f"{upstream} circuit open, skipping {stage}")
+            skipped_stages.append(f"{stage} ({upstream} circuit open)")
+            return False
+        return True
+
     def _get_target_evidence(
         self,
-        compound: CompoundIdentity
+        compound: CompoundIdentity,
+        skipped_stages: Optional[list[str]] = None
     ) -> tuple[list[TargetEvidence], ProvenanceRecord]:
         """Get target evidence from ChEMBL with DrugBank fallback"""
+        if skipped_stages is None:
+            skipped_stages = []
         cache_key = compound.inchikey
 
         # Check cache
@@ -254,25 +376,53 @@ class AnalysisService:
             targets = [TargetEvidence(**t) for t in cached]
             return targets, prov
 
-        # Fetch from ChEMBL
-        targets, prov = self.chembl.get_target_activities(
-            compound.inchikey,
-            compound.canonical_smiles
-        )
+        if self.cache.is_negative("targets", cache_key):
+            prov = ProvenanceRecord(
+                service="ChEMBL",
+                endpoint="/activity (cached miss)",
+                status="error",
+                cache_hit=True,
+                not_found=True,
+                error_message="No targets from any source"
+            )
+            return [], prov
 
-        # Cache if successful
-        if targets:
-            self.cache.set(
-                "targets",
-                cache_key,
-                [t.model_dump() for t in targets]
+        # Fetch from ChEMBL, or go straight to the fallbacks while its circuit is open
+        if self._upstream_available("chembl", "chembl_targets", skipped_stages):
+            targets, prov = self.chembl.get_target_activities(
+                compound.inchikey,
+                compound.canonical_smiles
             )
+        else:
+            targets = []
+            prov = ProvenanceRecord(
+                service="ChEMBL",
+                endpoint="/activity (circuit open)",
+                status="error",
+                error_message="ChEMBL circuit open"
+            )
+
+        # Cache if successful (activity paging cut short by the deadline may be incomplete)
+        if targets:
+            if not deadline_expired():
+                self.cache.set(
+                    "targets",
+                    cache_key,
+                    [t.model_dump() for t in targets]
+                )
             return targets, prov
 
+        # Negative-cache only if every source tried answered definitively (no errors)
+        definitive = prov.status == "success" or prov.not_found
+
         # Fallback to DrugBank/Open Targets if ChEMBL has no targets
-        if not targets and settings.enable_drugbank_fallback:
+        if (not targets and settings.enable_drugbank_fallback
+                and self._has_budget("open_targets_target_fallback", skipped_stages)
+                and self._upstream_available("open_targets", "open_targets_target_fallback", skipped_stages)):
             logger.info(f"No ChEMBL targets found, trying Open Targets fallback for {compound.ingredient_name}")
-            drugbank_targets = self.drugbank.get_drug_targets(compound.ingredient_name)
+            drugbank_targets, fallback_prov = self.drugbank.fetch_drug_targets(compound.ingredient_name)
+            if fallback_prov.status != "success":
+                definitive = False
 
             if drugbank_targets:
                 # Cache the fallback results
@@ -281,17 +431,12 @@ class AnalysisService:
                     cache_key,
                     [t.model_dump() for t in drugbank_targets]
                 )
-
-                fallback_prov = ProvenanceRecord(
-                    service="Open Targets",
-                    endpoint="/graphql (drug targets fallback)",
-                    status="success"
-                )
                 logger.info(f"Found {len(drugbank_targets)} targets via Open Targets fallback")
                 return drugbank_targets, fallback_prov
 
         # Fallback to pharmacophore analysis if all other methods fail
-        if not targets and settings.enable_pharmacophore_prediction and compound.canonical_smiles:
+        if (not targets and settings.enable_pharmacophore_prediction and compound.canonical_smiles
+                and self._has_budget("pharmacophore_target_fallback", skipped_stages)):
             logger.info(f"No targets from ChEMBL/Open Targets, trying pharmacophore analysis for {compound.ingredient_name}")
             pharma_targets, _ = pharmacophore_analyzer.analyze_compound(
                 compound.canonical_smiles,
@@ -314,6 +459,10 @@ class AnalysisService:
                 logger.info(f"Found {len(pharma_targets)} targets via pharmacophore analysis")
                 return pharma_targets, pharma_prov
 
+        # ChEMBL answered (no molecule or no activities) and every fallback came up empty
+        if definitive and not skipped_stages:
+            self.cache.set_negative("targets", cache_key, "No targets from any source")
+
         return targets, prov
 
     def _predict_targets(
@@ -1,21 +1,34 @@
 """Caching service for API responses"""
 
 import hashlib
-from typing import Any, Optional, List, Dict
+import time
+from typing import Any, Callable, Optional, List, Dict
 from diskcache import Cache
 import logging
 from pathlib import Path
 
 from app.config import settings
+from app.services.cache_codec import CacheCodec, CacheDecodeError
 
 logger = logging.getLogger(__name__)
 
 
 class CacheService:
-    """Disk-based caching service with TTL support"""
+    """
+    Disk-based caching service with TTL support.
+
+    Values are stored as compressed, schema-versioned bytes (see
+    cache_codec); entries from an older schema read as misses.
+    """
+
+    # Negative entries live in their own namespace and are tagged so they can
+    # be told apart from real (possibly empty) results and evicted in bulk
+    NEGATIVE_TAG = "negative"
 
     def __init__(self):
         self.ttl = settings.cache_ttl
+        self.negative_ttl = settings.negative_cache_ttl
+        self.codec = CacheCodec(settings.cache_schema_version, settings.cache_codec)
         self.cache = None
         try:
             # Create cache directory if it doesn't exist
@@ -45,16 +58,22 @@ class CacheService:
         Returns:
             Cached value or None if not found/expired
         """
-        if not self.cache:
+        if self.cache is None:
             return None
 
         key = self._generate_key(prefix, identifier)
         try:
-            value = self.cache.get(key)
-            if value is not None:
-                logger.debug(f"Cache HIT: {key}")
-                return value
-            logger.debug(f"Cache MISS: {key}")
+            raw = self.cache.get(key)
+            if raw is None:
+                logger.debug(f"Cache MISS: {key}")
+                return None
+            value = self.codec.decode(raw)
+            logger.debug(f"Cache HIT: {key}")
+            return value
+        except CacheDecodeError as e:
+            # Written by an older schema/codec: drop it and recompute
+            logger.debug(f"Cache STALE SCHEMA: {key} ({e})")
+            self.cache.delete(key)
             return None
         except Exception as e:
             logger.error(f"Cache get error: {e}")
@@ -67,29 +86,153 @@ class CacheService:
         Args:
             prefix: Cache namespace
             identifier: Unique identifier
-            value: Value to cache (must be JSON-serializable)
+            value: Value to cache (JSON-like data; other objects are pickled)
             ttl: Time-to-live in seconds (default: from settings)
 
         Returns:
             True if successful
         """
-        if not self.cache:
+        if self.cache is None:
             return False
 
         key = self._generate_key(prefix, identifier)
         expire_time = ttl if ttl is not None else self.ttl
 
         try:
-            self.cache.set(key, value, expire=expire_time)
+            self.cache.set(key, self.codec.encode(value), expire=expire_time)
             logger.debug(f"Cache SET: {key} (TTL: {expire_time}s)")
             return True
         except Exception as e:
             logger.error(f"Cache set error: {e}")
             return False
 
+    def add(self, prefix: str, identifier: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Store value only if the key is not already cached (atomic).
+
+        Args:
+            prefix: Cache namespace
+            identifier: Unique identifier
+            value: Value to cache
+            ttl: Time-to-live in seconds (default: from settings)
+
+        Returns:
+            True if the value was stored, False if the key already existed
+        """
+        if self.cache is None:
+            return False
+
+        key = self._generate_key(prefix, identifier)
+        expire_time = ttl if ttl is not None else self.ttl
+
+        try:
+            added = self.cache.add(key, self.codec.encode(value), expire=expire_time)
+            logger.debug(f"Cache ADD: {key} ({'stored' if added else 'exists'})")
+            return added
+        except Exception as e:
+            logger.error(f"Cache add error: {e}")
+            return False
+
+    def update(
+        self,
+        prefix: str,
+        identifier: str,
+        func: Callable[[Optional[Any]], Any],
+        ttl: Optional[int] = None
+    ) -> Optional[Any]:
+        """
+        Replace a cached value with func(current value) atomically.
+
+        The read and write run in one cache transaction, so concurrent
+        updates from other threads and processes sharing the cache
+        directory are serialized instead of overwriting each other.
+
+        Args:
+            prefix: Cache namespace
+            identifier: Unique identifier
+            func: Called with the current value (None if missing/expired); returns the new value
+            ttl: Time-to-live in seconds (default: from settings)
+
+        Returns:
+            The stored value, or None if the update failed
+        """
+        if self.cache is None:
+            return None
+
+        key = self._generate_key(prefix, identifier)
+        expire_time = ttl if ttl is not None else self.ttl
+
+        try:
+            with self.cache.transact():
+                raw = self.cache.get(key)
+                try:
+                    current = None if raw is None else self.codec.decode(raw)
+                except CacheDecodeError:
+                    current = None
+                value = func(current)
+                self.cache.set(key, self.codec.encode(value), expire=expire_time)
+            logger.debug(f"Cache UPDATE: {key} (TTL: {expire_time}s)")
+            return value
+        except Exception as e:
+            logger.error(f"Cache update error: {e}")
+            return None
+
+    def set_negative(self, prefix: str, identifier: str, reason: str = "not found", ttl: Optional[int] = None) -> bool:
+        """
+        Record that an upstream lookup definitively found nothing.
+
+        Args:
+            prefix: Namespace of the lookup that missed (e.g. "compound")
+            identifier: Identifier that was looked up
+            reason: Short description of the miss, kept for debugging
+            ttl: Time-to-live in seconds (default: settings.negative_cache_ttl)
+
+        Returns:
+            True if successful
+        """
+        if self.cache is None:
+            return False
+
+        key = self._generate_key(f"negative:{prefix}", identifier)
+        expire_time = ttl if ttl is not None else self.negative_ttl
+
+        try:
+            self.cache.set(
+                key,
+                self.codec.encode({"reason": reason, "cached_at": time.time()}),
+                expire=expire_time,
+                tag=self.NEGATIVE_TAG
+            )
+            logger.debug(f"Cache SET negative: {key} (TTL: {expire_time}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_negative error: {e}")
+            return False
+
+    def is_negative(self, prefix: str, identifier: str) -> bool:
+        """Check whether a lookup is known to miss"""
+        return self.get(f"negative:{prefix}", identifier) is not None
+
+    def delete_negative(self, prefix: str, identifier: str) -> bool:
+        """Forget a negative entry (e.g. after the upstream added the record)"""
+        return self.delete(f"negative:{prefix}", identifier)
+
+    def clear_negative(self) -> int:
+        """Evict every negative entry; returns the number removed"""
+        if self.cache is None:
+            return 0
+
+        try:
+            removed = self.cache.evict(self.NEGATIVE_TAG)
+            logger.info(f"Evicted {removed} negative cache entries")
+            return removed
+        except Exception as e:
+            logger.error(f"Cache clear_negative error: {e}")
+            return 0
+
     def delete(self, prefix: str, identifier: str) -> bool:
         """Delete cached value"""
-        if not self.cache:
+        if self.cache is None:
             return False
 
         key = self._generate_key(prefix, identifier)
@@ -101,7 +244,7 @@ class CacheService:
 
     def clear_all(self) -> None:
         """Clear entire cache"""
-        if not self.cache:
+        if self.cache is None:
             return
 
         try:
@@ -0,0 +1,168 @@
+"""Compressed, schema-versioned serialization for cache entries
+
+Every entry is stored as bytes with a small header:
+
+    magic (2 bytes) | schema version (uint16) | codec id (uint8) | payload
+
+Entries written under another schema version (or before codecs existed)
+fail to decode and are treated as misses, so changing the shape of cached
+data only needs a ``CACHE_SCHEMA_VERSION`` bump.
+
+``bytes`` values (e.g. pre-encoded report JSON) skip serialization and
+compression entirely and decode back to the same bytes.
+"""
+
+import json
+import pickle
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"BP"
+HEADER = struct.Struct(">2sHB")
+
+
+class CacheDecodeError(ValueError):
+    """Raised when bytes are not a current-schema cache entry"""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), default=_json_default).encode()
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _zlib_compress(data: bytes) -> bytes:
+    return zlib.compress(data, 6)
+
+
+if zstandard is not None:
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A serializer/compressor pair identified by a stable id"""
+    codec_id: int
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+# Codec ids are persisted in entries: never renumber, only append
+CODECS: Dict[str, Codec] = {
+    "json+zlib": Codec(1, "json+zlib", _json_dumps, json.loads, _zlib_compress, zlib.decompress),
+    "pickle+zlib": Codec(2, "pickle+zlib", pickle.dumps, pickle.loads, _zlib_compress, zlib.decompress),
+}
+
+if orjson is not None:
+    CODECS["orjson+zlib"] = Codec(3, "orjson+zlib", _orjson_dumps, orjson.loads, _zlib_compress, zlib.decompress)
+
+if zstandard is not None:
+    CODECS["json+zstd"] = Codec(
+        4, "json+zstd", _json_dumps, json.loads,
+        _zstd_compressor.compress, _zstd_decompressor.decompress
+    )
+    if orjson is not None:
+        CODECS["orjson+zstd"] = Codec(
+            5, "orjson+zstd", _orjson_dumps, orjson.loads,
+            _zstd_compressor.compress, _zstd_decompressor.decompress
+        )
+
+# Stores bytes values as-is; picked per value, never configured
+RAW_CODEC = Codec(6, "raw", bytes, bytes, bytes, bytes)
+
+CODECS_BY_ID: Dict[int, Codec] = {codec.codec_id: codec for codec in CODECS.values()}
+CODECS_BY_ID[RAW_CODEC.codec_id] = RAW_CODEC
+
+# Used for values the JSON codecs can't represent
+FALLBACK_CODEC = CODECS["pickle+zlib"]
+
+
+def best_available_codec() -> str:
+    """Fastest JSON codec given the installed optional libraries"""
+    for name in ("orjson+zstd", "orjson+zlib", "json+zstd"):
+        if name in CODECS:
+            return name
+    return "json+zlib"
+
+
+class CacheCodec:
+    """Encodes cache values into versioned, compressed bytes"""
+
+    def __init__(self, schema_version: int, codec: str = "auto"):
+        """
+        Initialize codec.
+
+        Args:
+            schema_version: Stamped into every entry; mismatches decode as misses
+            codec: Codec name from CODECS, or "auto" for the best available
+        """
+        name = best_available_codec() if codec == "auto" else codec
+        if name not in CODECS:
+            raise ValueError(f"Unknown cache codec '{codec}'. Available: {', '.join(CODECS)}")
+        self.codec = CODECS[name]
+        self.schema_version = schema_version
+
+    def encode(self, value: Any, codec: Optional[Codec] = None) -> bytes:
+        """Serialize and compress a value, falling back to pickle for non-JSON data"""
+        if codec is None and isinstance(value, (bytes, bytearray)):
+            codec = RAW_CODEC
+        codec = codec or self.codec
+        try:
+            payload = codec.dumps(value)
+        except TypeError:
+            codec = FALLBACK_CODEC
+            payload = codec.dumps(value)
+        return HEADER.pack(MAGIC, self.schema_version, codec.codec_id) + codec.compress(payload)
+
+    def decode(self, data: Any) -> Any:
+        """
+        Decode an entry written by encode().
+
+        Raises:
+            CacheDecodeError: Not bytes, unknown codec, or another schema version
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)) or len(data) < HEADER.size:
+            raise CacheDecodeError("Entry predates the cache codec layer")
+
+        view = memoryview(data)
+        magic, schema_version, codec_id = HEADER.unpack(view[:HEADER.size])
+        if magic != MAGIC:
+            raise CacheDecodeError("Entry predates the cache codec layer")
+        if schema_version != self.schema_version:
+            raise CacheDecodeError(f"Entry has schema v{schema_version}, expected v{self.schema_version}")
+
+        codec = CODECS_BY_ID.get(codec_id)
+        if codec is None:
+            raise CacheDecodeError(f"Entry uses unavailable codec id {codec_id}")
+
+        return codec.loads(codec.decompress(view[HEADER.size:]))
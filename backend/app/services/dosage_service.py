@@ -4,13 +4,16 @@ Aggregates dosage-relevant data from PubChem toxicity, ChEMBL potency,
 and Dr. Duke plant tissue concentrations.
 """
 
+import hashlib
+import json
 import logging
 from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from app.clients.pubchem import PubChemClient
 from app.clients.chembl import ChEMBLClient
 from app.clients.dr_duke import dr_duke_client
+from app.config import settings
 from app.models.schemas import (
     DosageDataPoint,
     PotencyData,
@@ -18,10 +21,24 @@ from app.models.schemas import (
     SafetyProfile,
     DosageResponse,
 )
+from app.services.cache import cache_service
 
 logger = logging.getLogger(__name__)
 
 
+def dosage_response_key(
+    compound_name: str,
+    pubchem_cid: Optional[int],
+    inchikey: Optional[str],
+    smiles: Optional[str],
+    target_names: List[str],
+) -> str:
+    """Cache key covering every input of a dosage response (targets as a set)"""
+    inputs = json.dumps([smiles, sorted(set(target_names))])
+    digest = hashlib.sha256(inputs.encode()).hexdigest()[:16]
+    return f"{compound_name.lower()}:{pubchem_cid}:{inchikey}:{digest}"
+
+
 class DosageService:
     """Service for aggregating dosage data from multiple sources."""
 
@@ -29,6 +46,15 @@ class DosageService:
         self.pubchem = PubChemClient()
         self.chembl = ChEMBLClient()
         self.dr_duke = dr_duke_client
+        self.cache = cache_service
+        self.cache_ttl = settings.dosage_cache_ttl
+        self.deadline_seconds = settings.dosage_deadline_seconds
+        # Shared across requests so a slow source never costs a pool setup/teardown,
+        # and so abandoned futures keep running (and fill the cache) after the deadline
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.dosage_max_workers,
+            thread_name_prefix="dosage"
+        )
 
     def get_dosage_data(
         self,
@@ -40,51 +66,79 @@ class DosageService:
     ) -> DosageResponse:
         """
         Aggregate dosage data from PubChem, ChEMBL, and Dr. Duke.
+
+        All sources share a single deadline. Sources that have not answered
+        when it expires are reported in ``sources_timed_out``, and sources
+        that raised or hit an upstream error in ``sources_failed``; the
+        response is returned with whatever data arrived. Only responses
+        every source answered completely are cached.
         """
+        response_key = dosage_response_key(compound_name, pubchem_cid, inchikey, smiles, target_names)
+        cached = self.cache.get("dosage_response", response_key)
+        if cached:
+            logger.debug(f"Cache hit for dosage response: {compound_name}")
+            return DosageResponse(**cached)
+
         dosage_data: List[DosageDataPoint] = []
         potency_data: List[PotencyData] = []
         plant_concentrations: List[PlantConcentration] = []
         sources_queried: List[str] = []
+        sources_timed_out: List[str] = []
+        sources_failed: List[str] = []
         safety_profile = SafetyProfile()
 
-        # Query sources in parallel
+        # Query sources in parallel under one shared deadline
         futures = {}
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            if pubchem_cid:
-                futures["pubchem"] = executor.submit(
-                    self._fetch_pubchem, pubchem_cid
-                )
-            if inchikey:
-                futures["chembl"] = executor.submit(
-                    self._fetch_chembl, inchikey, smiles
-                )
-            futures["dr_duke"] = executor.submit(
-                self._fetch_dr_duke, compound_name
+        if pubchem_cid:
+            futures["pubchem"] = self._executor.submit(
+                self._fetch_pubchem, pubchem_cid
             )
+        if inchikey:
+            futures["chembl"] = self._executor.submit(
+                self._fetch_chembl, inchikey, smiles
+            )
+        futures["dr_duke"] = self._executor.submit(
+            self._fetch_dr_duke, compound_name
+        )
 
-            for source, future in futures.items():
-                try:
-                    result = future.result(timeout=30)
-                    sources_queried.append(source)
-
-                    if source == "pubchem":
-                        pubchem_dosage, pubchem_safety = result
-                        dosage_data.extend(pubchem_dosage)
-                        # Merge safety profile
-                        if pubchem_safety.get("ld50"):
-                            safety_profile.ld50 = pubchem_safety["ld50"]
-                        if pubchem_safety.get("therapeutic_range"):
-                            safety_profile.therapeutic_range = pubchem_safety["therapeutic_range"]
-                        safety_profile.warnings.extend(pubchem_safety.get("warnings", []))
-
-                    elif source == "chembl":
-                        potency_data.extend(result)
-
-                    elif source == "dr_duke":
-                        plant_concentrations.extend(result)
+        wait(futures.values(), timeout=self.deadline_seconds)
 
-                except Exception as e:
-                    logger.warning(f"Dosage source {source} failed: {e}")
+        for source, future in futures.items():
+            if not future.done():
+                # Leave it running: its per-source cache entry will serve the next request
+                sources_timed_out.append(source)
+                logger.warning(
+                    f"Dosage source {source} missed the {self.deadline_seconds}s deadline "
+                    f"for {compound_name}"
+                )
+                continue
+
+            try:
+                result, complete = future.result()
+                sources_queried.append(source)
+                if not complete:
+                    # Answered with what it could; an upstream error may hide more
+                    sources_failed.append(source)
+
+                if source == "pubchem":
+                    pubchem_dosage, pubchem_safety = result
+                    dosage_data.extend(pubchem_dosage)
+                    # Merge safety profile
+                    if pubchem_safety.get("ld50"):
+                        safety_profile.ld50 = pubchem_safety["ld50"]
+                    if pubchem_safety.get("therapeutic_range"):
+                        safety_profile.therapeutic_range = pubchem_safety["therapeutic_range"]
+                    safety_profile.warnings.extend(pubchem_safety.get("warnings", []))
+
+                elif source == "chembl":
+                    potency_data.extend(result)
+
+                elif source == "dr_duke":
+                    plant_concentrations.extend(result)
+
+            except Exception as e:
+                sources_failed.append(source)
+                logger.warning(f"Dosage source {source} failed: {e}")
 
         # Compute therapeutic index if possible
         if safety_profile.ld50 and potency_data:
@@ -107,20 +161,59 @@ class DosageService:
         data_quality_note = self._generate_quality_note(
             sources_queried, dosage_data, potency_data, plant_concentrations, safety_profile
         )
+        if sources_timed_out:
+            data_quality_note += (
+                f" Partial result: {', '.join(sources_timed_out)} did not respond in time."
+            )
+        if sources_failed:
+            data_quality_note += (
+                f" Partial result: {', '.join(sources_failed)} could not be fully queried."
+            )
 
-        return DosageResponse(
+        response = DosageResponse(
             compound_name=compound_name,
             dosage_data=dosage_data,
             potency_data=potency_data,
             plant_concentrations=plant_concentrations,
             safety_profile=safety_profile,
             sources_queried=sources_queried,
+            sources_timed_out=sources_timed_out,
+            sources_failed=sources_failed,
             data_quality_note=data_quality_note,
         )
 
+        if not sources_timed_out and not sources_failed:
+            self.cache.set("dosage_response", response_key, response.model_dump(), ttl=self.cache_ttl)
+
+        return response
+
     def _fetch_pubchem(self, cid: int) -> tuple:
-        """Fetch toxicity data from PubChem."""
-        raw = self.pubchem.get_toxicity_data(cid)
+        """Fetch toxicity data from PubChem, caching complete parsed results."""
+        cached = self.cache.get("dosage_pubchem", str(cid))
+        if cached:
+            safety = {"warnings": cached.get("warnings", [])}
+            for key in ("ld50", "therapeutic_range"):
+                if cached.get(key):
+                    safety[key] = DosageDataPoint(**cached[key])
+            return ([DosageDataPoint(**p) for p in cached.get("dosage", [])], safety), True
+
+        raw, complete = self.pubchem.fetch_toxicity_data(cid)
+        dosage_points, safety = self._parse_pubchem(cid, raw)
+
+        if complete and (dosage_points or safety["warnings"]):
+            self.cache.set("dosage_pubchem", str(cid), {
+                "dosage": [p.model_dump() for p in dosage_points],
+                "ld50": safety["ld50"].model_dump() if safety.get("ld50") else None,
+                "therapeutic_range": (
+                    safety["therapeutic_range"].model_dump() if safety.get("therapeutic_range") else None
+                ),
+                "warnings": safety["warnings"],
+            }, ttl=self.cache_ttl)
+
+        return (dosage_points, safety), complete
+
+    def _parse_pubchem(self, cid: int, raw: Dict[str, Any]) -> tuple:
+        """Convert raw PubChem toxicity data to dosage points and safety info."""
         dosage_points = []
         safety = {"warnings": []}
 
@@ -175,11 +268,15 @@ class DosageService:
 
         return dosage_points, safety
 
-    def _fetch_chembl(self, inchikey: str, smiles: Optional[str]) -> List[PotencyData]:
-        """Fetch potency data from ChEMBL."""
-        raw = self.chembl.get_potency_summary(inchikey, smiles)
+    def _fetch_chembl(self, inchikey: str, smiles: Optional[str]) -> tuple:
+        """Fetch potency data from ChEMBL, caching the parsed result."""
+        cached = self.cache.get("dosage_chembl", inchikey)
+        if cached:
+            return [PotencyData(**p) for p in cached], True
+
+        raw, complete = self.chembl.fetch_potency_summary(inchikey, smiles)
 
-        return [
+        potency = [
             PotencyData(
                 target_name=item["target_name"],
                 pchembl_value=item["pchembl_value"],
@@ -192,11 +289,21 @@ class DosageService:
             for item in raw
         ]
 
-    def _fetch_dr_duke(self, compound_name: str) -> List[PlantConcentration]:
-        """Fetch plant tissue concentrations from Dr. Duke."""
-        raw = self.dr_duke.get_compound_concentrations(compound_name)
+        if potency:
+            self.cache.set("dosage_chembl", inchikey, [p.model_dump() for p in potency], ttl=self.cache_ttl)
 
-        return [
+        return potency, complete
+
+    def _fetch_dr_duke(self, compound_name: str) -> tuple:
+        """Fetch plant tissue concentrations from Dr. Duke, caching the parsed result."""
+        cache_key = compound_name.lower()
+        cached = self.cache.get("dosage_dr_duke", cache_key)
+        if cached:
+            return [PlantConcentration(**c) for c in cached], True
+
+        raw, complete = self.dr_duke.fetch_compound_concentrations(compound_name)
+
+        concentrations = [
             PlantConcentration(
                 plant_part=item.get("plant_part"),
                 concentration_low=item.get("concentration_low"),
@@ -206,6 +313,13 @@ class DosageService:
             for item in raw
         ]
 
+        if concentrations:
+            self.cache.set(
+                "dosage_dr_duke", cache_key, [c.model_dump() for c in concentrations], ttl=self.cache_ttl
+            )
+
+        return concentrations, complete
+
     def _generate_quality_note(
         self,
         sources: List[str],
@@ -0,0 +1,92 @@
+"""Deduplication of async analysis jobs with identical inputs
+
+Identical /analyze submissions (same normalized ingredient input and
+analysis version) attach to the job already in flight or recently
+completed instead of enqueuing the whole pipeline again.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from app.config import settings
+from app.models.schemas import IngredientInput
+from app.services.cache import cache_service
+
+logger = logging.getLogger(__name__)
+
+# Celery states after which a job must not be reused
+NON_REUSABLE_STATES = {"FAILURE", "REVOKED"}
+
+
+def canonical_input_hash(
+    ingredient_input: IngredientInput,
+    analysis_version: Optional[str] = None
+) -> str:
+    """
+    Hash an ingredient input into a stable job identity.
+
+    Names are case- and whitespace-normalized and medications are treated
+    as an unordered set, so trivially different submissions share a hash.
+    """
+    def normalize(value: str) -> str:
+        return " ".join(value.split()).casefold()
+
+    medications = sorted({
+        normalize(m) for m in (ingredient_input.user_medications or []) if m.strip()
+    })
+    canonical = {
+        "ingredient_name": normalize(ingredient_input.ingredient_name),
+        "enable_predictions": ingredient_input.enable_predictions,
+        "user_medications": medications,
+        "analysis_version": analysis_version or settings.app_version,
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class JobDeduplicator:
+    """Maps input hashes to the job that is computing (or computed) them"""
+
+    def __init__(self):
+        self.cache = cache_service
+        self.ttl = settings.job_dedup_ttl
+
+    def claim(self, input_hash: str, job_id: str) -> Optional[str]:
+        """
+        Register job_id as the owner of input_hash.
+
+        Returns:
+            None if job_id now owns the hash (caller should enqueue it),
+            otherwise the job_id of the existing owner to attach to
+        """
+        if self.cache.add("job_dedup", input_hash, job_id, ttl=self.ttl):
+            return None
+
+        existing = self.cache.get("job_dedup", input_hash)
+        if existing is None:
+            # Cache unavailable or the entry expired between add and get
+            return None
+        return existing
+
+    def release(self, input_hash: str, job_id: str) -> None:
+        """Drop the mapping if it still points at job_id (e.g. the job failed)"""
+        if self.cache.get("job_dedup", input_hash) == job_id:
+            self.cache.delete("job_dedup", input_hash)
+
+    def is_reusable(self, input_hash: str, job_id: str, state: str) -> bool:
+        """
+        Decide whether an existing job can be shared.
+
+        Failed or revoked jobs are released so the next claim starts fresh.
+        """
+        if state in NON_REUSABLE_STATES:
+            logger.info(f"Not reusing job {job_id} in state {state}")
+            self.release(input_hash, job_id)
+            return False
+        return True
+
+
+# Singleton instance
+job_deduplicator = JobDeduplicator()
@@ -0,0 +1,166 @@
+"""Precomputed plant-level analyses for plants in the local catalog
+
+For a catalog plant, the compound reports and aggregated pathways only
+change when upstream data, the analysis version or the catalog changes.
+They are stored per plant and served right after identification,
+instead of rerunning the pipeline for every prioritized compound.
+
+Entries are stamped with the aggregate version (app version + catalog
+data version). An entry from an older version, or one older than the
+fresh window, is still served while a single background refresh
+recomputes it (stale-while-revalidate, as in the report cache). The
+offline job ``python -m app.cli.precompute_plants`` fills the store.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from app.config import settings
+from app.data.plant_compounds import get_catalog_version
+from app.models.schemas import BodyImpactReport
+from app.services.cache import cache_service
+from app.services.report_cache import is_cacheable
+
+logger = logging.getLogger(__name__)
+
+
+def aggregate_version() -> str:
+    """Inputs a stored plant analysis depends on: analysis code and catalog data"""
+    return f"{settings.app_version}:{get_catalog_version()}"
+
+
+def plant_aggregate_key(scientific_name: str, enable_predictions: bool) -> str:
+    return f"{scientific_name.lower()}:predictions={int(enable_predictions)}"
+
+
+@dataclass
+class PlantAggregate:
+    """Stored analysis of a catalog plant's prioritized compounds"""
+    compound_names: List[str]
+    compound_reports: List[BodyImpactReport]
+    aggregate_pathways: List[Dict[str, Any]]
+    version: str
+    computed_at: float
+
+    @property
+    def is_current(self) -> bool:
+        return (
+            self.version == aggregate_version()
+            and time.time() - self.computed_at <= settings.plant_aggregate_fresh_ttl
+        )
+
+
+class PlantAggregateStore:
+    """Per-plant aggregates in the shared cache, refreshed in the background"""
+
+    def __init__(self):
+        self.cache = cache_service
+        self.enabled = settings.plant_aggregates_enabled
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plant-refresh")
+        self._refreshing: Set[str] = set()
+        self._lock = Lock()
+
+    def load(self, scientific_name: str, enable_predictions: bool = False) -> Optional[PlantAggregate]:
+        """Stored aggregate (current or not), or None"""
+        entry = self.cache.get("plant_aggregate", plant_aggregate_key(scientific_name, enable_predictions))
+        if entry is None:
+            return None
+        try:
+            return PlantAggregate(
+                compound_names=entry["compound_names"],
+                compound_reports=[BodyImpactReport(**r) for r in entry["compound_reports"]],
+                aggregate_pathways=entry["aggregate_pathways"],
+                version=entry["version"],
+                computed_at=entry["computed_at"],
+            )
+        except Exception as e:
+            # Written by an incompatible version: treat as missing
+            logger.warning(f"Discarding unreadable plant aggregate for {scientific_name}: {e}")
+            return None
+
+    def get(
+        self,
+        scientific_name: str,
+        compound_names: List[str],
+        enable_predictions: bool,
+        refresh: Callable[[], Any]
+    ) -> Optional[PlantAggregate]:
+        """
+        Aggregate to serve for a plant, scheduling a refresh when it is not current.
+
+        Args:
+            scientific_name: Catalog plant
+            compound_names: Compounds the live pipeline would analyze; an
+                entry for a different selection is never served
+            enable_predictions: Analysis option (part of the key)
+            refresh: Recomputes and stores the aggregate (run in the background)
+
+        Returns:
+            PlantAggregate, or None when nothing usable is stored
+        """
+        if not self.enabled:
+            return None
+
+        aggregate = self.load(scientific_name, enable_predictions)
+        if aggregate is None or aggregate.compound_names != compound_names:
+            return None
+
+        if not aggregate.is_current:
+            self._schedule_refresh(plant_aggregate_key(scientific_name, enable_predictions), refresh)
+        return aggregate
+
+    def store(
+        self,
+        scientific_name: str,
+        compound_names: List[str],
+        compound_reports: List[BodyImpactReport],
+        aggregate_pathways: List[Dict[str, Any]],
+        enable_predictions: bool = False
+    ) -> bool:
+        """Store a plant analysis if every compound produced a complete report"""
+        if not self.enabled:
+            return False
+        if len(compound_reports) != len(compound_names) or not all(is_cacheable(r) for r in compound_reports):
+            logger.info(f"Not storing incomplete plant aggregate for {scientific_name}")
+            return False
+
+        return self.cache.set(
+            "plant_aggregate",
+            plant_aggregate_key(scientific_name, enable_predictions),
+            {
+                "compound_names": compound_names,
+                "compound_reports": [r.model_dump(mode="json") for r in compound_reports],
+                "aggregate_pathways": aggregate_pathways,
+                "version": aggregate_version(),
+                "computed_at": time.time(),
+            },
+            ttl=settings.plant_aggregate_ttl
+        )
+
+    def _schedule_refresh(self, key: str, refresh: Callable[[], Any]) -> None:
+        """Start a background refresh unless one is already running for key"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                refresh()
+                logger.info(f"Refreshed plant aggregate: {key}")
+            except Exception as e:
+                # Keep serving the stored entry; the next hit retries
+                logger.warning(f"Background plant aggregate refresh failed for {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(run)
+
+
+# Singleton instance
+plant_aggregate_store = PlantAggregateStore()
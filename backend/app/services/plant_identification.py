@@ -13,10 +13,10 @@ External database fallback:
 - PhytoHub (dietary phytochemicals)
 """
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 from app.clients.plantnet import PlantNetClient
@@ -33,8 +33,10 @@ from app.data.plant_compounds import (
     CompoundMetadata
 )
 from app.services.analysis import AnalysisService
+from app.services.plant_aggregates import plant_aggregate_store
 from app.models.schemas import IngredientInput, BodyImpactReport
-from app.utils.concurrent import fetch_concurrent
+from app.utils.concurrent import iter_concurrent, run_sync
+from app.utils.image_preprocessing import ImageBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,76 @@ class PlantAnalysisResult:
     summary: Dict[str, Any]
 
 
+@dataclass
+class PlantAnalysisEvent:
+    """
+    One step of a streamed plant analysis.
+
+    kind is "identification" (identification and compounds_found set),
+    "compound" (report set, in completion order) or "complete" (result set,
+    always last).
+    """
+    kind: str
+    identification: Optional[PlantIdentificationResult] = None
+    compounds_found: Optional[List[Any]] = None
+    report: Optional[BodyImpactReport] = None
+    result: Optional[PlantAnalysisResult] = None
+
+
+class PathwayAggregator:
+    """
+    Aggregates pathways across compound reports as they arrive.
+
+    Pathways affected by multiple compounds get higher scores.
+    """
+
+    def __init__(self):
+        self._pathways: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, report: BodyImpactReport) -> None:
+        for pathway in report.pathways:
+            info = self._pathways.get(pathway.pathway_id)
+            if info is None:
+                info = self._pathways[pathway.pathway_id] = {
+                    "pathway_id": pathway.pathway_id,
+                    "pathway_name": pathway.pathway_name,
+                    "pathway_url": pathway.pathway_url,
+                    "compounds": [],
+                    "max_impact": 0.0,
+                    "confidence_tier": pathway.confidence_tier.value,
+                }
+
+            info["compounds"].append(report.ingredient_name)
+            info["max_impact"] = max(info["max_impact"], pathway.impact_score)
+
+    def results(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Top pathways by aggregate score"""
+        aggregated = []
+        for pathway_id, info in self._pathways.items():
+            num_compounds = len(info["compounds"])
+            # Aggregate score: weighted combination of max impact and compound count
+            aggregate_score = (
+                info["max_impact"] * 0.6 +
+                min(num_compounds / 3, 1.0) * 0.4  # Cap at 3 compounds
+            )
+
+            aggregated.append({
+                "pathway_id": pathway_id,
+                "pathway_name": info["pathway_name"],
+                "pathway_url": info["pathway_url"],
+                "aggregate_score": round(aggregate_score, 3),
+                "max_impact": round(info["max_impact"], 3),
+                "num_compounds": num_compounds,
+                "compounds": list(info["compounds"]),
+                "confidence_tier": info["confidence_tier"],
+            })
+
+        # Sort by aggregate score
+        aggregated.sort(key=lambda x: x["aggregate_score"], reverse=True)
+
+        return aggregated[:limit]
+
+
 class PlantIdentificationService:
     """
     Service that identifies plants from images and analyzes their compounds.
@@ -118,68 +190,70 @@ class PlantIdentificationService:
         compounds = []
         seen_names = set()
 
-        # Fetch from Dr. Duke's and PhytoHub concurrently
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            duke_future = executor.submit(
-                dr_duke_client.get_plant_compounds_for_species, scientific_name
-            )
-            phytohub_futures = {
-                executor.submit(
-                    phytohub_client.get_plant_compounds_for_species, name
-                ): name
-                for name in common_names[:2]
-            }
-
-            # Process Dr. Duke's result first (deduplication priority)
-            try:
-                duke_result = duke_future.result(timeout=30)
-                if duke_result.get("found"):
-                    for comp in duke_result.get("compounds", [])[:max_compounds]:
-                        name = comp.get("name", "").lower()
-                        if name and name not in seen_names:
-                            seen_names.add(name)
-                            compounds.append(CompoundMetadata(
-                                name=comp.get("name"),
-                                research_level=0.4,
-                                drug_interaction_risk=0.3,
-                                bioactivity_strength=0.5,
-                                lifestyle_categories=self._activities_to_categories(
-                                    comp.get("activities", [])
-                                )
-                            ))
-                    logger.info(f"Dr. Duke's found {len(duke_result.get('compounds', []))} compounds")
-            except Exception as e:
-                logger.error(f"Error fetching from Dr. Duke's: {e}")
-
-            # Process PhytoHub results
-            for future in as_completed(phytohub_futures):
-                common_name = phytohub_futures[future]
-                if len(compounds) >= max_compounds:
-                    break
-                try:
-                    phytohub_result = future.result(timeout=30)
-                    if phytohub_result.get("found"):
-                        for comp in phytohub_result.get("compounds", []):
-                            name = comp.get("name", "").lower()
-                            if name and name not in seen_names:
-                                seen_names.add(name)
-                                compounds.append(CompoundMetadata(
-                                    name=comp.get("name"),
-                                    research_level=0.5,
-                                    drug_interaction_risk=0.2,
-                                    bioactivity_strength=0.4,
-                                    lifestyle_categories=self._compound_class_to_categories(
-                                        comp.get("compound_class")
-                                    )
-                                ))
-                                if len(compounds) >= max_compounds:
-                                    break
-                        logger.info(f"PhytoHub found {phytohub_result.get('compound_count', 0)} compounds")
-                except Exception as e:
-                    logger.error(f"Error fetching from PhytoHub for {common_name}: {e}")
+        # Fetch from Dr. Duke's and PhytoHub concurrently on one event loop
+        phytohub_names = common_names[:2]
+        duke_result, *phytohub_results = run_sync(self._fetch_external_sources(scientific_name, phytohub_names))
+
+        # Process Dr. Duke's result first (deduplication priority)
+        if isinstance(duke_result, Exception):
+            logger.error(f"Error fetching from Dr. Duke's: {duke_result}")
+        elif duke_result.get("found"):
+            for comp in duke_result.get("compounds", [])[:max_compounds]:
+                name = comp.get("name", "").lower()
+                if name and name not in seen_names:
+                    seen_names.add(name)
+                    compounds.append(CompoundMetadata(
+                        name=comp.get("name"),
+                        research_level=0.4,
+                        drug_interaction_risk=0.3,
+                        bioactivity_strength=0.5,
+                        lifestyle_categories=self._activities_to_categories(
+                            comp.get("activities", [])
+                        )
+                    ))
+            logger.info(f"Dr. Duke's found {len(duke_result.get('compounds', []))} compounds")
+
+        # Process PhytoHub results
+        for common_name, phytohub_result in zip(phytohub_names, phytohub_results):
+            if len(compounds) >= max_compounds:
+                break
+            if isinstance(phytohub_result, Exception):
+                logger.error(f"Error fetching from PhytoHub for {common_name}: {phytohub_result}")
+                continue
+            if phytohub_result.get("found"):
+                for comp in phytohub_result.get("compounds", []):
+                    name = comp.get("name", "").lower()
+                    if name and name not in seen_names:
+                        seen_names.add(name)
+                        compounds.append(CompoundMetadata(
+                            name=comp.get("name"),
+                            research_level=0.5,
+                            drug_interaction_risk=0.2,
+                            bioactivity_strength=0.4,
+                            lifestyle_categories=self._compound_class_to_categories(
+                                comp.get("compound_class")
+                            )
+                        ))
+                        if len(compounds) >= max_compounds:
+                            break
+                logger.info(f"PhytoHub found {phytohub_result.get('compound_count', 0)} compounds")
 
         return compounds[:max_compounds]
 
+    async def _fetch_external_sources(
+        self,
+        scientific_name: str,
+        common_names: List[str],
+        timeout: float = 30.0
+    ) -> List[Any]:
+        """Dr. Duke's result followed by one PhytoHub result per common name (exceptions in place of failures)"""
+        lookups = [dr_duke_client.get_plant_compounds_for_species_async(scientific_name)]
+        lookups += [phytohub_client.get_plant_compounds_for_species_async(name) for name in common_names]
+        return await asyncio.gather(
+            *(asyncio.wait_for(lookup, timeout) for lookup in lookups),
+            return_exceptions=True
+        )
+
     def _activities_to_categories(self, activities: List[str]) -> List[str]:
         """Convert Dr. Duke's biological activities to lifestyle categories."""
         categories = set()
@@ -241,14 +315,14 @@ class PlantIdentificationService:
 
     def identify_plant_from_image(
         self,
-        image_data: bytes,
+        image_data: ImageBuffer,
         organs: List[str] = None
     ) -> PlantIdentificationResult:
         """
         Identify a plant species from an image.
 
         Args:
-            image_data: Raw image bytes (JPEG, PNG)
+            image_data: Raw image bytes or a memoryview over an upload spool (JPEG, PNG)
             organs: Plant organs visible (leaf, flower, fruit, bark)
 
         Returns:
@@ -326,7 +400,7 @@ class PlantIdentificationService:
 
     def analyze_plant_from_image(
         self,
-        image_data: bytes,
+        image_data: ImageBuffer,
         organs: List[str] = None,
         max_compounds: int = 5,
         enable_predictions: bool = False
@@ -335,7 +409,7 @@ class PlantIdentificationService:
         Complete pipeline: identify plant and analyze its compounds.
 
         Args:
-            image_data: Raw image bytes
+            image_data: Raw image bytes or a memoryview over an upload spool
             organs: Plant organs visible in image
             max_compounds: Maximum compounds to analyze (for performance)
             enable_predictions: Whether to enable ML predictions
@@ -343,17 +417,47 @@ class PlantIdentificationService:
         Returns:
             PlantAnalysisResult with full pathway analysis
         """
+        for event in self.stream_plant_analysis(image_data, organs, max_compounds, enable_predictions):
+            if event.kind == "complete":
+                return event.result
+
+    def stream_plant_analysis(
+        self,
+        image_data: ImageBuffer,
+        organs: List[str] = None,
+        max_compounds: int = 5,
+        enable_predictions: bool = False
+    ) -> Iterator[PlantAnalysisEvent]:
+        """
+        Complete pipeline as a stream of events.
+
+        Yields the identification first, then each compound report as its
+        analysis completes (so one slow compound never holds back the
+        others), and finally the complete result with pathways aggregated
+        incrementally along the way.
+
+        Args:
+            image_data: Raw image bytes or a memoryview over an upload spool
+            organs: Plant organs visible in image
+            max_compounds: Maximum compounds to analyze (for performance)
+            enable_predictions: Whether to enable ML predictions
+
+        Yields:
+            PlantAnalysisEvent objects; the last one has kind "complete"
+        """
         # Step 1: Identify the plant
         identification = self.identify_plant_from_image(image_data, organs)
 
         if not identification.success:
-            return PlantAnalysisResult(
+            yield PlantAnalysisEvent("identification", identification=identification, compounds_found=[])
+            yield PlantAnalysisEvent("complete", result=PlantAnalysisResult(
                 identification=identification,
                 compounds_found=[],
                 compound_reports=[],
                 aggregate_pathways=[],
                 summary={"error": identification.error}
-            )
+            ))
+            return
 
         # Step 2: Get compounds from database using confidence-based prioritization
         compounds_found: List[CompoundMetadata] = []
@@ -405,7 +509,8 @@ class PlantIdentificationService:
                 logger.warning(
                     f"Plant {identification.scientific_name} not found in any database"
                 )
-                return PlantAnalysisResult(
+                yield PlantAnalysisEvent("identification", identification=identification, compounds_found=[])
+                yield PlantAnalysisEvent("complete", result=PlantAnalysisResult(
                     identification=identification,
                     compounds_found=[],
                     compound_reports=[],
@@ -417,24 +522,49 @@ class PlantIdentificationService:
                                    "Try searching for specific compounds manually.",
                         "databases_searched": ["Local", "Dr. Duke's (USDA)", "PhytoHub"]
                     }
-                )
+                ))
+                return
 
-        # Step 3: Analyze all compounds concurrently
-        compound_names = [compound.name for compound in compounds_found]
-        analyze_fn = partial(
-            self._analyze_single_compound, enable_predictions=enable_predictions
-        )
-        results_map = fetch_concurrent(analyze_fn, compound_names, max_workers=5, timeout=120.0)
+        yield PlantAnalysisEvent("identification", identification=identification, compounds_found=compounds_found)
 
-        # Preserve priority order from compounds_found
-        compound_reports = []
-        for compound in compounds_found:
-            report = results_map.get(compound.name)
-            if report:
-                compound_reports.append(report)
+        # Step 3: Analyze all compounds concurrently and aggregate pathways (step 4) as
+        # each report arrives. Catalog plants are served from their precomputed aggregate.
+        compound_names = [compound.name for compound in compounds_found]
+        precomputed = None
+        if not external_db_used:
+            precomputed = plant_aggregate_store.get(
+                identification.plant_info.scientific_name,
+                compound_names,
+                enable_predictions,
+                refresh=partial(self.precompute_plant, identification.plant_info, enable_predictions)
+            )
 
-        # Step 4: Aggregate pathways across all compounds
-        aggregate_pathways = self._aggregate_pathways(compound_reports)
+        if precomputed is not None:
+            logger.info(f"Serving precomputed analysis for {identification.plant_info.scientific_name}")
+            compound_reports = precomputed.compound_reports
+            aggregate_pathways = precomputed.aggregate_pathways
+            for report in compound_reports:
+                yield PlantAnalysisEvent("compound", report=report)
+        else:
+            aggregator = PathwayAggregator()
+            results_map: Dict[str, BodyImpactReport] = {}
+            for name, report in self._iter_compound_reports(compound_names, enable_predictions):
+                results_map[name] = report
+                aggregator.add(report)
+                yield PlantAnalysisEvent("compound", report=report)
+
+            # Preserve priority order from compounds_found
+            compound_reports = [results_map[name] for name in compound_names if name in results_map]
+            aggregate_pathways = aggregator.results()
+
+            if not external_db_used:
+                plant_aggregate_store.store(
+                    identification.plant_info.scientific_name,
+                    compound_names,
+                    compound_reports,
+                    aggregate_pathways,
+                    enable_predictions
+                )
 
         # Step 5: Generate summary
         summary = self._generate_plant_summary(
@@ -445,12 +575,48 @@ class PlantIdentificationService:
             external_db_used=external_db_used
         )
 
-        return PlantAnalysisResult(
+        yield PlantAnalysisEvent("complete", result=PlantAnalysisResult(
             identification=identification,
             compounds_found=compounds_found,
             compound_reports=compound_reports,
             aggregate_pathways=aggregate_pathways,
             summary=summary
+        ))
+
+    def _iter_compound_reports(
+        self,
+        compound_names: List[str],
+        enable_predictions: bool = False
+    ) -> Iterator[Tuple[str, BodyImpactReport]]:
+        """Analyze compounds concurrently (structures resolved in one PubChem batch first)"""
+        self.analysis_service.prefetch_compounds(compound_names)
+        analyze_fn = partial(
+            self._analyze_single_compound, enable_predictions=enable_predictions
+        )
+        yield from iter_concurrent(analyze_fn, compound_names, max_workers=5, timeout=120.0)
+
+    def precompute_plant(self, plant_info: PlantCompoundInfo, enable_predictions: bool = False) -> bool:
+        """
+        Analyze a catalog plant's prioritized compounds and store the aggregate.
+
+        Used by the offline precompute job and background refreshes.
+
+        Returns:
+            True if a complete aggregate was stored
+        """
+        compound_names = [c.name for c in get_prioritized_compounds(plant_info)]
+        aggregator = PathwayAggregator()
+        results_map: Dict[str, BodyImpactReport] = {}
+        for name, report in self._iter_compound_reports(compound_names, enable_predictions):
+            results_map[name] = report
+            aggregator.add(report)
+
+        return plant_aggregate_store.store(
+            plant_info.scientific_name,
+            compound_names,
+            [results_map[name] for name in compound_names if name in results_map],
+            aggregator.results(),
+            enable_predictions
         )
 
     def analyze_plant_from_base64(
@@ -496,66 +662,6 @@ class PlantIdentificationService:
                 summary={"error": f"Invalid image data: {e}"}
             )
 
-    def _aggregate_pathways(
-        self,
-        compound_reports: List[BodyImpactReport]
-    ) -> List[Dict[str, Any]]:
-        """
-        Aggregate pathways across multiple compound analyses.
-        Pathways affected by multiple compounds get higher scores.
-        """
-        pathway_scores: Dict[str, Dict[str, Any]] = {}
-
-        for report in compound_reports:
-            for pathway in report.pathways:
-                pathway_id = pathway.pathway_id
-
-                if pathway_id not in pathway_scores:
-                    pathway_scores[pathway_id] = {
-                        "pathway_id": pathway_id,
-                        "pathway_name": pathway.pathway_name,
-                        "pathway_url": pathway.pathway_url,
-                        "compounds": [],
-                        "total_impact": 0.0,
-                        "max_impact": 0.0,
-                        "confidence_tier": pathway.confidence_tier.value,
-                    }
-
-                pathway_scores[pathway_id]["compounds"].append(
-                    report.ingredient_name
-                )
-                pathway_scores[pathway_id]["total_impact"] += pathway.impact_score
-                pathway_scores[pathway_id]["max_impact"] = max(
-                    pathway_scores[pathway_id]["max_impact"],
-                    pathway.impact_score
-                )
-
-        # Calculate aggregate score (higher if multiple compounds affect pathway)
-        aggregated = []
-        for pathway_id, info in pathway_scores.items():
-            num_compounds = len(info["compounds"])
-            # Aggregate score: weighted combination of max impact and compound count
-            aggregate_score = (
-                info["max_impact"] * 0.6 +
-                min(num_compounds / 3, 1.0) * 0.4  # Cap at 3 compounds
-            )
-
-            aggregated.append({
-                "pathway_id": pathway_id,
-                "pathway_name": info["pathway_name"],
-                "pathway_url": info["pathway_url"],
-                "aggregate_score": round(aggregate_score, 3),
-                "max_impact": round(info["max_impact"], 3),
-                "num_compounds": num_compounds,
-                "compounds": info["compounds"],
-                "confidence_tier": info["confidence_tier"],
-            })
-
-        # Sort by aggregate score
-        aggregated.sort(key=lambda x: x["aggregate_score"], reverse=True)
-
-        return aggregated[:20]  # Top 20 pathways
-
     def _generate_plant_summary(
         self,
         identification: PlantIdentificationResult,
@@ -0,0 +1,220 @@
+"""Precomputed plant catalog listings for the /api/plants endpoints
+
+Plant summaries are built once per catalog data version and kept sorted
+by name for cursor pagination. Full plant entries, including prioritized
+compounds, are built on first use. Encoded pages and search results are
+kept with their ETags in a small LRU, so repeated requests cost a dict
+lookup. All of it is discarded when the catalog's data version changes.
+"""
+
+import base64
+import binascii
+import logging
+from bisect import bisect_right
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.data.plant_compounds import (
+    PLANT_COMPOUNDS_DB,
+    PlantCompoundInfo,
+    compound_to_dict,
+    get_catalog_version,
+    get_prioritized_compounds,
+    search_plant_fuzzy,
+)
+from app.utils.http_cache import encode_json, strong_etag
+
+logger = logging.getLogger(__name__)
+
+PLANT_FIELDS = ("scientific_name", "common_names", "family", "compound_count",
+                "compounds", "traditional_uses", "parts_used")
+SUMMARY_FIELDS = ("scientific_name", "common_names", "family", "compound_count")
+SEARCH_FIELDS = ("scientific_name", "common_names", "family", "compounds", "traditional_uses")
+
+# Encoded responses kept per data version
+ENCODED_CACHE_SIZE = 512
+
+
+class InvalidListingRequest(ValueError):
+    """Unknown field or malformed cursor"""
+
+
+def parse_fields(fields: Optional[str], default: Sequence[str]) -> Tuple[str, ...]:
+    """Validated field projection from a comma-separated query parameter"""
+    if not fields:
+        return tuple(default)
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in PLANT_FIELDS]
+    if unknown:
+        raise InvalidListingRequest(
+            f"Unknown fields: {', '.join(unknown)} (available: {', '.join(PLANT_FIELDS)})"
+        )
+    return requested or tuple(default)
+
+
+def encode_cursor(key: str) -> str:
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        return base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise InvalidListingRequest("Invalid cursor")
+
+
+def plant_entry(plant: PlantCompoundInfo) -> Dict[str, Any]:
+    """Every listable field of a plant"""
+    return {
+        "scientific_name": plant.scientific_name,
+        "common_names": plant.common_names,
+        "family": plant.family,
+        "compound_count": len(plant.compounds),
+        "compounds": [compound_to_dict(c) for c in get_prioritized_compounds(plant)],
+        "traditional_uses": plant.traditional_uses,
+        "parts_used": plant.parts_used,
+    }
+
+
+class PlantListingService:
+    """Versioned, precomputed listings over PLANT_COMPOUNDS_DB"""
+
+    def __init__(self, version_func: Callable[[], str] = get_catalog_version):
+        self._version_func = version_func
+        self._lock = Lock()
+        self._version: Optional[str] = None
+        self._keys: List[str] = []
+        self._summaries: List[Dict[str, Any]] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._encoded: "OrderedDict[tuple, Tuple[bytes, str]]" = OrderedDict()
+
+    @property
+    def version(self) -> str:
+        self._ensure_current()
+        return self._version
+
+    @property
+    def last_modified(self) -> float:
+        """Catalog file modification time, for Last-Modified headers"""
+        return PLANT_COMPOUNDS_DB.modified_at
+
+    def _ensure_current(self) -> None:
+        """Rebuild the summaries when the catalog's data version changed"""
+        version = self._version_func()
+        if version == self._version:
+            return
+        with self._lock:
+            if version == self._version:
+                return
+            summaries = sorted(
+                (
+                    (key, {
+                        "scientific_name": plant.scientific_name,
+                        "common_names": plant.common_names,
+                        "family": plant.family,
+                        "compound_count": len(plant.compounds),
+                    })
+                    for key, plant in PLANT_COMPOUNDS_DB.items()
+                ),
+                key=lambda item: item[0]
+            )
+            self._keys = [key for key, _ in summaries]
+            self._summaries = [summary for _, summary in summaries]
+            self._entries = {}
+            self._encoded = OrderedDict()
+            self._version = version
+            logger.info(f"Built plant listing for catalog version {version} ({len(self._keys)} plants)")
+
+    def _entry(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = plant_entry(PLANT_COMPOUNDS_DB[key])
+        return entry
+
+    def _project(self, index: int, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        source = self._summaries[index]
+        if not set(fields) <= source.keys():
+            source = self._entry(self._keys[index])
+        return {f: source[f] for f in fields}
+
+    def _encoded_response(self, cache_key: tuple, build: Callable[[], Any]) -> Tuple[bytes, str]:
+        """(body, ETag) for a response, encoded once per data version"""
+        cached = self._encoded.get(cache_key)
+        if cached is not None:
+            self._encoded.move_to_end(cache_key)
+            return cached
+
+        body = encode_json(build())
+        cached = (body, strong_etag(body))
+        self._encoded[cache_key] = cached
+        if len(self._encoded) > ENCODED_CACHE_SIZE:
+            self._encoded.popitem(last=False)
+        return cached
+
+    def listing_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Tuple[bytes, str]:
+        """
+        One page of plants sorted by name.
+
+        Args:
+            limit: Maximum plants on the page
+            cursor: next_cursor from the previous page (None for the first)
+            fields: Comma-separated projection (default: summary fields)
+
+        Returns:
+            (encoded body, strong ETag); the body has total, count, plants
+            and next_cursor (None on the last page)
+
+        Raises:
+            InvalidListingRequest: Unknown field or malformed cursor
+        """
+        self._ensure_current()
+        projection = parse_fields(fields, SUMMARY_FIELDS)
+        after = decode_cursor(cursor) if cursor else None
+
+        def build() -> Dict[str, Any]:
+            start = bisect_right(self._keys, after) if after is not None else 0
+            end = min(start + limit, len(self._keys))
+            plants = [self._project(i, projection) for i in range(start, end)]
+            return {
+                "total": len(self._keys),
+                "count": len(plants),
+                "plants": plants,
+                "next_cursor": encode_cursor(self._keys[end - 1]) if end < len(self._keys) else None,
+            }
+
+        return self._encoded_response(("list", after, limit, projection), build)
+
+    def search(self, query: str, fields: Optional[str] = None) -> Tuple[bytes, str]:
+        """Search results (scientific, common or family name) as (encoded body, ETag)"""
+        self._ensure_current()
+        projection = parse_fields(fields, SEARCH_FIELDS)
+
+        def build() -> Dict[str, Any]:
+            results = [
+                {f: self._entry(plant.scientific_name.lower())[f] for f in projection}
+                for plant in search_plant_fuzzy(query)
+            ]
+            return {"query": query, "count": len(results), "results": results}
+
+        return self._encoded_response(("search", query, projection), build)
+
+    def plant(self, scientific_name: str) -> Optional[Tuple[bytes, str]]:
+        """Full entry for one plant as (encoded body, ETag), or None if unknown"""
+        self._ensure_current()
+        key = scientific_name.lower()
+        if key not in PLANT_COMPOUNDS_DB:
+            return None
+        return self._encoded_response(
+            ("plant", key),
+            lambda: {f: self._entry(key)[f] for f in PLANT_FIELDS if f != "compound_count"}
+        )
+
+
+# Singleton instance
+plant_listing_service = PlantListingService()
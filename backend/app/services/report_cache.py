@@ -0,0 +1,183 @@
+"""Report-level cache with stale-while-revalidate
+
+Caches whole BodyImpactReports so repeat analyses skip pathway mapping,
+scoring, indication inference and summary generation entirely. Entries
+older than the fresh window are still served, while a single background
+refresh recomputes them.
+
+Reports are stored as their encoded JSON bytes (an entry of their own,
+next to a small entry holding the cache time), so a hit can be sent to
+the client as-is (``get_or_compute_json``) without decoding, building or
+validating anything; ``get_or_compute`` parses the same bytes back into
+a model.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Optional, Set
+
+from app.config import settings
+from app.models.schemas import IngredientInput, BodyImpactReport
+from app.services.cache import cache_service
+from app.utils.responses import model_json
+
+logger = logging.getLogger(__name__)
+
+
+def report_cache_key(ingredient_input: IngredientInput, analysis_version: Optional[str] = None) -> str:
+    """Versioned key: normalized ingredient + options + analysis version"""
+    name = " ".join(ingredient_input.ingredient_name.split()).casefold()
+    predictions = int(ingredient_input.enable_predictions)
+    return f"v{analysis_version or settings.app_version}:{name}:predictions={predictions}"
+
+
+def is_cacheable(report: BodyImpactReport) -> bool:
+    """Only complete, successful reports are worth serving to other users"""
+    return "error" not in report.final_summary and not report.is_partial
+
+
+class ReportCache:
+    """Stale-while-revalidate cache for BodyImpactReports"""
+
+    def __init__(self):
+        self.cache = cache_service
+        self.enabled = settings.report_cache_enabled
+        self.fresh_ttl = settings.report_cache_fresh_ttl
+        self.stale_ttl = settings.report_cache_stale_ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.report_refresh_workers,
+            thread_name_prefix="report-refresh"
+        )
+        self._refreshing: Set[str] = set()
+        self._lock = Lock()
+
+    def get_or_compute(
+        self,
+        ingredient_input: IngredientInput,
+        compute: Callable[[], BodyImpactReport]
+    ) -> BodyImpactReport:
+        """
+        Return a cached report, computing it on a miss.
+
+        Stale entries are returned immediately and refreshed in the
+        background; only one refresh per key runs at a time.
+
+        Args:
+            ingredient_input: Analysis input (determines the cache key)
+            compute: Runs the full pipeline for this input
+
+        Returns:
+            BodyImpactReport
+        """
+        if not self.enabled:
+            return compute()
+
+        key = report_cache_key(ingredient_input)
+        cached = self._lookup(key, compute)
+        if cached is not None:
+            return BodyImpactReport.model_validate_json(cached)
+
+        report = compute()
+        self.store(key, report)
+        return report
+
+    def get_or_compute_json(
+        self,
+        ingredient_input: IngredientInput,
+        compute: Callable[[], BodyImpactReport]
+    ) -> bytes:
+        """
+        Like get_or_compute, but return the report's encoded JSON.
+
+        Hits return the stored bytes without building a model.
+
+        Args:
+            ingredient_input: Analysis input (determines the cache key)
+            compute: Runs the full pipeline for this input
+
+        Returns:
+            BodyImpactReport encoded as JSON
+        """
+        if not self.enabled:
+            return model_json(compute())
+
+        key = report_cache_key(ingredient_input)
+        cached = self._lookup(key, compute)
+        if cached is not None:
+            return cached
+
+        report = compute()
+        encoded = model_json(report)
+        self.store(key, report, encoded)
+        return encoded
+
+    def _lookup(self, key: str, compute: Callable[[], BodyImpactReport]) -> Optional[bytes]:
+        """Encoded cached report for key, scheduling a refresh when it is stale"""
+        entry = self.cache.get("report", key)
+        if entry is None or "report_json" in entry:
+            # Entries from before reports were stored as raw bytes count as misses
+            return None
+        encoded = self.cache.get("report_json", key)
+        if encoded is None:
+            return None
+
+        age = time.time() - entry["cached_at"]
+        if age > self.fresh_ttl:
+            self._schedule_refresh(key, compute)
+        logger.debug(f"Report cache hit for {key} (age: {age:.0f}s)")
+        return encoded
+
+    def store(self, key: str, report: BodyImpactReport, encoded: Optional[bytes] = None) -> bool:
+        """
+        Cache a report if it is complete; stale entries expire after stale_ttl.
+
+        Args:
+            key: Report cache key
+            report: Report to cache
+            encoded: The report's JSON, if the caller already encoded it
+        """
+        if not is_cacheable(report):
+            return False
+        # Bytes first, so a timestamp entry never points at a missing body
+        return (
+            self.cache.set("report_json", key, encoded or model_json(report), ttl=self.stale_ttl)
+            and self.cache.set("report", key, {"cached_at": time.time()}, ttl=self.stale_ttl)
+        )
+
+    def refresh(self, ingredient_input: IngredientInput, report: BodyImpactReport) -> BodyImpactReport:
+        """Overwrite the cached report with a freshly computed one"""
+        if self.enabled:
+            self.store(report_cache_key(ingredient_input), report)
+        return report
+
+    def invalidate(self, ingredient_input: IngredientInput) -> bool:
+        """Drop the cached report for an input"""
+        key = report_cache_key(ingredient_input)
+        self.cache.delete("report_json", key)
+        return self.cache.delete("report", key)
+
+    def _schedule_refresh(self, key: str, compute: Callable[[], BodyImpactReport]) -> None:
+        """Start a background refresh unless one is already running for key"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.store(key, compute())
+                logger.info(f"Refreshed stale report: {key}")
+            except Exception as e:
+                # Keep serving the stale entry; the next hit retries
+                logger.warning(f"Background report refresh failed for {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+
+# Singleton instance
+report_cache = ReportCache()
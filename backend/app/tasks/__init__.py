@@ -1,5 +1,17 @@
 """Celery tasks for async processing"""
 
-from .celery_tasks import celery_app, analyze_ingredient_task
+from .celery_tasks import (
+    celery_app,
+    analyze_ingredient_task,
+    analyze_batch_task,
+    summarize_batches_task,
+    submit_bulk_analysis,
+)
 
-__all__ = ["celery_app", "analyze_ingredient_task"]
+__all__ = [
+    "celery_app",
+    "analyze_ingredient_task",
+    "analyze_batch_task",
+    "summarize_batches_task",
+    "submit_bulk_analysis",
+]
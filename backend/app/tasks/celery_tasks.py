@@ -1,11 +1,21 @@
 """Celery tasks for async analysis jobs"""
 
-from celery import Celery
+from celery import Celery, group, chord
+from celery.result import AsyncResult
+from celery.signals import worker_process_init, task_prerun
+from celery.worker.control import inspect_command
+from kombu import Queue
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Optional
 import logging
+import time
 
 from app.config import settings
 from app.models.schemas import IngredientInput, BodyImpactReport
 from app.services.analysis import AnalysisService
+from app.utils.deadline import request_deadline, run_in_context
+from app.utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +32,138 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # Only prefork enforces these; under the threads pool, task bodies run
+    # under a request deadline of the same length instead (see task_deadline)
     task_time_limit=settings.celery_task_time_limit,
     task_soft_time_limit=settings.celery_task_time_limit - 60,
+    # Tasks are I/O-bound (upstream APIs), so a threads pool lets every task in a
+    # worker share one AnalysisService and therefore one set of rate limiters.
+    worker_pool=settings.celery_worker_pool,
+    worker_concurrency=settings.celery_worker_concurrency,
+    # Long batch tasks must not be hoarded by one worker while others sit idle;
+    # ack late so a batch on a lost worker is redelivered instead of dropped.
+    worker_prefetch_multiplier=settings.celery_worker_prefetch_multiplier,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Interactive /analyze jobs and bulk backfills run on separate queues (and
+    # worker pools) so a nightly backfill can never starve UI requests.
+    task_queues=[
+        Queue(
+            settings.celery_interactive_queue,
+            routing_key=settings.celery_interactive_queue,
+            queue_arguments={"x-max-priority": settings.celery_max_priority},
+        ),
+        Queue(
+            settings.celery_bulk_queue,
+            routing_key=settings.celery_bulk_queue,
+            queue_arguments={"x-max-priority": settings.celery_max_priority},
+        ),
+    ],
+    task_default_queue=settings.celery_interactive_queue,
+    task_routes={
+        "analyze_ingredient": {"queue": settings.celery_interactive_queue},
+        "analyze_ingredient_batch": {"queue": settings.celery_bulk_queue},
+        "summarize_ingredient_batches": {"queue": settings.celery_bulk_queue},
+    },
+    task_default_priority=settings.celery_default_priority,
+    # Redis emulates priorities with one list per step
+    broker_transport_options={
+        "priority_steps": list(range(settings.celery_max_priority + 1)),
+        "queue_order_strategy": "priority",
+    },
 )
 
 
+def broker_priority(priority: int) -> int:
+    """
+    Convert an API priority (higher = more urgent) to the broker's scale.
+
+    RabbitMQ delivers higher priorities first; the Redis transport
+    delivers lower numbers first, so the scale is flipped there.
+    """
+    priority = max(0, min(priority, settings.celery_max_priority))
+    if settings.celery_broker_url.startswith(("redis://", "rediss://")):
+        return settings.celery_max_priority - priority
+    return priority
+
+
+def enqueue_headers() -> dict:
+    """Message headers used to measure time spent waiting in the queue"""
+    return {"enqueued_at": time.time()}
+
+
+@task_prerun.connect
+def _record_queue_wait(task=None, **kwargs) -> None:
+    """Record how long a task sat in its queue before a worker picked it up"""
+    if task is None:
+        return
+    enqueued_at = task.request.get("enqueued_at")
+    delivery_info = task.request.delivery_info or {}
+    queue = delivery_info.get("routing_key") or settings.celery_interactive_queue
+    if enqueued_at:
+        metrics.observe(f"queue_wait_seconds.{queue}", max(0.0, time.time() - enqueued_at))
+    metrics.increment(f"tasks_started.{queue}")
+
+
+@inspect_command()
+def queue_metrics(state) -> dict:
+    """Worker remote-control command returning this worker's queue metrics"""
+    return metrics.snapshot()
+
+
+def get_queue_depths() -> dict:
+    """
+    Return the number of messages waiting in each analysis queue.
+
+    Uses a passive queue declare, which works on RabbitMQ and Redis and
+    never creates queues. Returns None for a queue the broker can't report.
+    """
+    depths = {}
+    with celery_app.connection_for_read() as conn:
+        channel = conn.default_channel
+        for queue in (settings.celery_interactive_queue, settings.celery_bulk_queue):
+            try:
+                depths[queue] = channel.queue_declare(queue=queue, passive=True).message_count
+            except Exception as e:
+                logger.debug(f"Queue depth unavailable for {queue}: {e}")
+                depths[queue] = None
+    return depths
+
+# Long-lived per-worker-process service (clients, rate limiters, cache handle)
+_analysis_service: Optional[AnalysisService] = None
+_analysis_service_lock = Lock()
+
+
+def get_analysis_service() -> AnalysisService:
+    """Return this worker process's shared AnalysisService, creating it on first use"""
+    global _analysis_service
+    if _analysis_service is None:
+        # Threads-pool tasks may race here; only one may build the service
+        with _analysis_service_lock:
+            if _analysis_service is None:
+                _analysis_service = AnalysisService()
+    return _analysis_service
+
+
+@worker_process_init.connect
+def _reset_analysis_service(**kwargs) -> None:
+    """Give each forked worker process its own service instead of the parent's copy"""
+    global _analysis_service, _analysis_service_lock
+    _analysis_service = None
+    _analysis_service_lock = Lock()
+
+
+def task_deadline():
+    """
+    Bound a task body's upstream I/O to the task time limit.
+
+    Celery's threads pool ignores task_time_limit, so without this a hung
+    upstream call could hold a worker thread forever. Under the deadline
+    every client timeout is clamped and retries stop when time runs out.
+    """
+    return request_deadline(settings.celery_task_time_limit)
+
+
 @celery_app.task(name="analyze_ingredient", bind=True)
 def analyze_ingredient_task(self, ingredient_data: dict) -> dict:
     """
@@ -45,8 +182,9 @@ def analyze_ingredient_task(self, ingredient_data: dict) -> dict:
         ingredient_input = IngredientInput(**ingredient_data)
 
         # Run analysis
-        service = AnalysisService()
-        report = service.analyze_ingredient(ingredient_input)
+        service = get_analysis_service()
+        with task_deadline():
+            report = service.analyze_ingredient(ingredient_input)
 
         logger.info(f"Async analysis complete: {ingredient_input.ingredient_name}")
 
@@ -60,3 +198,116 @@ def analyze_ingredient_task(self, ingredient_data: dict) -> dict:
             meta={"error": str(e)}
         )
         raise
+
+
+def _summarize_report(report: BodyImpactReport) -> dict:
+    """Compact per-ingredient outcome for bulk results"""
+    return {
+        "ingredient_name": report.ingredient_name,
+        "status": "failed" if "error" in report.final_summary else "completed",
+        "targets_found": len(report.known_targets),
+        "pathways_found": len(report.pathways),
+        "error": report.final_summary.get("error"),
+    }
+
+
+@celery_app.task(name="analyze_ingredient_batch", bind=True)
+def analyze_batch_task(
+    self,
+    ingredients: List[dict],
+    return_reports: bool = False,
+    refresh: bool = True
+) -> List[dict]:
+    """
+    Analyze a chunk of ingredients in one task.
+
+    Ingredients are processed concurrently on the worker's shared
+    AnalysisService, so the chunk pays task and client setup once and the
+    shared rate limiters keep upstream traffic within limits. A failing
+    ingredient is reported in the results instead of failing the chunk.
+
+    Args:
+        ingredients: List of IngredientInput dicts
+        return_reports: Return full reports instead of compact summaries
+        refresh: Recompute reports and overwrite the report cache (re-scoring)
+
+    Returns:
+        One result dict per ingredient, in input order
+    """
+    service = get_analysis_service()
+    logger.info(f"Starting batch analysis of {len(ingredients)} ingredients")
+
+    def analyze_one(ingredient_data: dict) -> dict:
+        try:
+            report = service.analyze_ingredient(
+                IngredientInput(**ingredient_data),
+                force_refresh=refresh
+            )
+            if return_reports:
+                return report.model_dump(mode="json")
+            return _summarize_report(report)
+        except Exception as e:
+            logger.error(f"Batch analysis failed for {ingredient_data}: {e}")
+            return {
+                "ingredient_name": ingredient_data.get("ingredient_name"),
+                "status": "failed",
+                "error": str(e),
+            }
+
+    with task_deadline():
+        service.prefetch_compounds([i.get("ingredient_name") for i in ingredients])
+        # Each worker thread inherits the deadline
+        analyze = run_in_context(analyze_one)
+        with ThreadPoolExecutor(max_workers=settings.celery_batch_concurrency) as executor:
+            results = list(executor.map(analyze, ingredients))
+
+    logger.info(f"Batch analysis complete: {len(results)} ingredients")
+    return results
+
+
+@celery_app.task(name="summarize_ingredient_batches")
+def summarize_batches_task(chunk_results: List[List[dict]]) -> dict:
+    """Chord callback: merge chunk results into one bulk-run summary"""
+    results = [result for chunk in chunk_results for result in chunk]
+    failed = [r.get("ingredient_name") for r in results if r.get("status") == "failed"]
+
+    return {
+        "total": len(results),
+        "completed": len(results) - len(failed),
+        "failed": len(failed),
+        "failed_ingredients": failed[:100],
+    }
+
+
+def submit_bulk_analysis(
+    ingredients: List[dict],
+    chunk_size: Optional[int] = None
+) -> AsyncResult:
+    """
+    Fan a large ingredient list out as chunked batch tasks.
+
+    Args:
+        ingredients: List of IngredientInput dicts
+        chunk_size: Ingredients per batch task (default: settings.celery_batch_chunk_size)
+
+    Returns:
+        AsyncResult of the chord callback, which resolves to the run summary
+    """
+    chunk_size = chunk_size or settings.celery_batch_chunk_size
+    chunks = [
+        ingredients[i:i + chunk_size]
+        for i in range(0, len(ingredients), chunk_size)
+    ]
+
+    logger.info(f"Submitting bulk analysis: {len(ingredients)} ingredients in {len(chunks)} chunks")
+
+    options = {
+        "queue": settings.celery_bulk_queue,
+        "priority": broker_priority(settings.celery_bulk_priority),
+    }
+    header = group(
+        analyze_batch_task.s(chunk).set(headers=enqueue_headers(), **options) for chunk in chunks
+    )
+    # The callback is only published once every chunk finishes; stamping it now
+    # would report the whole batch runtime as queue wait
+    return chord(header)(summarize_batches_task.s().set(**options))
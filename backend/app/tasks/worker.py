@@ -0,0 +1,49 @@
+"""Start a Celery worker pool dedicated to one analysis queue
+
+Usage:
+    python -m app.tasks.worker interactive
+    python -m app.tasks.worker bulk --concurrency 4
+"""
+
+import argparse
+from typing import List, Optional
+
+from app.config import settings
+from app.tasks.celery_tasks import celery_app
+
+
+def worker_argv(queue: str, concurrency: Optional[int] = None) -> List[str]:
+    """Build the worker command line for a queue using its configured concurrency"""
+    pools = {
+        settings.celery_interactive_queue: settings.celery_interactive_concurrency,
+        settings.celery_bulk_queue: settings.celery_bulk_concurrency,
+    }
+    if queue not in pools:
+        raise ValueError(f"Unknown queue '{queue}'. Expected one of: {', '.join(pools)}")
+
+    return [
+        "worker",
+        "--queues", queue,
+        "--hostname", f"{queue}@%h",
+        "--pool", settings.celery_worker_pool,
+        "--concurrency", str(concurrency or pools[queue]),
+        "--prefetch-multiplier", str(settings.celery_worker_prefetch_multiplier),
+        "--loglevel", "INFO",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a BioPath Celery worker for one queue")
+    parser.add_argument(
+        "queue",
+        choices=[settings.celery_interactive_queue, settings.celery_bulk_queue],
+        help="Queue this worker pool consumes"
+    )
+    parser.add_argument("--concurrency", type=int, default=None, help="Override configured concurrency")
+    args = parser.parse_args()
+
+    celery_app.worker_main(worker_argv(args.queue, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Utility modules"""
 
 from .rate_limiter import RateLimiter
-from .concurrent import fetch_concurrent
+from .concurrent import fetch_concurrent, iter_concurrent, run_sync
+from .metrics import MetricsRegistry, metrics
 
-__all__ = ["RateLimiter", "fetch_concurrent"]
+__all__ = ["RateLimiter", "fetch_concurrent", "iter_concurrent", "run_sync", "MetricsRegistry", "metrics"]
@@ -0,0 +1,182 @@
+"""Per-upstream circuit breakers
+
+A breaker trips open after ``failure_threshold`` consecutive upstream
+failures and then fails fast (CircuitOpenError, never retried) instead of
+paying timeouts and retry backoff on every call. After
+``recovery_seconds`` it goes half-open and lets a single probe call
+through: success closes it, failure re-opens it.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Iterator, Optional
+
+import httpx
+
+from app.config import settings
+from app.utils.deadline import remaining
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose breaker is open"""
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Failures that say the upstream is unhealthy (not 'your request was bad')"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream service"""
+
+    def __init__(self, name: str, failure_threshold: int, recovery_seconds: float):
+        """
+        Initialize breaker.
+
+        Args:
+            name: Upstream name used in logs and metrics
+            failure_threshold: Consecutive failures that trip the breaker
+            recovery_seconds: Time open before a half-open probe is allowed
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = Lock()
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected (open and not yet due for a probe)"""
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self.opened_at < self.recovery_seconds
+
+    def before_call(self) -> None:
+        """
+        Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: Breaker is open, or a half-open probe is already running
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_seconds:
+                    metrics.increment(f"circuit_rejected.{self.name}")
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                self.state = HALF_OPEN
+                logger.info(f"Circuit {self.name} half-open: probing")
+
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    metrics.increment(f"circuit_rejected.{self.name}")
+                    raise CircuitOpenError(f"{self.name} circuit is half-open (probe in flight)")
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(
+                        f"Circuit {self.name} opened after {self.failures} failures; "
+                        f"failing fast for {self.recovery_seconds:.0f}s"
+                    )
+                    metrics.increment(f"circuit_opened.{self.name}")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a call that neither proved nor disproved upstream health"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    @contextmanager
+    def guard(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Wrap one upstream call.
+
+        Upstream failures (transport errors, 5xx, 429) count toward
+        tripping; other exceptions (404s, parse errors) and cancellation
+        pass through without affecting the breaker, but still free the
+        half-open probe slot.
+
+        Args:
+            timeout: The client's full per-call timeout. When the request
+                deadline leaves less than this, the call's timeout was
+                clamped, and a timeout says more about the request's budget
+                than the upstream's health, so it doesn't count.
+        """
+        left = remaining() if timeout is not None else None
+        clamped = left is not None and left < timeout
+        self.before_call()
+        try:
+            yield
+        except Exception as e:
+            if clamped and isinstance(e, httpx.TimeoutException):
+                self.release()
+            elif is_upstream_failure(e):
+                self.record_failure()
+            elif isinstance(e, httpx.HTTPStatusError):
+                self.record_success()  # Upstream answered; the request was just a miss
+            else:
+                self.release()
+            raise
+        except BaseException:
+            # Cancelled (e.g. by asyncio.wait_for) or interrupted mid-call
+            self.release()
+            raise
+        else:
+            self.record_success()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"state": self.state, "consecutive_failures": self.failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for an upstream, creating it on first use"""
+    with _registry_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_failure_threshold,
+                recovery_seconds=settings.circuit_recovery_seconds
+            )
+        return _breakers[name]
+
+
+def circuit_open(name: str) -> bool:
+    """True if calls to this upstream would currently fail fast"""
+    return get_breaker(name).is_open()
+
+
+def breaker_states() -> Dict[str, dict]:
+    """State of every breaker created so far"""
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
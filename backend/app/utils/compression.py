@@ -0,0 +1,252 @@
+"""Content-negotiated response compression
+
+JSON, NDJSON and text responses are compressed with the best encoding the
+client accepts: zstd and br when the optional ``zstandard`` and
+``brotli`` packages are installed, gzip always. Bodies under
+``compression_min_size`` are sent as-is; responses arriving in several
+chunks are compressed chunk by chunk, with a flush after each one, so
+streamed events (NDJSON plant analyses) still arrive as they are produced.
+
+A compressed response is a different representation, so it gets its own
+strong ETag: the identity tag with the encoding appended (``"abc-gzip"``).
+The suffix is stripped from If-None-Match before the request reaches the
+routes, which compare against identity tags only, and a 304 echoes the
+tag the client sent. Compressible responses carry ``Vary: Accept-Encoding``.
+"""
+
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from app.config import settings
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=settings.compression_brotli_quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=settings.compression_zstd_level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Installed encoders, most preferred first (used to break q-value ties)
+ENCODERS = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+ENCODERS["gzip"] = GzipEncoder
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Best installed encoding allowed by an Accept-Encoding header, or None"""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        param = params.strip().lower()
+        if param.startswith("q="):
+            try:
+                q = float(param[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for name in ENCODERS:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Tag of the encoded representation of the entity tagged etag"""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def identity_etag(etag: str) -> str:
+    """Strip an encoding suffix added by encoded_etag"""
+    for encoding in ("zstd", "br", "gzip"):  # Also ones another worker may have installed
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def _is_compressible(headers: MutableHeaders) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        content_type.startswith(COMPRESSIBLE_TYPES)
+        and "content-encoding" not in headers
+        and "no-transform" not in headers.get("cache-control", "")
+    )
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses per the client's Accept-Encoding"""
+
+    def __init__(self, app, min_size: Optional[int] = None):
+        self.app = app
+        self.min_size = settings.compression_min_size if min_size is None else min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        client_tags = [
+            tag.strip() for tag in request_headers.get("if-none-match", "").split(",") if tag.strip()
+        ]
+        if client_tags:
+            # Routes only know identity tags
+            scope = dict(scope, headers=[
+                (b"if-none-match", ", ".join(identity_etag(t) for t in client_tags).encode("latin-1"))
+                if name == b"if-none-match" else (name, value)
+                for name, value in scope["headers"]
+            ])
+
+        responder = CompressionResponder(
+            send,
+            negotiate_encoding(request_headers.get("accept-encoding", "")),
+            client_tags,
+            self.min_size,
+            head=scope["method"] == "HEAD",
+        )
+        await self.app(scope, receive, responder)
+
+
+class CompressionResponder:
+    """Wraps ASGI send for one response; holds the start message until the first body chunk"""
+
+    def __init__(self, send, encoding: Optional[str], client_tags: List[str], min_size: int, head: bool = False):
+        self.send = send
+        self.encoding = encoding
+        self.client_tags = client_tags
+        self.min_size = min_size
+        self.head = head
+        self.start_message = None
+        self.encoder = None
+        self.started = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            if message["status"] == 304:
+                self._not_modified(message)
+                await self.send(message)
+                self.started = True
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or (self.started and self.encoder is None):
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(scope=self.start_message)
+            compressible = not self.head and _is_compressible(headers)
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+
+            # Declared length first: wrapped responses (BaseHTTPMiddleware) arrive in chunks
+            declared = headers.get("content-length")
+            size = int(declared) if declared and declared.isdigit() else (None if more_body else len(body))
+            if compressible and self.encoding and (size is None or size >= self.min_size):
+                self.encoder = ENCODERS[self.encoding]()
+                headers["Content-Encoding"] = self.encoding
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    body = self.encoder.compress(body) + self.encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await self.send(self.start_message)
+                    await self.send({"type": "http.response.body", "body": body})
+                    return
+
+            await self.send(self.start_message)
+            if self.encoder is None:
+                await self.send(message)
+                return
+
+        chunk = self.encoder.compress(body)
+        chunk += self.encoder.flush() if more_body else self.encoder.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _not_modified(self, message) -> None:
+        """Echo the tag the client holds (which may be an encoded variant)"""
+        headers = MutableHeaders(scope=message)
+        etag = headers.get("etag")
+        if etag is None:
+            return
+        headers.add_vary_header("Accept-Encoding")
+        candidates = [encoded_etag(etag, self.encoding)] if self.encoding else []
+        candidates.append(etag)
+        held = {t.removeprefix("W/") for t in self.client_tags}
+        for candidate in candidates:
+            if candidate.removeprefix("W/") in held:
+                headers["ETag"] = candidate
+                return
@@ -1,50 +1,114 @@
 """Concurrent execution utilities for API calls"""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Callable, TypeVar
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import List, Dict, Any, Awaitable, Callable, Iterator, Tuple, TypeVar
 import logging
 
+from app.utils.deadline import remaining, run_in_context
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
-def fetch_concurrent(
+def iter_concurrent(
     fetch_func: Callable[[str], T],
     identifiers: List[str],
     max_workers: int = 5,
     timeout: float = 120.0
-) -> Dict[str, T]:
+) -> Iterator[Tuple[str, T]]:
     """
-    Execute fetch function concurrently for multiple identifiers.
+    Execute fetch function concurrently, yielding results as they complete.
 
     Args:
         fetch_func: Function that takes an identifier and returns a result
         identifiers: List of identifiers to process
         max_workers: Maximum concurrent threads
-        timeout: Total timeout for all operations
+        timeout: Total timeout for all operations (capped by the request deadline)
 
-    Returns:
-        Dict mapping identifier -> result (only successful fetches)
+    Yields:
+        (identifier, result) pairs in completion order (only successful,
+        non-None fetches). When the request deadline cuts the wait short,
+        iteration simply stops. Closing the iterator early cancels queued work.
     """
-    results = {}
-
     if not identifiers:
-        return results
+        return
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Never wait past the request deadline; workers inherit it via the context
+    left = remaining()
+    deadline_bound = left is not None and left < timeout
+    if deadline_bound:
+        timeout = max(0.0, left)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    completed = 0
+    try:
+        fetch = run_in_context(fetch_func)
         future_to_id = {
-            executor.submit(fetch_func, identifier): identifier
+            executor.submit(fetch, identifier): identifier
             for identifier in identifiers
         }
 
-        for future in as_completed(future_to_id, timeout=timeout):
-            identifier = future_to_id[future]
-            try:
-                result = future.result()
+        try:
+            for future in as_completed(future_to_id, timeout=timeout):
+                identifier = future_to_id[future]
+                completed += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {identifier}: {e}")
+                    continue
                 if result is not None:
-                    results[identifier] = result
-            except Exception as e:
-                logger.warning(f"Failed to fetch {identifier}: {e}")
+                    yield identifier, result
+        except FuturesTimeoutError:
+            if not deadline_bound:
+                raise
+            logger.warning(
+                f"Request deadline reached: {completed}/{len(identifiers)} fetches completed"
+            )
+    finally:
+        # Don't block on stragglers; queued work is cancelled
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_concurrent(
+    fetch_func: Callable[[str], T],
+    identifiers: List[str],
+    max_workers: int = 5,
+    timeout: float = 120.0
+) -> Dict[str, T]:
+    """
+    Execute fetch function concurrently for multiple identifiers.
+
+    Args:
+        fetch_func: Function that takes an identifier and returns a result
+        identifiers: List of identifiers to process
+        max_workers: Maximum concurrent threads
+        timeout: Total timeout for all operations (capped by the request deadline)
+
+    Returns:
+        Dict mapping identifier -> result (only successful fetches). When the
+        request deadline cuts the wait short, only results received in time.
+    """
+    return dict(iter_concurrent(fetch_func, identifiers, max_workers, timeout))
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Callers on worker threads (the usual case) get a fresh event loop; from
+    a thread that is already running a loop, the coroutine runs on a helper
+    thread instead. The request deadline carries over either way.
+    """
+    async def main() -> T:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
 
-    return results
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_in_context(asyncio.run), main()).result()
@@ -0,0 +1,113 @@
+"""Request-scoped deadlines carried through the analysis pipeline
+
+A deadline is set once at the API boundary and read by every client call
+and retry decision below it, so one request can never spend more than
+its budget on upstream I/O. The deadline lives in a context variable;
+use ``run_in_context`` (as fetch_concurrent does) to carry it into
+worker threads.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
+
+from tenacity.stop import stop_base
+from tenacity.wait import wait_base
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() value, or None when no deadline applies
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("deadline", default=None)
+
+# Below this many seconds, another upstream attempt isn't worth starting
+MIN_ATTEMPT_SECONDS = 0.5
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call would start after the request deadline"""
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Apply a deadline to everything run inside the block.
+
+    Nested deadlines can only shorten the current one. ``None`` leaves
+    the current deadline (if any) unchanged.
+    """
+    if seconds is None:
+        yield
+        return
+
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(new_deadline, current)
+
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the deadline (may be negative), or None without one"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """True when a deadline is set and has passed"""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def clamp_timeout(timeout: float) -> float:
+    """
+    Shrink a per-call timeout to fit the remaining budget.
+
+    Raises:
+        DeadlineExceeded: Not enough budget left to start a call
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left < MIN_ATTEMPT_SECONDS:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(timeout, left)
+
+
+def run_in_context(func: Callable[..., T]) -> Callable[..., T]:
+    """Bind func to a copy of the caller's context (deadline included) for use in threads"""
+    context = contextvars.copy_context()
+
+    def wrapper(*args, **kwargs) -> T:
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
+
+
+class stop_at_deadline(stop_base):
+    """Tenacity stop condition: give up once too little budget remains"""
+
+    def __call__(self, retry_state) -> bool:
+        left = remaining()
+        return left is not None and left < MIN_ATTEMPT_SECONDS
+
+
+class wait_within_deadline(wait_base):
+    """Tenacity wait wrapper: never back off past the deadline"""
+
+    def __init__(self, wait: wait_base):
+        self.wait = wait
+
+    def __call__(self, retry_state) -> float:
+        delay = self.wait(retry_state)
+        left = remaining()
+        if left is None:
+            return delay
+        return max(0.0, min(delay, left - MIN_ATTEMPT_SECONDS))
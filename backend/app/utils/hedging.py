@@ -0,0 +1,127 @@
+"""Hedged requests for idempotent upstream calls with long latency tails
+
+If a call hasn't returned by the observed p95 latency for its kind, one
+duplicate is sent and whichever finishes first wins. Hedges are only sent
+when the client's rate limiter has spare capacity and while the hedge
+budget (a fraction of all calls) allows, so hedging never pushes an
+upstream past its configured rate limit.
+
+Primaries run on their own pool so hedges never queue behind them. When
+every primary worker is busy the call runs unhedged on the caller's
+thread instead of waiting for one, so the pool never caps upstream
+concurrency and the hedge timer never includes queue time.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Optional, TypeVar
+
+from app.config import settings
+from app.utils.deadline import remaining, run_in_context
+from app.utils.metrics import metrics
+from app.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_primary_executor = ThreadPoolExecutor(
+    max_workers=settings.hedge_primary_max_workers,
+    thread_name_prefix="hedge-primary"
+)
+_primary_slots = threading.BoundedSemaphore(settings.hedge_primary_max_workers)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.hedge_max_workers,
+    thread_name_prefix="hedge"
+)
+
+
+def _timed(name: str, func: Callable[[], T]) -> Callable[[], T]:
+    """Wrap func so successful calls feed the latency tracker for name"""
+    def call() -> T:
+        start = time.monotonic()
+        result = func()
+        metrics.observe(f"upstream_latency_seconds.{name}", time.monotonic() - start)
+        return result
+    return call
+
+
+def _releasing_slot(func: Callable[[], T]) -> Callable[[], T]:
+    def call() -> T:
+        try:
+            return func()
+        finally:
+            _primary_slots.release()
+    return call
+
+
+def hedge_delay(name: str) -> Optional[float]:
+    """Observed p95 for name, or None until enough samples exist"""
+    key = f"upstream_latency_seconds.{name}"
+    if metrics.sample_count(key) < settings.hedge_min_samples:
+        return None
+    return max(metrics.percentile(key, 95), settings.hedge_min_delay_seconds)
+
+
+def _within_budget(name: str) -> bool:
+    calls = metrics.counter(f"hedge_eligible_calls.{name}")
+    sent = metrics.counter(f"hedges_sent.{name}")
+    return sent < calls * settings.hedge_budget_ratio
+
+
+def hedged_call(name: str, func: Callable[[], T], rate_limiter: RateLimiter) -> T:
+    """
+    Run an idempotent call, hedging it once if it runs past the observed p95.
+
+    Args:
+        name: Latency/metrics key for this kind of call (e.g. "reactome.participants")
+        func: Zero-argument idempotent call (it applies its own rate limiting)
+        rate_limiter: The client's limiter; a hedge is only sent when it has capacity
+
+    Returns:
+        Result of whichever attempt completes successfully first
+    """
+    timed = _timed(name, func)
+    delay = hedge_delay(name) if settings.enable_request_hedging else None
+    if delay is None:
+        return timed()
+
+    metrics.increment(f"hedge_eligible_calls.{name}")
+    left = remaining()
+    if left is not None and left <= delay:
+        # No time left for a second attempt to help
+        return timed()
+
+    if not _primary_slots.acquire(blocking=False):
+        # Every primary worker is busy: run here rather than queue behind them
+        metrics.increment(f"hedges_skipped.{name}")
+        return timed()
+
+    primary = _primary_executor.submit(_releasing_slot(run_in_context(timed)))
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    if not rate_limiter.has_capacity() or not _within_budget(name):
+        metrics.increment(f"hedges_skipped.{name}")
+        return primary.result()
+
+    metrics.increment(f"hedges_sent.{name}")
+    logger.debug(f"Hedging {name} after {delay:.2f}s")
+    hedge = _executor.submit(run_in_context(timed))
+
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                if future is hedge:
+                    metrics.increment(f"hedges_won.{name}")
+                return future.result()
+            error = future.exception()
+
+    raise error
@@ -0,0 +1,86 @@
+"""HTTP validators for cacheable GET responses
+
+Responses whose bytes are precomputed get a strong ETag derived from
+those bytes, plus a Last-Modified date when the underlying data has one.
+A request whose If-None-Match lists that tag (or, without If-None-Match,
+whose If-Modified-Since is not older than the data) gets an empty 304
+response instead of the body.
+"""
+
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from app.utils.responses import dumps
+
+
+def encode_json(content: Any) -> bytes:
+    """Serialize like the app's JSON responses, so cached bytes match live ones"""
+    return dumps(content)
+
+
+def strong_etag(body: bytes) -> str:
+    """Quoted strong entity tag for a response body"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for it)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[float]) -> bool:
+    """If-Modified-Since check (whole seconds; unparsable dates never match)"""
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return int(last_modified) <= since.timestamp()
+
+
+def cached_response(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    media_type: str = "application/json",
+    last_modified: Optional[float] = None
+) -> Response:
+    """
+    Response for precomputed bytes, honoring If-None-Match and If-Modified-Since.
+
+    Args:
+        request: Incoming request (for its conditional headers)
+        body: Encoded response body
+        etag: Tag for the body (computed from it when omitted)
+        media_type: Content type of body
+        last_modified: When the underlying data last changed (Unix time), if known
+
+    Returns:
+        304 with validators when the client's copy is current, else 200 with body
+    """
+    etag = etag or strong_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-Modified-Since is ignored when If-None-Match is present (RFC 9110)
+        not_modified = etag_matches(if_none_match, etag)
+    else:
+        not_modified = not_modified_since(request.headers.get("if-modified-since"), last_modified)
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
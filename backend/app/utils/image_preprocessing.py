@@ -0,0 +1,145 @@
+"""Image preprocessing and perceptual hashing for plant identification
+
+Phone photos are decoded, EXIF-oriented, downscaled to the resolution
+PlantNet actually uses and re-encoded as JPEG before upload. A 64-bit
+difference hash (dHash) of the image lets near-duplicate photos of the
+same plant share cached identification results.
+
+Pillow is optional: without it images are uploaded as-is (with a sniffed
+content type) and only byte-identical images hit the cache.
+"""
+
+import hashlib
+import io
+import logging
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Union
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Optional: upload original bytes, exact-match caching only
+    Image = None
+    ImageOps = None
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ImageBuffer = Union[bytes, bytearray, memoryview]
+
+# (magic prefix, content type) for formats PlantNet accepts
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF8", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable binary file over a buffer, reading without copying it whole"""
+
+    def __init__(self, data: ImageBuffer):
+        self._view = memoryview(data).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self._view) - self._pos)
+        buffer[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def buffer_reader(data: ImageBuffer) -> BinaryIO:
+    """File object over image bytes or a memoryview (for Pillow and multipart uploads)"""
+    return io.BufferedReader(_BufferReader(data))
+
+
+@dataclass
+class PreparedImage:
+    """Image ready for upload, with the keys used to cache its identification"""
+    data: ImageBuffer
+    content_type: str
+    filename: str
+    content_hash: str
+    perceptual_hash: Optional[int] = None
+
+
+def sniff_content_type(data: ImageBuffer) -> str:
+    """Content type from magic bytes (defaults to JPEG)"""
+    head = bytes(data[:12])
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    for magic, content_type in _SIGNATURES:
+        if head.startswith(magic):
+            return content_type
+    return "image/jpeg"
+
+
+def difference_hash(image) -> int:
+    """64-bit dHash: brightness gradients of a 9x8 grayscale thumbnail"""
+    small = image.convert("L").resize((9, 8), Image.LANCZOS)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def preprocess_image(data: ImageBuffer) -> PreparedImage:
+    """
+    Prepare an uploaded image for PlantNet.
+
+    Args:
+        data: Raw image bytes or a memoryview (never copied)
+
+    Returns:
+        PreparedImage with the bytes to upload and cache keys
+    """
+    content_hash = hashlib.sha256(data).hexdigest()
+
+    if Image is None:
+        content_type = sniff_content_type(data)
+        extension = content_type.split("/")[1]
+        return PreparedImage(data, content_type, f"plant.{extension}", content_hash)
+
+    try:
+        with Image.open(buffer_reader(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGB")
+            perceptual_hash = difference_hash(image)
+
+            max_side = settings.plantnet_max_image_side
+            image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+            output = io.BytesIO()
+            image.save(output, format="JPEG", quality=settings.plantnet_jpeg_quality, optimize=True)
+    except Exception as e:
+        logger.warning(f"Could not preprocess image ({e}); uploading original bytes")
+        content_type = sniff_content_type(data)
+        return PreparedImage(data, content_type, f"plant.{content_type.split('/')[1]}", content_hash)
+
+    encoded = output.getvalue()
+    logger.debug(f"Preprocessed image: {len(data)} -> {len(encoded)} bytes")
+    return PreparedImage(encoded, "image/jpeg", "plant.jpg", content_hash, perceptual_hash)
@@ -0,0 +1,95 @@
+"""Lightweight in-process metrics for latency and counters"""
+
+import math
+from collections import defaultdict, deque
+from threading import Lock
+from typing import Deque, Dict, Optional
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters and latency samples.
+
+    Samples are kept in bounded windows so percentiles reflect recent
+    traffic; counters are cumulative for the life of the process.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize registry.
+
+        Args:
+            window: Number of recent samples kept per metric
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._lock = Lock()
+
+    def observe(self, name: str, value: float) -> None:
+        """Record one sample (e.g. a latency in seconds)"""
+        with self._lock:
+            self._samples[name].append(value)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increment a counter"""
+        with self._lock:
+            self._counters[name] += amount
+
+    def percentile(self, name: str, pct: float) -> Optional[float]:
+        """Return the pct-th percentile of recent samples, or None without samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        return _percentile(samples, pct)
+
+    def sample_count(self, name: str) -> int:
+        """Number of recent samples held for a metric"""
+        with self._lock:
+            return len(self._samples.get(name, ()))
+
+    def counter(self, name: str) -> int:
+        """Current value of a counter"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Summarize all metrics as plain dicts (JSON-serializable)"""
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            counters = dict(self._counters)
+
+        return {
+            "counters": counters,
+            "latencies": {
+                name: {
+                    "count": len(values),
+                    "mean": round(sum(values) / len(values), 4) if values else None,
+                    "p50": _round(_percentile(values, 50)),
+                    "p95": _round(_percentile(values, 95)),
+                    "max": _round(values[-1] if values else None),
+                }
+                for name, values in samples.items()
+            },
+        }
+
+    def reset(self) -> None:
+        """Drop all samples and counters"""
+        with self._lock:
+            self._samples.clear()
+            self._counters.clear()
+
+
+def _percentile(sorted_values, pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted sequence"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 4) if value is not None else None
+
+
+# Global metrics instance
+metrics = MetricsRegistry()
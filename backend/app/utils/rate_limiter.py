@@ -34,6 +34,13 @@ class RateLimiter:
                 time.sleep(sleep_time)
             self.last_call = time.time()
 
+    def has_capacity(self) -> bool:
+        """True if a call could start now without waiting (does not consume a slot)"""
+        if self.rate <= 0:
+            return True
+        with self.lock:
+            return time.time() - self.last_call >= self.interval
+
     async def wait_async(self) -> None:
         """Async version of wait()"""
         if self.rate <= 0:
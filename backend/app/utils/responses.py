@@ -0,0 +1,64 @@
+"""Fast JSON responses
+
+``FastJSONResponse`` renders with orjson when it is installed (falling back
+to the standard encoder), and is the app's default response class.
+Pydantic models nested in a payload are dumped by Pydantic's own
+serializer; anything else orjson can't serialize natively goes through
+FastAPI's ``jsonable_encoder``, so output matches the default responses.
+
+Routes that build large payloads from trusted internal models return a
+``FastJSONResponse`` (or ``RawJSONResponse`` for bytes that are already
+encoded, like cached reports) directly. FastAPI then skips both the
+``response_model`` re-validation and the ``jsonable_encoder`` walk; the
+``response_model`` is still used for the OpenAPI schema.
+"""
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.__pydantic_serializer__.to_python(value, mode="json")
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
+
+
+def model_json(model: BaseModel) -> bytes:
+    """Encode a Pydantic model without validating or walking it in Python"""
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return model_json(content)
+        return dumps(content)
+
+
+class RawJSONResponse(Response):
+    """Response for an already-encoded JSON body"""
+    media_type = "application/json"
@@ -0,0 +1,23 @@
+"""Retry predicates shared by the API clients"""
+
+import httpx
+
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.deadline import DeadlineExceeded
+
+# Definitive answers from upstream: retrying can't change them
+NON_RETRYABLE_STATUS_CODES = {400, 404, 410}
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Retry transport errors and 5xx/429, but not definitive misses like 404"""
+    if isinstance(exc, (DeadlineExceeded, CircuitOpenError)):
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code not in NON_RETRYABLE_STATUS_CODES
+    return True
+
+
+def is_not_found(exc: BaseException) -> bool:
+    """True when an upstream answered that the resource does not exist"""
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in (404, 410)
@@ -0,0 +1,326 @@
+"""Bounded, streaming ingestion of image uploads
+
+Request bodies are never held as whole ``bytes`` objects: they are read
+chunk by chunk into a SpooledTemporaryFile (memory up to
+``upload_spool_max_memory``, then disk) and rejected with 413 as soon as
+they pass the size limit. In JSON bodies the base64 image string is
+located by scanning the spooled body in place and decoded from it chunk
+by chunk into a spool of its own; only the small remaining fields are
+parsed as JSON. Callers get the image as a memoryview over the spool
+rather than a copy.
+"""
+
+import binascii
+import io
+import json
+import mmap
+import re
+from contextlib import contextmanager
+from tempfile import SpooledTemporaryFile
+from typing import AnyStr, AsyncIterator, Iterable, Iterator, Optional, Tuple, Type, TypeVar
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+
+from app.config import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+# Base64 characters decoded per step (a multiple of 4)
+BASE64_CHUNK_CHARS = 256 * 1024
+
+# Allowance for multipart boundaries/headers and the JSON around a base64 string
+BODY_OVERHEAD_BYTES = 64 * 1024
+
+# JSON tokens that change nesting or key position, and the end of a string
+_STRUCTURAL = re.compile(rb'["{}\[\],:]')
+_STRING_END = re.compile(rb'["\\]')
+_VALUE_START = re.compile(rb'\s*:\s*"')
+# Escapes a JSON encoder may put in a base64 string (escaped slashes, wrapped lines)
+_ESCAPE = re.compile(rb'\\(.)', re.DOTALL)
+_ESCAPED = {b"/": b"/", b"n": b"", b"r": b"", b"t": b""}
+
+MULTIPART_UPLOAD_PATHS = ("/identify_plant/upload", "/analyze_plant/upload")
+BASE64_UPLOAD_PATHS = ("/identify_plant", "/analyze_plant")
+
+
+class UploadTooLarge(HTTPException):
+    """Request body passed the upload size limit"""
+
+    def __init__(self, limit: int):
+        super().__init__(status_code=413, detail=f"Upload exceeds the {limit // (1024 * 1024)} MB limit")
+
+
+def max_body_bytes(path: str) -> int:
+    """Body size limit for an upload route, or 0 for routes without one"""
+    if path in MULTIPART_UPLOAD_PATHS:
+        return settings.max_upload_bytes + BODY_OVERHEAD_BYTES
+    if path in BASE64_UPLOAD_PATHS:
+        return (settings.max_upload_bytes + 2) // 3 * 4 + BODY_OVERHEAD_BYTES
+    return 0
+
+
+class UploadLimitMiddleware:
+    """
+    ASGI middleware enforcing upload size limits before the body is parsed.
+
+    A declared Content-Length over the limit is rejected without reading
+    the body; otherwise received bytes are counted and the request fails
+    with 413 as soon as the limit is passed (chunked uploads included).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        limit = max_body_bytes(scope["path"]) if scope["type"] == "http" else 0
+        if not limit:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            error = UploadTooLarge(settings.max_upload_bytes)
+            body = json.dumps({"detail": error.detail}).encode()
+            await send({
+                "type": "http.response.start",
+                "status": error.status_code,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise UploadTooLarge(settings.max_upload_bytes)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def new_spool() -> SpooledTemporaryFile:
+    return SpooledTemporaryFile(max_size=settings.upload_spool_max_memory)
+
+
+async def spool_stream(chunks: AsyncIterator[bytes], limit: int) -> SpooledTemporaryFile:
+    """
+    Copy an async byte stream into a spool, enforcing a size limit as it arrives.
+
+    Raises:
+        UploadTooLarge: More than limit bytes were received
+    """
+    spool = new_spool()
+    total = 0
+    try:
+        async for chunk in chunks:
+            total += len(chunk)
+            if total > limit:
+                raise UploadTooLarge(settings.max_upload_bytes)
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def _decode_base64_chunks(chunks: Iterable[AnyStr]) -> SpooledTemporaryFile:
+    """
+    Decode base64 text arriving in pieces into a spool.
+
+    Raises:
+        binascii.Error: Invalid base64 data
+    """
+    spool = new_spool()
+    carry = None
+    try:
+        for piece in chunks:
+            chunk = piece[:0].join(piece.split())
+            if carry:
+                chunk = carry + chunk
+            usable = len(chunk) - len(chunk) % 4
+            spool.write(binascii.a2b_base64(chunk[:usable]))
+            carry = chunk[usable:]
+        if carry:
+            spool.write(binascii.a2b_base64(carry))
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def decode_base64_to_spool(text: str) -> SpooledTemporaryFile:
+    """
+    Decode base64 (optionally a data URL) into a spool, one chunk at a time.
+
+    Raises:
+        binascii.Error: Invalid base64 data
+    """
+    start = text.find(",") + 1 if text.startswith("data:") else 0
+    return _decode_base64_chunks(
+        text[offset:offset + BASE64_CHUNK_CHARS] for offset in range(start, len(text), BASE64_CHUNK_CHARS)
+    )
+
+
+def _string_end(body: memoryview, pos: int) -> Optional[int]:
+    """Offset of the quote closing a JSON string whose contents start at pos"""
+    while True:
+        match = _STRING_END.search(body, pos)
+        if match is None:
+            return None
+        if match.group() == b'"':
+            return match.start()
+        pos = match.end() + 1  # Skip the escaped character
+
+
+def find_string_field(body: memoryview, field: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate a top-level string field of a JSON object without parsing it.
+
+    Only structural characters are visited (strings are skipped with a
+    regex search), so a multi-megabyte value is stepped over in C.
+
+    Returns:
+        (start, end) offsets of the string's raw contents, or None when the
+        field is missing, not a string, or the body is malformed
+    """
+    key = json.dumps(field).encode()
+    depth = 0
+    expect_key = False
+    pos = 0
+    while True:
+        match = _STRUCTURAL.search(body, pos)
+        if match is None:
+            return None
+        token = match.group()
+        pos = match.end()
+        if token == b'"':
+            end = _string_end(body, pos)
+            if end is None:
+                return None
+            if depth == 1 and expect_key and body[match.start():end + 1] == key:
+                value = _VALUE_START.match(body, end + 1)
+                if value is None:
+                    return None
+                value_end = _string_end(body, value.end())
+                return None if value_end is None else (value.end(), value_end)
+            expect_key = False
+            pos = end + 1
+        elif token in (b"{", b"["):
+            depth += 1
+            expect_key = token == b"{" and depth == 1
+        elif token in (b"}", b"]"):
+            depth -= 1
+        elif token == b",":
+            expect_key = depth == 1
+        else:
+            expect_key = False
+
+
+def _unescape(match: re.Match) -> bytes:
+    char = match.group(1)
+    if char not in _ESCAPED:
+        raise ValueError(f"Unexpected escape '\\{char.decode('latin-1')}' in base64 string")
+    return _ESCAPED[char]
+
+
+def _json_string_chunks(body: memoryview, start: int, end: int) -> Iterator[bytes]:
+    """Raw JSON string contents in BASE64_CHUNK_CHARS pieces, with escapes resolved"""
+    if bytes(body[start:start + 5]) == b"data:":
+        start += bytes(body[start:min(end, start + 256)]).find(b",") + 1
+    carry = b""
+    for offset in range(start, end, BASE64_CHUNK_CHARS):
+        piece = carry + bytes(body[offset:min(end, offset + BASE64_CHUNK_CHARS)])
+        carry = b""
+        if b"\\" in piece:
+            if piece.endswith(b"\\"):
+                piece, carry = piece[:-1], b"\\"
+            piece = _ESCAPE.sub(_unescape, piece)
+        yield piece
+
+
+async def read_base64_image_request(
+    request: Request,
+    options_model: Type[M],
+    field: str = "image_base64"
+) -> Tuple[M, SpooledTemporaryFile]:
+    """
+    Read a JSON body carrying a base64 image without buffering it whole.
+
+    Args:
+        request: Incoming request
+        options_model: Model for the remaining (non-image) fields
+        field: Name of the base64 image field
+
+    Returns:
+        Tuple of (validated options, spool holding the decoded image); the
+        caller must close the spool
+
+    Raises:
+        HTTPException: 413 too large, 400 malformed JSON/base64, 422 invalid fields
+    """
+    body = await spool_stream(request.stream(), max_body_bytes(request.url.path) or settings.max_upload_bytes)
+    with body, image_buffer(body) as view:
+        span = find_string_field(view, field)
+        try:
+            # With the image located, only the fields around it are parsed
+            fields = json.loads(bytes(view[:span[0]]) + bytes(view[span[1]:]) if span else bytes(view))
+        except Exception:
+            raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+
+        if not isinstance(fields, dict) or not isinstance(fields.get(field), str):
+            raise HTTPException(status_code=422, detail=f"'{field}' (base64 string) is required")
+
+        try:
+            options = options_model.model_validate({k: v for k, v in fields.items() if k != field})
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+        try:
+            if span:
+                image = _decode_base64_chunks(_json_string_chunks(view, *span))
+            else:
+                image = decode_base64_to_spool(fields.pop(field))
+        except (binascii.Error, ValueError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid base64 image data: {e}")
+
+    return options, image
+
+
+@contextmanager
+def image_buffer(spool) -> Iterator[memoryview]:
+    """
+    Zero-copy memoryview of a spooled file's contents.
+
+    In-memory spools expose their buffer directly; spools rolled to disk
+    are memory-mapped. The view is released when the block exits.
+    """
+    raw = getattr(spool, "_file", spool)
+    if isinstance(raw, io.BytesIO):
+        view = raw.getbuffer()
+        try:
+            yield view
+        finally:
+            view.release()
+        return
+
+    raw.flush()
+    raw.seek(0, io.SEEK_END)
+    if raw.tell() == 0:
+        yield memoryview(b"")
+        return
+
+    mapped = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        mapped.close()
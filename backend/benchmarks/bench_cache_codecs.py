@@ -0,0 +1,149 @@
+"""Benchmark cache codecs: encoded size and decode time per namespace
+
+Compares every available codec against plain pickle (what diskcache
+stored before the codec layer) on representative values for the main
+cache namespaces, or on real entries sampled from an existing cache.
+
+Usage:
+    python -m benchmarks.bench_cache_codecs
+    python -m benchmarks.bench_cache_codecs --cache-dir /tmp/biopath_cache --samples 200
+"""
+
+import argparse
+import pickle
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.services.cache_codec import CODECS, HEADER, MAGIC, CacheCodec
+
+
+def _target(i: int) -> Dict[str, Any]:
+    return {
+        "target_id": f"P{35354 + i}",
+        "target_name": f"Prostaglandin G/H synthase {i}",
+        "target_type": "SINGLE PROTEIN",
+        "organism": "Homo sapiens",
+        "pchembl_value": 5.0 + (i % 40) / 10,
+        "standard_type": "IC50",
+        "standard_value": 316.0 + i,
+        "standard_units": "nM",
+        "assay_references": [{
+            "assay_id": f"CHEMBL{800000 + i}",
+            "assay_description": "Inhibition of human recombinant COX-2 expressed in Sf9 cells "
+                                 "assessed as reduction in PGE2 production by EIA",
+            "source": "ChEMBL",
+            "source_url": f"https://www.ebi.ac.uk/chembl/assay_report_card/CHEMBL{800000 + i}/",
+        }],
+        "confidence_tier": "A",
+        "confidence_score": 0.7,
+        "is_predicted": False,
+        "source": "ChEMBL",
+    }
+
+
+def _pathway(i: int) -> Dict[str, Any]:
+    return {
+        "pathway_id": f"R-HSA-{2162123 + i}",
+        "pathway_name": f"Synthesis of Prostaglandins (PG) and Thromboxanes (TX) {i}",
+        "pathway_species": "Homo sapiens",
+        "matched_targets": [f"P{35354 + j}" for j in range(i % 5 + 1)],
+        "measured_targets_count": i % 5 + 1,
+        "predicted_targets_count": 0,
+        "impact_score": 0.42,
+        "confidence_tier": "B",
+        "confidence_score": 0.8,
+        "explanation": "Compound inhibits key enzymes in this pathway with sub-micromolar potency.",
+        "pathway_url": f"https://reactome.org/content/detail/R-HSA-{2162123 + i}",
+        "related_pathways": [],
+    }
+
+
+def sample_values() -> Dict[str, List[Any]]:
+    """Synthetic values shaped like the main cache namespaces"""
+    compound = {
+        "ingredient_name": "ibuprofen",
+        "pubchem_cid": 3672,
+        "canonical_smiles": "CC(C)CC1=CC=C(C=C1)C(C)C(=O)O",
+        "inchikey": "HEFNNWSXXWATRW-UHFFFAOYSA-N",
+        "molecular_formula": "C13H18O2",
+        "molecular_weight": 206.28,
+        "iupac_name": "2-[4-(2-methylpropyl)phenyl]propanoic acid",
+        "synonyms": ["ibuprofen", "Advil", "Motrin", "Nurofen", "Brufen"],
+        "resolution_timestamp": datetime.utcnow(),
+    }
+    targets = [_target(i) for i in range(60)]
+    pathways = [_pathway(i) for i in range(80)]
+    return {
+        "compound": [compound],
+        "targets": [targets],
+        "pathway_participants": [[f"P{10000 + i}" for i in range(400)]],
+        "report": [{
+            "cached_at": time.time(),
+            "report": {
+                "ingredient_name": "ibuprofen",
+                "compound_identity": compound,
+                "known_targets": targets,
+                "pathways": pathways,
+                "final_summary": {"total_pathways_affected": len(pathways)},
+            },
+        }],
+    }
+
+
+def sample_cache(cache_dir: str, samples: int) -> Dict[str, List[Any]]:
+    """Sample decoded values from an existing cache, grouped by namespace"""
+    from diskcache import Cache
+
+    by_namespace: Dict[str, List[Any]] = defaultdict(list)
+    with Cache(cache_dir) as cache:
+        for key in cache.iterkeys():
+            namespace = str(key).rsplit(":", 1)[0]
+            if len(by_namespace[namespace]) >= samples:
+                continue
+            raw = cache.get(key)
+            if isinstance(raw, bytes) and raw[:2] == MAGIC:
+                _, schema_version, _ = HEADER.unpack(raw[:HEADER.size])
+                value = CacheCodec(schema_version).decode(raw)
+            else:
+                value = raw  # Pre-codec entry: diskcache already unpickled it
+            if value is not None:
+                by_namespace[namespace].append(value)
+    return dict(by_namespace)
+
+
+def bench(values: List[Any], encode, decode, repeat: int) -> Dict[str, float]:
+    encoded = [encode(v) for v in values]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for blob in encoded:
+            decode(blob)
+    elapsed = time.perf_counter() - start
+    return {
+        "bytes": sum(len(b) for b in encoded) / len(encoded),
+        "decode_us": elapsed / (repeat * len(encoded)) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cache codecs")
+    parser.add_argument("--cache-dir", help="Sample real entries from this cache directory")
+    parser.add_argument("--samples", type=int, default=100, help="Max entries per namespace")
+    parser.add_argument("--repeat", type=int, default=200, help="Decode repetitions")
+    args = parser.parse_args()
+
+    namespaces = sample_cache(args.cache_dir, args.samples) if args.cache_dir else sample_values()
+
+    print(f"{'namespace':<24}{'codec':<14}{'avg bytes':>12}{'decode us':>12}")
+    for namespace, values in sorted(namespaces.items()):
+        rows = {"pickle": bench(values, pickle.dumps, pickle.loads, args.repeat)}
+        for name in CODECS:
+            codec = CacheCodec(schema_version=1, codec=name)
+            rows[name] = bench(values, codec.encode, codec.decode, args.repeat)
+        for name, row in rows.items():
+            print(f"{namespace:<24}{name:<14}{row['bytes']:>12.0f}{row['decode_us']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark response serialization for large reports
+
+Compares the paths a large response can take to bytes: FastAPI's
+response_model validation followed by the standard JSON encoder (how
+/analyze_sync answered before), jsonable_encoder + json (how routes
+returning plain dicts answer), orjson, Pydantic's own encoder, and the
+pre-encoded bytes served on a report cache hit. Payloads are a single
+compound report and a plant report holding several of them.
+
+Usage:
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --compounds 12 --repeat 50
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.models.schemas import BodyImpactReport
+from app.utils.responses import dumps, model_json, orjson
+from benchmarks.bench_cache_codecs import sample_values
+
+
+def _json(content: Any) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def compound_report() -> BodyImpactReport:
+    """Large compound report (60 targets, 80 pathways)"""
+    return BodyImpactReport(**sample_values()["report"][0]["report"])
+
+
+def plant_report(compounds: int) -> Dict[str, Any]:
+    """Plant analysis holding a full report per compound"""
+    report = compound_report()
+    reports = [report.model_copy(update={"ingredient_name": f"compound {i}"}) for i in range(compounds)]
+    return {
+        "identification": {"scientific_name": "Hypericum perforatum", "confidence": 0.92},
+        "compound_reports": reports,
+        "aggregate_pathways": [
+            {"pathway_id": p.pathway_id, "pathway_name": p.pathway_name,
+             "compounds": [r.ingredient_name for r in reports], "max_impact_score": p.impact_score}
+            for p in report.pathways
+        ],
+        "summary": {"total_compounds": compounds, "total_pathways": len(report.pathways)},
+    }
+
+
+def report_paths(report: BodyImpactReport) -> Dict[str, Callable[[], bytes]]:
+    adapter = TypeAdapter(BodyImpactReport)
+    cached = model_json(report)
+
+    def response_model() -> bytes:
+        # What FastAPI does with a returned model and response_model set
+        validated = adapter.validate_python(report.model_dump())
+        return _json(adapter.dump_python(validated, mode="json"))
+
+    paths = {
+        "response_model+json": response_model,
+        "model_dump+json": lambda: _json(report.model_dump(mode="json")),
+    }
+    if orjson is not None:
+        paths["model_dump+orjson"] = lambda: orjson.dumps(report.model_dump(mode="json"))
+    paths["model_json"] = lambda: model_json(report)
+    paths["cached bytes"] = lambda: bytes(cached)
+    return paths
+
+
+def plant_paths(plant: Dict[str, Any]) -> Dict[str, Callable[[], bytes]]:
+    return {
+        "jsonable_encoder+json": lambda: _json(jsonable_encoder(plant)),
+        "dumps": lambda: dumps(plant),
+    }
+
+
+def bench(encode: Callable[[], bytes], repeat: int) -> Dict[str, float]:
+    size = len(encode())
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encode()
+    elapsed = time.perf_counter() - start
+    return {"bytes": size, "ms": elapsed / repeat * 1e3}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark response serialization")
+    parser.add_argument("--compounds", type=int, default=8, help="Compound reports in the plant report")
+    parser.add_argument("--repeat", type=int, default=20, help="Encode repetitions")
+    args = parser.parse_args()
+
+    payloads = {
+        "compound report": report_paths(compound_report()),
+        f"plant report ({args.compounds})": plant_paths(plant_report(args.compounds)),
+    }
+
+    print(f"{'payload':<22}{'path':<24}{'bytes':>12}{'ms':>10}")
+    for payload, paths in payloads.items():
+        for name, encode in paths.items():
+            row = bench(encode, args.repeat)
+            print(f"{payload:<22}{name:<24}{row['bytes']:>12}{row['ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
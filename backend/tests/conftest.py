@@ -0,0 +1,16 @@
+"""Shared pytest fixtures"""
+
+import pytest
+from diskcache import Cache
+
+from app.services.cache import cache_service
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path):
+    """Point the global cache at a per-test directory so tests never share hits"""
+    original = cache_service.cache
+    cache_service.cache = Cache(str(tmp_path / "cache"))
+    yield cache_service
+    cache_service.cache.close()
+    cache_service.cache = original
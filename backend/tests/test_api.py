@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 
 from app.main import app
 from app.models.schemas import BodyImpactReport, CompoundIdentity
+from app.utils.responses import model_json
 
 
 client = TestClient(app)
@@ -45,7 +46,7 @@ def test_analyze_sync_success(mock_service):
         provenance=[]
     )
 
-    mock_service.return_value.analyze_ingredient.return_value = mock_report
+    mock_service.return_value.analyze_ingredient_json.return_value = model_json(mock_report)
 
     response = client.post(
         "/analyze_sync",
@@ -53,11 +54,33 @@ def test_analyze_sync_success(mock_service):
     )
 
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
     data = response.json()
     assert data["ingredient_name"] == "ibuprofen"
     assert data["compound_identity"]["pubchem_cid"] == 3672
 
 
+@patch("app.main.drug_interaction_service")
+@patch("app.main.AnalysisService")
+def test_analyze_sync_with_medications(mock_service, mock_interactions):
+    """Test reports with personalized interactions are serialized from the model"""
+    mock_service.return_value.analyze_ingredient.return_value = BodyImpactReport(
+        ingredient_name="ibuprofen",
+        compound_identity=CompoundIdentity(ingredient_name="ibuprofen"),
+        final_summary={"message": "Test report"}
+    )
+    mock_interactions.check_compound_medication_interactions.return_value = []
+
+    response = client.post(
+        "/analyze_sync",
+        json={"ingredient_name": "ibuprofen", "user_medications": ["warfarin"]}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["ingredient_name"] == "ibuprofen"
+    mock_service.return_value.analyze_ingredient_json.assert_not_called()
+
+
 def test_analyze_sync_invalid_input():
     """Test sync analysis with invalid input"""
     response = client.post(
@@ -84,6 +107,49 @@ def test_analyze_async(mock_task):
     assert data["status"] == "pending"
 
 
+@patch("app.main.analyze_ingredient_task")
+def test_analyze_async_deduplicates_identical_inputs(mock_task):
+    """Test identical submissions attach to the existing job"""
+    mock_task.apply_async.return_value.id = "test-task-id"
+
+    first = client.post("/analyze", json={"ingredient_name": "Curcumin"}).json()
+    second = client.post("/analyze", json={"ingredient_name": "  curcumin "}).json()
+    other = client.post("/analyze", json={"ingredient_name": "curcumin", "enable_predictions": True}).json()
+
+    assert second["job_id"] == first["job_id"]
+    assert second["deduplicated"] is True
+    assert other["job_id"] != first["job_id"]
+    assert mock_task.apply_async.call_count == 2
+
+
+@patch("app.main.celery_app")
+@patch("app.main.job_deduplicator")
+@patch("app.main.analyze_ingredient_task")
+def test_analyze_async_attaches_to_concurrent_reclaim(mock_task, mock_dedup, mock_celery):
+    """Test a request that loses the re-claim after a failed job attaches to the winner"""
+    mock_dedup.claim.side_effect = ["failed-job", "winner-job"]
+    mock_dedup.is_reusable.return_value = False
+    mock_celery.AsyncResult.return_value.state = "PENDING"
+
+    response = client.post("/analyze", json={"ingredient_name": "quercetin"}).json()
+
+    assert response["job_id"] == "winner-job"
+    assert response["deduplicated"] is True
+    mock_task.apply_async.assert_not_called()
+
+
+def test_canonical_input_hash_includes_version():
+    """Test the job hash changes with the analysis version"""
+    from app.models.schemas import IngredientInput
+    from app.services.job_dedup import canonical_input_hash
+
+    ingredient = IngredientInput(ingredient_name="curcumin", user_medications=["Warfarin", "aspirin"])
+    reordered = IngredientInput(ingredient_name="curcumin", user_medications=["aspirin", "warfarin"])
+
+    assert canonical_input_hash(ingredient) == canonical_input_hash(reordered)
+    assert canonical_input_hash(ingredient, "1.0.0") != canonical_input_hash(ingredient, "2.0.0")
+
+
 def test_get_results_not_found():
     """Test getting results for non-existent job"""
     response = client.get("/results/nonexistent-job-id")
@@ -0,0 +1,87 @@
+"""Tests for cache serialization"""
+
+from datetime import datetime
+
+import pytest
+from unittest.mock import Mock
+
+from app.models.schemas import CompoundIdentity, ProvenanceRecord
+from app.services.analysis import AnalysisService
+from app.services.cache import cache_service
+from app.services.cache_codec import CODECS, CacheCodec, CacheDecodeError
+
+
+@pytest.mark.parametrize("codec_name", list(CODECS))
+def test_codec_round_trip(codec_name):
+    """Test each available codec round-trips cache-shaped values"""
+    codec = CacheCodec(schema_version=1, codec=codec_name)
+    value = {"targets": [{"target_id": "P35354", "pchembl_value": 6.5}], "count": 1}
+
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_model_dump_with_datetime_round_trips():
+    """Test pydantic dumps with datetimes survive the JSON codecs"""
+    compound = CompoundIdentity(ingredient_name="ibuprofen", pubchem_cid=3672)
+
+    cache_service.set("compound", "ibuprofen", compound.model_dump())
+    restored = CompoundIdentity(**cache_service.get("compound", "ibuprofen"))
+
+    assert restored == compound
+
+
+def test_non_json_values_fall_back_to_pickle():
+    """Test values JSON can't represent are still cached"""
+    codec = CacheCodec(schema_version=1, codec="json+zlib")
+    value = {"when": datetime(2024, 1, 1), "blob": object}
+
+    assert codec.decode(codec.encode(value))["blob"] is object
+
+
+def test_bytes_are_stored_raw():
+    """Test bytes values skip serialization and compression"""
+    codec = CacheCodec(schema_version=1, codec="json+zlib")
+    value = b'{"ingredient_name": "curcumin"}'
+    encoded = codec.encode(value)
+
+    assert encoded.endswith(value)
+    assert codec.decode(encoded) == value
+
+
+def test_old_schema_entries_are_misses():
+    """Test entries from another schema version are invalidated on read"""
+    old = CacheCodec(schema_version=cache_service.codec.schema_version + 1)
+    key = cache_service._generate_key("compound", "aspirin")
+    cache_service.cache.set(key, old.encode({"ingredient_name": "aspirin"}))
+
+    with pytest.raises(CacheDecodeError):
+        cache_service.codec.decode(cache_service.cache.get(key))
+
+    assert cache_service.get("compound", "aspirin") is None
+    assert key not in cache_service.cache
+
+
+def test_pre_codec_entries_are_misses():
+    """Test raw objects written before the codec layer are treated as misses"""
+    cache_service.cache.set(cache_service._generate_key("targets", "LEGACY"), [{"target_id": "P1"}])
+
+    assert cache_service.get("targets", "LEGACY") is None
+
+
+@pytest.mark.parametrize("fallback_status,negative", [("success", True), ("error", False)])
+def test_target_miss_negative_cached_only_when_every_source_answered(fallback_status, negative):
+    """Test a failed Open Targets fallback is not remembered as 'no targets'"""
+    service = AnalysisService()
+    compound = CompoundIdentity(ingredient_name="rarium", inchikey="RARIUMRARIUMRA-UHFFFAOYSA-N")
+    service.chembl.get_target_activities = Mock(
+        return_value=([], ProvenanceRecord(service="ChEMBL", endpoint="/activity", not_found=True))
+    )
+    service.drugbank.fetch_drug_targets = Mock(return_value=([], ProvenanceRecord(
+        service="Open Targets", endpoint="/graphql", status=fallback_status,
+        not_found=fallback_status == "success"
+    )))
+
+    targets, _ = service._get_target_evidence(compound, [])
+
+    assert targets == []
+    assert cache_service.is_negative("targets", compound.inchikey) is negative
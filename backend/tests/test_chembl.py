@@ -46,13 +46,16 @@ def test_get_target_activities_success(chembl_client):
     }
 
     mock_target_info = {
-        "pref_name": "Cyclooxygenase-2",
-        "target_type": "SINGLE PROTEIN",
-        "organism": "Homo sapiens",
-        "target_components": [{
-            "target_component_xrefs": [{
-                "xref_src_db": "UniProt",
-                "xref_id": "P35354"
+        "targets": [{
+            "target_chembl_id": "CHEMBL221",
+            "pref_name": "Cyclooxygenase-2",
+            "target_type": "SINGLE PROTEIN",
+            "organism": "Homo sapiens",
+            "target_components": [{
+                "target_component_xrefs": [{
+                    "xref_src_db": "UniProt",
+                    "xref_id": "P35354"
+                }]
             }]
         }]
     }
@@ -74,6 +77,104 @@ def test_get_target_activities_success(chembl_client):
         assert provenance.status == "success"
 
 
+def test_activities_are_paginated_projected_and_grouped(chembl_client):
+    """Test every activity page is followed with only= projection and best pChEMBL kept per target"""
+    pages = {
+        "first": {
+            "activities": [
+                {"target_chembl_id": "CHEMBL221", "pchembl_value": "6.5", "standard_type": "IC50",
+                 "assay_chembl_id": "CHEMBL1"},
+                {"target_chembl_id": "CHEMBL230", "pchembl_value": "5.1", "standard_type": "Ki",
+                 "assay_chembl_id": "CHEMBL2"},
+            ],
+            "page_meta": {"next": "/chembl/api/data/activity.json?molecule_chembl_id=CHEMBL113&offset=2"},
+        },
+        "second": {
+            "activities": [{"target_chembl_id": "CHEMBL221", "pchembl_value": "7.2", "standard_type": "Ki",
+                            "assay_chembl_id": "CHEMBL3"}],
+            "page_meta": {"next": None},
+        },
+    }
+    urls = []
+
+    def fake_get(url):
+        urls.append(url)
+        return pages["second"] if "offset=2" in url else pages["first"]
+
+    with patch.object(chembl_client, '_get', side_effect=fake_get):
+        activities = list(chembl_client.iter_activities("CHEMBL113"))
+
+    assert len(activities) == 3
+    assert "only=target_chembl_id,pchembl_value," in urls[0]
+    assert urls[1] == "https://www.ebi.ac.uk/chembl/api/data/activity.json?molecule_chembl_id=CHEMBL113&offset=2"
+
+    with patch.object(chembl_client, '_get', side_effect=fake_get), \
+         patch.object(chembl_client, 'find_compound_by_inchikey', return_value="CHEMBL113"), \
+         patch.object(chembl_client, '_get_target_info_batch',
+                      return_value={"CHEMBL221": {"target_name": "COX-2"}, "CHEMBL230": {"target_name": "COX-1"}}):
+        targets, _ = chembl_client.get_target_activities("RYYVLZVUVIJVGH-UHFFFAOYSA-N")
+
+    best = {t.target_name: t for t in targets}
+    assert best["COX-2"].pchembl_value == 7.2
+    assert best["COX-2"].standard_type == "Ki"
+    assert best["COX-1"].pchembl_value == 5.1
+
+
+def test_activity_paging_stops_at_page_cap(chembl_client):
+    """Test pagination stops early instead of walking an unbounded activity list"""
+    endless = {
+        "activities": [{"target_chembl_id": "CHEMBL221", "pchembl_value": "6.0"}],
+        "page_meta": {"next": "/chembl/api/data/activity.json?offset=1"},
+    }
+
+    with patch.object(chembl_client, '_get', return_value=endless) as mock_get, \
+         patch("app.clients.chembl.settings.chembl_max_activity_pages", 3):
+        activities = list(chembl_client.iter_activities("CHEMBL113"))
+
+    assert mock_get.call_count == 3
+    assert len(activities) == 3
+
+
+def test_target_info_is_fetched_in_chunks_and_cached(chembl_client):
+    """Test missing targets are fetched with __in chunks and fanned into the per-target cache"""
+    from app.services.cache import cache_service
+
+    target_ids = [f"CHEMBL{i}" for i in range(120)]
+    cache_service.set("target_info", "CHEMBL0", {"target_name": "Cached", "target_chembl_id": "CHEMBL0"})
+    urls = []
+
+    def fake_get(url):
+        urls.append(url)
+        chunk = url.split("target_chembl_id__in=")[1].split("&")[0].split(",")
+        return {"targets": [
+            {"target_chembl_id": tid, "pref_name": f"Target {tid}",
+             "target_components": [{"accession": "P35354"}]}
+            for tid in chunk
+        ]}
+
+    with patch.object(chembl_client, '_get', side_effect=fake_get):
+        info = chembl_client._get_target_info_batch(target_ids)
+
+    assert len(urls) == 3  # 119 misses in chunks of 50
+    assert all("only=target_chembl_id,pref_name" in url for url in urls)
+    assert len(info) == 120
+    assert info["CHEMBL0"]["target_name"] == "Cached"
+    assert info["CHEMBL7"]["uniprot_id"] == "P35354"
+    assert cache_service.get("target_info", "CHEMBL119")["target_name"] == "Target CHEMBL119"
+
+
+def test_molecule_miss_is_negative_cached(chembl_client):
+    """Test a confirmed ChEMBL miss is remembered instead of re-queried"""
+    with patch.object(chembl_client, '_get', return_value={"molecules": []}) as mock_get:
+        assert chembl_client.find_compound_by_inchikey("NONEXISTENT-INCHIKEY") is None
+        assert chembl_client.find_compound_by_inchikey("NONEXISTENT-INCHIKEY") is None
+
+        _, provenance = chembl_client.get_target_activities("NONEXISTENT-INCHIKEY")
+
+    assert mock_get.call_count == 1
+    assert provenance.not_found is True
+
+
 def test_get_target_activities_not_found(chembl_client):
     """Test when compound not found in ChEMBL"""
     mock_response = {"molecules": []}
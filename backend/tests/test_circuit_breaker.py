@@ -0,0 +1,146 @@
+"""Tests for per-upstream circuit breakers"""
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from app.models.schemas import IngredientInput, CompoundIdentity, ProvenanceRecord
+from app.services.analysis import AnalysisService
+from app.utils import circuit_breaker
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker
+from app.utils.deadline import request_deadline
+from app.utils.retry import is_retryable
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    """Start every test with all circuits closed"""
+    circuit_breaker._breakers.clear()
+    yield
+    circuit_breaker._breakers.clear()
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.org")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+def _fail(breaker: CircuitBreaker, exc: Exception) -> None:
+    with pytest.raises(type(exc)):
+        with breaker.guard():
+            raise exc
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_probe():
+    """Test N failures open the circuit, calls fail fast, and a good probe closes it"""
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_seconds=0.1)
+
+    for _ in range(3):
+        _fail(breaker, httpx.ConnectError("down"))
+
+    assert breaker.is_open()
+    with pytest.raises(CircuitOpenError) as exc_info:
+        with breaker.guard():
+            pytest.fail("open circuit must not call upstream")
+    assert not is_retryable(exc_info.value)
+
+    time.sleep(0.15)
+    assert not breaker.is_open()
+    with breaker.guard():
+        # Only one half-open probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    assert breaker.state == circuit_breaker.CLOSED
+
+
+def test_failed_probe_reopens_and_client_errors_do_not_trip():
+    """Test a failing half-open probe re-opens, while 404s never count as failures"""
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_seconds=0.05)
+
+    for _ in range(5):
+        _fail(breaker, _status_error(404))
+    assert breaker.state == circuit_breaker.CLOSED
+
+    _fail(breaker, _status_error(503))
+    _fail(breaker, httpx.ReadTimeout("slow"))
+    assert breaker.is_open()
+
+    time.sleep(0.1)
+    _fail(breaker, _status_error(502))
+    assert breaker.is_open()
+
+
+def test_timeouts_clamped_by_request_deadline_do_not_trip():
+    """Test timeouts only count when the client's full timeout applied"""
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_seconds=30)
+
+    def timed_out():
+        with pytest.raises(httpx.ReadTimeout):
+            with breaker.guard(timeout=30.0):
+                raise httpx.ReadTimeout("slow")
+
+    with request_deadline(5.0):
+        for _ in range(5):
+            timed_out()
+    assert breaker.state == circuit_breaker.CLOSED
+
+    # Background jobs (no deadline) get the full timeout, so theirs do count
+    timed_out()
+    timed_out()
+    assert breaker.is_open()
+
+
+def test_cancelled_probe_releases_half_open_slot():
+    """Test a half-open probe cancelled mid-call doesn't block every later probe"""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_seconds=0.05)
+    _fail(breaker, httpx.ConnectError("down"))
+    time.sleep(0.1)
+
+    async def probe():
+        with breaker.guard():
+            await asyncio.sleep(1.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(probe(), timeout=0.05))
+
+    assert breaker.state == circuit_breaker.HALF_OPEN
+    with breaker.guard():
+        pass
+    assert breaker.state == circuit_breaker.CLOSED
+
+
+def test_open_chembl_circuit_goes_straight_to_fallbacks():
+    """Test the pipeline skips ChEMBL calls while its circuit is open and uses the pharmacophore analyzer"""
+    service = AnalysisService()
+    compound = CompoundIdentity(
+        ingredient_name="outagemycin",
+        pubchem_cid=1,
+        inchikey="AAAAAAAAAAAAAA-BBBBBBBBBB-C",
+        canonical_smiles="CC(=O)Oc1ccccc1C(=O)O"
+    )
+    service.pubchem.resolve_compound = Mock(
+        return_value=(compound, ProvenanceRecord(service="PubChem", endpoint="/compound"))
+    )
+    service.chembl.get_target_activities = Mock()
+    service.chembl.infer_pathways_from_indications = Mock()
+    service.drugbank.fetch_drug_targets = Mock(return_value=([], ProvenanceRecord(service="Open Targets", endpoint="/graphql", not_found=True)))
+    service.drugbank.get_pathways_for_drug = Mock(return_value=[])
+
+    chembl = get_breaker("chembl")
+    for _ in range(chembl.failure_threshold):
+        chembl.record_failure()
+
+    with patch.object(service, "_map_pathways", return_value=([], ProvenanceRecord(service="Reactome", endpoint="/"))), \
+         patch("app.services.analysis.pharmacophore_analyzer.analyze_compound", return_value=([], [])) as pharmacophore:
+        report = service.analyze_ingredient(IngredientInput(ingredient_name="outagemycin"))
+
+    service.chembl.get_target_activities.assert_not_called()
+    service.chembl.infer_pathways_from_indications.assert_not_called()
+    service.drugbank.fetch_drug_targets.assert_called_once()
+    assert report.is_partial is True
+    assert "chembl_targets (chembl circuit open)" in report.skipped_stages
+    pharmacophore.assert_called()
@@ -0,0 +1,120 @@
+"""Tests for response compression and conditional GETs"""
+
+import gzip
+import zlib
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.main import app as biopath_app
+from app.utils.compression import CompressionMiddleware, negotiate_encoding
+from app.utils.http_cache import cached_response
+from app.utils.responses import dumps
+
+BODY = dumps({"pathways": [{"pathway_id": f"R-HSA-{i}", "name": "Signal Transduction"} for i in range(200)]})
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large(request: Request):
+        return cached_response(request, BODY)
+
+    @app.get("/small")
+    async def small(request: Request):
+        return cached_response(request, b'{"ok":true}')
+
+    @app.get("/stream")
+    async def stream():
+        lines = (dumps({"event": "compound", "index": i}) + b"\n" for i in range(50))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, min_size=100)
+    return app
+
+
+client = TestClient(_app())
+
+
+def test_negotiate_encoding():
+    """Test q-values, wildcards and refusals when picking an encoding"""
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("*") is not None
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("deflate") is None
+
+
+def test_large_body_compressed_with_encoded_etag():
+    """Test gzip bodies get Vary and a distinct strong ETag that revalidates to 304"""
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == BODY
+    etag = response.headers["etag"]
+    assert etag.endswith('-gzip"')
+
+    identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] == etag.replace("-gzip", "")
+
+    revalidated = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+
+
+def test_small_body_not_compressed():
+    """Test bodies under the size threshold are sent as-is"""
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_threshold_uses_declared_length_behind_other_middleware():
+    """Test small responses stay uncompressed when the CORS middleware re-chunks them"""
+    api = TestClient(biopath_app)
+    assert "content-encoding" not in api.get("/health", headers={"Accept-Encoding": "gzip"}).headers
+    listing = api.get("/api/plants?limit=500&fields=scientific_name,compounds", headers={"Accept-Encoding": "gzip"})
+    assert listing.headers["content-encoding"] == "gzip"
+
+
+def test_stream_compressed_per_chunk():
+    """Test NDJSON streams are compressed and decode to every event"""
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        raw = b"".join(response.iter_raw())
+    lines = gzip.decompress(raw).splitlines()
+    assert len(lines) == 50
+
+    # Every chunk is flushed, so the first event decodes on its own
+    first = raw[:raw.index(b"\x00\x00\xff\xff") + 4]
+    assert zlib.decompressobj(31).decompress(first).startswith(b'{"event":"compound","index":0}')
+
+
+def test_plant_info_last_modified():
+    """Test plant endpoints answer If-Modified-Since with 304"""
+    api = TestClient(biopath_app)
+    response = api.get("/api/plants/Hypericum perforatum")
+    assert response.status_code == 200
+    last_modified = response.headers["last-modified"]
+
+    revalidated = api.get(
+        "/api/plants/Hypericum perforatum",
+        headers={"If-Modified-Since": last_modified}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["last-modified"] == last_modified
+
+
+def test_side_effects_get_revalidates():
+    """Test GET /api/side-effects carries an ETag that yields 304"""
+    api = TestClient(biopath_app)
+    params = {"compound_name": "ibuprofen", "targets": ["Prostaglandin G/H synthase 2"]}
+    response = api.get("/api/side-effects", params=params)
+    assert response.status_code == 200
+    assert response.json()["compound_name"] == "ibuprofen"
+
+    revalidated = api.get("/api/side-effects", params=params, headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
@@ -0,0 +1,85 @@
+"""Tests for request deadline propagation"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.models.schemas import IngredientInput, CompoundIdentity, ProvenanceRecord
+from app.services.analysis import AnalysisService
+from app.services.report_cache import report_cache_key
+from app.utils import fetch_concurrent
+from app.utils.deadline import (
+    DeadlineExceeded,
+    clamp_timeout,
+    remaining,
+    request_deadline,
+)
+
+
+def test_deadline_clamps_timeouts_and_nests():
+    """Test per-call timeouts shrink to the budget and nested deadlines only shorten"""
+    assert remaining() is None
+    assert clamp_timeout(60.0) == 60.0
+
+    with request_deadline(5):
+        assert clamp_timeout(60.0) <= 5
+        with request_deadline(100):
+            assert remaining() <= 5
+
+    assert remaining() is None
+
+
+def test_expired_deadline_refuses_new_calls():
+    """Test clients can't start a call once the budget is spent"""
+    with request_deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            clamp_timeout(60.0)
+
+
+def test_fetch_concurrent_returns_partial_results_at_deadline():
+    """Test concurrent fetches carry the deadline and stop waiting when it expires"""
+    def fetch(identifier):
+        assert remaining() is not None  # Deadline visible in worker threads
+        if identifier == "slow":
+            time.sleep(1.0)
+        return identifier.upper()
+
+    start = time.time()
+    with request_deadline(0.3):
+        results = fetch_concurrent(fetch, ["fast", "slow"], max_workers=2)
+
+    assert results == {"fast": "FAST"}
+    assert time.time() - start < 0.8
+
+
+def test_pipeline_skips_optional_stages_when_deadline_expires():
+    """Test an expired deadline yields a partial report instead of running fallbacks"""
+    service = AnalysisService()
+    compound = CompoundIdentity(
+        ingredient_name="slowmycin",
+        pubchem_cid=1,
+        inchikey="AAAAAAAAAAAAAA-BBBBBBBBBB-C",
+        canonical_smiles="CCO"
+    )
+
+    def slow_resolve(name):
+        time.sleep(0.3)
+        return compound, ProvenanceRecord(service="PubChem", endpoint="/compound")
+
+    service.pubchem.resolve_compound = Mock(side_effect=slow_resolve)
+    service.chembl.get_target_activities = Mock(
+        return_value=([], ProvenanceRecord(service="ChEMBL", endpoint="/activity", status="error"))
+    )
+    service.chembl.infer_pathways_from_indications = Mock(return_value=[])
+    service.drugbank.fetch_drug_targets = Mock(return_value=([], ProvenanceRecord(service="Open Targets", endpoint="/graphql", not_found=True)))
+
+    with request_deadline(0.1):
+        report = service.analyze_ingredient(IngredientInput(ingredient_name="slowmycin"))
+
+    assert report.is_partial is True
+    assert "indication_inference" in report.skipped_stages
+    service.chembl.infer_pathways_from_indications.assert_not_called()
+    service.drugbank.fetch_drug_targets.assert_not_called()
+    # Partial reports are never served from the report cache
+    assert service.cache.get("report", report_cache_key(IngredientInput(ingredient_name="slowmycin"))) is None
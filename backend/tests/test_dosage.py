@@ -0,0 +1,80 @@
+"""Tests for dosage aggregation service"""
+
+import time
+import pytest
+from unittest.mock import patch
+
+from app.services.dosage_service import DosageService
+
+
+@pytest.fixture
+def dosage():
+    """Create dosage service with a short shared deadline"""
+    service = DosageService()
+    service.deadline_seconds = 0.5
+    return service
+
+
+def test_slow_source_returns_partial_result(dosage):
+    """Test that a slow source is reported as timed out instead of blocking"""
+    def slow_concentrations(name):
+        time.sleep(2)
+        return [], True
+
+    potency = [{
+        "target_name": "Cyclooxygenase-2",
+        "pchembl_value": 6.5,
+        "standard_type": "IC50",
+        "standard_value": 316.0,
+        "standard_units": "nM",
+        "effective_concentration_nm": 316.0,
+        "potency_category": "moderate",
+    }]
+
+    with patch.object(dosage.chembl, "fetch_potency_summary", return_value=(potency, True)), \
+         patch.object(dosage.dr_duke, "fetch_compound_concentrations", side_effect=slow_concentrations):
+        start = time.time()
+        response = dosage.get_dosage_data("ibuprofen", None, "HEFNNWSXXWATRW-UHFFFAOYSA-N", None, [])
+        elapsed = time.time() - start
+
+    assert elapsed < 1.5
+    assert response.sources_queried == ["chembl"]
+    assert response.sources_timed_out == ["dr_duke"]
+    assert len(response.potency_data) == 1
+    assert "Partial result" in response.data_quality_note
+
+
+def test_complete_response_is_cached(dosage):
+    """Test that a complete response is served from cache on the next call"""
+    concentrations = [{"plant_part": "Leaf", "concentration_low": 10.0, "concentration_high": 20.0, "unit": "ppm"}]
+
+    with patch.object(dosage.dr_duke, "fetch_compound_concentrations", return_value=(concentrations, True)) as mock_duke:
+        first = dosage.get_dosage_data("caffeine", None, None, None, [])
+        second = dosage.get_dosage_data("caffeine", None, None, None, [])
+
+    assert mock_duke.call_count == 1
+    assert first.sources_timed_out == []
+    assert second.plant_concentrations[0].plant_part == "Leaf"
+
+
+def test_failed_sources_are_reported_and_not_cached(dosage):
+    """Test a raising source or a swallowed upstream error never pins an incomplete response"""
+    with patch.object(dosage.chembl, "fetch_potency_summary", side_effect=RuntimeError("503")) as mock_chembl, \
+         patch.object(dosage.dr_duke, "fetch_compound_concentrations", return_value=([], False)):
+        first = dosage.get_dosage_data("caffeine", None, "RYYVLZVUVIJVGH-UHFFFAOYSA-N", None, [])
+        dosage.get_dosage_data("caffeine", None, "RYYVLZVUVIJVGH-UHFFFAOYSA-N", None, [])
+
+    assert sorted(first.sources_failed) == ["chembl", "dr_duke"]
+    assert "could not be fully queried" in first.data_quality_note
+    assert mock_chembl.call_count == 2
+
+
+def test_cache_key_covers_smiles_and_targets(dosage):
+    """Test responses for different targets or SMILES are not served from each other's entry"""
+    with patch.object(dosage, "_fetch_dr_duke", return_value=([], True)) as mock_duke:
+        dosage.get_dosage_data("caffeine", None, None, None, ["ADORA1", "ADORA2A"])
+        dosage.get_dosage_data("caffeine", None, None, None, ["ADORA2A", "ADORA1"])  # Same set: cache hit
+        dosage.get_dosage_data("caffeine", None, None, None, ["PDE4B"])
+        dosage.get_dosage_data("caffeine", None, None, "CN1C=NC2=C1C(=O)N(C)C(=O)N2C", ["PDE4B"])
+
+    assert mock_duke.call_count == 3
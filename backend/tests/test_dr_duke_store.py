@@ -0,0 +1,98 @@
+"""Tests for the local Dr. Duke's SQLite store"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.clients.dr_duke import DrDukeClient
+from app.data.dr_duke_store import DrDukeStore, import_csv_dir
+
+CSV_FILES = {
+    "FNFTAX.csv": "FNFNUM,TAXON,FAMILY\n1,Mentha x piperita,Lamiaceae\n2,Matricaria recutita,Asteraceae\n",
+    "COMMON_NAMES.csv": "FNFNUM,CNNAM\n1,Peppermint\n2,Chamomile\n",
+    "CHEMICALS.csv": "CHEM,CASNUM\nMENTHOL,89-78-1\n",
+    "FARMACY_NEW.csv": (
+        "FNFNUM,CHEM,PPLNTPART,PPMLOW,PPMHIGH\n"
+        "1,MENTHOL,Leaf,\"2,000\",\"45,000\"\n"
+        "1,MENTHONE,Leaf,1000,30000\n"
+        "1,LIMONENE,Plant,,\n"
+        "2,APIGENIN,Flower,100,8000\n"
+    ),
+    "AGGREGAC.csv": (
+        "CHEM,ACTIVITY,DOSAGE\n"
+        "MENTHOL,Analgesic,\n"
+        "MENTHOL,Antipruritic,\n"
+        "APIGENIN,Anxiolytic,\n"
+        "APIGENIN,Sedative,\n"
+    ),
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    for name, content in CSV_FILES.items():
+        (csv_dir / name).write_text(content)
+
+    db_path = tmp_path / "dr_duke.sqlite3"
+    counts = import_csv_dir(csv_dir, db_path)
+    assert counts["plant_chemicals"] == 4
+    return DrDukeStore(str(db_path))
+
+
+def test_store_queries(store):
+    """Test plant (scientific or common name), activity and concentration lookups"""
+    plant = store.search_plant("peppermint")
+    assert plant["scientific_name"] == "Mentha x piperita"
+    assert plant["common_names"] == ["Peppermint"]
+    assert [c["name"] for c in plant["chemicals"]] == ["MENTHOL", "MENTHONE", "LIMONENE"]
+    assert plant["chemicals"][0]["cas_number"] == "89-78-1"
+    assert plant["chemicals"][0]["concentration_high"] == 45000.0
+
+    assert store.search_plant("matricaria")["scientific_name"] == "Matricaria recutita"
+    assert store.search_plant("Unknown plant") is None
+
+    assert store.chemical_activities("Menthol") == ["Analgesic", "Antipruritic"]
+    assert store.compound_concentrations("menthol") == [{
+        "plant_part": "Leaf", "concentration_low": 2000.0, "concentration_high": 45000.0, "unit": "ppm"
+    }]
+    assert [c["name"] for c in store.chemicals_by_activity("sedative")] == ["APIGENIN"]
+
+
+def test_common_names_lookup_uses_plant_index(store):
+    """Test common names for a plant are read through an index, not a table scan"""
+    plan = store._connection().execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT name FROM common_names WHERE plant_id = ? LIMIT 10", (1,)
+    ).fetchall()
+
+    assert any("idx_common_names_plant" in row[-1] for row in plan)
+
+
+def test_missing_store_returns_none(tmp_path):
+    """Test lookups signal 'no store' so the client can scrape instead"""
+    store = DrDukeStore(str(tmp_path / "missing.sqlite3"))
+    assert not store.available
+    assert store.search_plant("Mentha x piperita") is None
+    assert store.chemical_activities("menthol") is None
+
+
+def test_client_prefers_store_and_falls_back_to_scraping(store):
+    """Test the client answers locally and only scrapes for unknown names"""
+    client = DrDukeClient()
+    client.store = store
+
+    with patch.object(client, "_search", side_effect=AssertionError("scraped")):
+        compounds = client.get_plant_compounds_for_species("Mentha x piperita")
+    assert compounds["found"]
+    assert compounds["compounds"][0] == {
+        "name": "MENTHOL", "cas_number": "89-78-1",
+        "activities": ["Analgesic", "Antipruritic"], "source": "dr_duke"
+    }
+
+    async def scraped(client_, query, result_type):
+        return '<a href="/phytochem/activity/1">Antioxidant</a>'
+
+    with patch.object(client, "_search", side_effect=scraped) as search:
+        assert client.get_chemical_activities("quercetin") == ["Antioxidant"]
+    assert search.called
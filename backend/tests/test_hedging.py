@@ -0,0 +1,73 @@
+"""Tests for hedged upstream requests"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import hedging
+from app.utils.metrics import metrics
+from app.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def warm_latencies():
+    """Seed a p95 of ~0.05s for the test call name"""
+    metrics.reset()
+    for _ in range(hedging.settings.hedge_min_samples):
+        metrics.observe("upstream_latency_seconds.test.call", 0.05)
+    with patch.object(hedging.settings, "hedge_min_delay_seconds", 0.05), \
+         patch.object(hedging.settings, "hedge_budget_ratio", 1.0):
+        yield
+    metrics.reset()
+
+
+def test_slow_primary_is_hedged_and_hedge_wins():
+    """Test a call stuck past p95 gets a duplicate and the faster one wins"""
+    calls = []
+
+    def call():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            time.sleep(1.0)
+            return "primary"
+        return "hedge"
+
+    start = time.monotonic()
+    result = hedging.hedged_call("test.call", call, RateLimiter(rate=0))
+
+    assert result == "hedge"
+    assert time.monotonic() - start < 0.5
+    assert metrics.counter("hedges_sent.test.call") == 1
+    assert metrics.counter("hedges_won.test.call") == 1
+
+
+def test_no_hedge_without_rate_limit_capacity():
+    """Test hedges are skipped when the client's rate limiter has no spare slot"""
+    limiter = RateLimiter(rate=0.1)
+    limiter.wait()  # Consume the only slot for the next 10s
+
+    def call():
+        time.sleep(0.2)
+        return "primary"
+
+    assert hedging.hedged_call("test.call", call, limiter) == "primary"
+    assert metrics.counter("hedges_sent.test.call") == 0
+    assert metrics.counter("hedges_skipped.test.call") == 1
+
+
+def test_fast_call_is_not_hedged():
+    """Test calls that finish before p95 never send a duplicate"""
+    assert hedging.hedged_call("test.call", lambda: "ok", RateLimiter(rate=0)) == "ok"
+    assert metrics.counter("hedges_sent.test.call") == 0
+
+
+def test_busy_primary_pool_runs_inline():
+    """Test calls run unhedged on the caller's thread instead of queueing for a primary worker"""
+    with patch.object(hedging, "_primary_slots", threading.BoundedSemaphore(1)) as slots:
+        slots.acquire()  # Every primary worker busy
+        result = hedging.hedged_call("test.call", lambda: threading.current_thread(), RateLimiter(rate=0))
+
+    assert result is threading.current_thread()
+    assert metrics.counter("hedges_skipped.test.call") == 1
@@ -0,0 +1,167 @@
+"""Tests for plant analysis (batch and streamed)"""
+
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+from app.data.plant_compounds import get_plant_compounds, get_prioritized_compounds
+from app.main import PlantAnalyzeOptions, app, plant_analysis_stream, plant_identification_service
+from app.models.schemas import (
+    BodyImpactReport,
+    CompoundIdentity,
+    ConfidenceTier,
+    PathwayMatch,
+)
+from app.services import plant_aggregates
+from app.services.plant_aggregates import plant_aggregate_store
+from app.services.plant_identification import PlantIdentificationResult
+from app.utils import uploads
+
+client = TestClient(app)
+
+IMAGE_BASE64 = base64.b64encode(b"\xff\xd8\xff" + b"\x00" * 64).decode()
+
+
+def _identified():
+    return PlantIdentificationResult(
+        success=True,
+        scientific_name="Hypericum perforatum",
+        confidence=0.9,
+        plant_info=get_plant_compounds("Hypericum perforatum")
+    )
+
+
+def _report(name: str) -> BodyImpactReport:
+    return BodyImpactReport(
+        ingredient_name=name,
+        compound_identity=CompoundIdentity(ingredient_name=name),
+        pathways=[PathwayMatch(
+            pathway_id="R-HSA-112316",
+            pathway_name="Neuronal System",
+            matched_targets=["P31645"],
+            measured_targets_count=1,
+            impact_score=0.5,
+            confidence_tier=ConfidenceTier.TIER_A,
+            confidence_score=0.9,
+            explanation="test",
+        )],
+        final_summary={}
+    )
+
+
+def _analyze(name: str, enable_predictions: bool = False) -> BodyImpactReport:
+    if name == "hyperforin":
+        time.sleep(0.3)  # The slow compound
+    return _report(name)
+
+
+def test_stream_disconnect_during_identification_cleans_up_after_the_step():
+    """Test a client disconnect mid-step closes the generator and image only once the step returns"""
+    image_bytes = b"\xff\xd8\xff" + bytes(range(256)) * 8
+    with patch.object(uploads.settings, "upload_spool_max_memory", 16):
+        image = uploads.new_spool()
+        image.write(image_bytes)
+        image.seek(0)
+    seen = {}
+
+    def identify(image_data, organs=None):
+        time.sleep(0.3)
+        seen["data"] = bytes(image_data)  # Still readable after the client left
+        return _identified()
+
+    analyze = Mock(side_effect=_analyze)
+
+    async def disconnect():
+        response = plant_analysis_stream(PlantAnalyzeOptions(max_compounds=3), image)
+        consumer = asyncio.ensure_future(response.body_iterator.__anext__())
+        await asyncio.sleep(0.05)
+        consumer.cancel()  # What Starlette does when the client disconnects
+        try:
+            await consumer
+        except asyncio.CancelledError:
+            pass
+        await response.body_iterator.aclose()
+
+    with patch.object(plant_identification_service, "identify_plant_from_image", side_effect=identify), \
+         patch.object(plant_identification_service, "_analyze_single_compound", analyze), \
+         patch("app.main.logger") as logger:
+        asyncio.run(disconnect())
+        time.sleep(0.5)
+
+    assert seen["data"] == image_bytes
+    assert image.closed
+    analyze.assert_not_called()  # Outstanding compound work never started
+    logger.error.assert_not_called()
+
+
+def test_streamed_plant_analysis_sends_compounds_as_they_complete():
+    """Test NDJSON events: identification first, fast compounds before slow ones, aggregate last"""
+    with patch.object(plant_identification_service, "identify_plant_from_image", return_value=_identified()), \
+         patch.object(plant_identification_service, "_analyze_single_compound", side_effect=_analyze), \
+         patch.object(plant_identification_service.analysis_service, "prefetch_compounds"):
+        response = client.post(
+            "/analyze_plant?stream=true",
+            json={"image_base64": IMAGE_BASE64, "max_compounds": 3}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+
+    assert events[0]["event"] == "identification"
+    assert events[0]["identification"]["scientific_name"] == "Hypericum perforatum"
+    compound_events = [e["compound_analysis"]["compound_name"] for e in events if e["event"] == "compound"]
+    assert len(compound_events) == 3
+    assert compound_events[-1] == "hyperforin"
+    assert events[-1]["event"] == "aggregate"
+    assert events[-1]["aggregate_pathways"][0]["num_compounds"] == 3
+
+
+def test_batch_plant_analysis_matches_priority_order():
+    """Test the non-streamed response keeps compound priority order and aggregates"""
+    with patch.object(plant_identification_service, "identify_plant_from_image", return_value=_identified()), \
+         patch.object(plant_identification_service, "_analyze_single_compound", side_effect=_analyze), \
+         patch.object(plant_identification_service.analysis_service, "prefetch_compounds"):
+        response = client.post("/analyze_plant", json={"image_base64": IMAGE_BASE64, "max_compounds": 3})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert [a["compound_name"] for a in body["compound_analyses"]] == [c["name"] for c in body["compounds_found"]]
+    assert body["aggregate_pathways"][0]["num_compounds"] == 3
+    assert body["summary"]["total_pathways_affected"] == 1
+
+
+def test_known_plant_served_from_precomputed_aggregate():
+    """Test a stored plant aggregate answers without rerunning the compound pipeline"""
+    with patch.object(plant_identification_service, "identify_plant_from_image", return_value=_identified()), \
+         patch.object(plant_identification_service.analysis_service, "prefetch_compounds"):
+        with patch.object(plant_identification_service, "_analyze_single_compound", side_effect=_analyze) as analyze:
+            first = client.post("/analyze_plant", json={"image_base64": IMAGE_BASE64}).json()
+        assert analyze.called
+
+        with patch.object(plant_identification_service, "_analyze_single_compound") as analyze:
+            second = client.post("/analyze_plant", json={"image_base64": IMAGE_BASE64}).json()
+        assert not analyze.called
+
+    assert second["compound_analyses"] == first["compound_analyses"]
+    assert second["aggregate_pathways"] == first["aggregate_pathways"]
+
+
+def test_outdated_aggregate_is_served_and_refreshed():
+    """Test an aggregate from an older version is served while a background refresh recomputes it"""
+    plant = _identified().plant_info
+    names = [c.name for c in get_prioritized_compounds(plant)]
+    with patch.object(plant_aggregates.settings, "app_version", "0.9.0"):
+        assert plant_aggregate_store.store(plant.scientific_name, names, [_report(n) for n in names], [])
+
+    with patch.object(plant_identification_service, "precompute_plant") as refresh:
+        aggregate = plant_aggregate_store.get(plant.scientific_name, names, False, refresh=refresh)
+        plant_aggregate_store._executor.submit(lambda: None).result()  # Wait for the refresh
+
+    assert aggregate is not None and not aggregate.is_current
+    assert refresh.called
+    assert plant_aggregate_store.get(plant.scientific_name, names[:1], False, refresh=refresh) is None
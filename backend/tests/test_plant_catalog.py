@@ -0,0 +1,74 @@
+"""Tests for the packed plant compound catalog"""
+
+from app.data.plant_catalog import PlantCatalog, build_catalog
+from app.data.plant_compounds import (
+    PLANT_COMPOUNDS_DB,
+    _plant_record,
+    get_plant_compounds,
+    search_plant_fuzzy,
+)
+
+PLANTS = [
+    {
+        "scientific_name": "Mentha piperita",
+        "common_names": ["Peppermint"],
+        "family": "Lamiaceae",
+        "compounds": [{
+            "name": "menthol", "chembl_id": "CHEMBL470670", "research_level": 0.8,
+            "drug_interaction_risk": 0.3, "bioactivity_strength": 0.6,
+            "health_impact_potential": 0.6, "lifestyle_categories": ["digestion"],
+        }],
+        "traditional_uses": ["Digestive aid"],
+        "parts_used": ["Leaves"],
+    },
+    {
+        "scientific_name": "Salvia officinalis",
+        "common_names": ["Sage", "Common Sage"],
+        "family": "Lamiaceae",
+        "compounds": [],
+        "traditional_uses": [],
+        "parts_used": ["Leaves"],
+    },
+]
+
+
+def test_catalog_behaves_like_the_old_dict(tmp_path):
+    """Test mapping access, ordering, searches and on-demand slotted records"""
+    path = tmp_path / "catalog.sqlite3"
+    version = build_catalog(PLANTS, path)
+    catalog = PlantCatalog(path, _plant_record)
+
+    assert catalog.data_version == version
+    assert list(catalog) == ["mentha piperita", "salvia officinalis"]
+    assert len(catalog) == 2
+    assert "salvia officinalis" in catalog
+    assert catalog.get("unknown") is None
+
+    mint = catalog["mentha piperita"]
+    assert mint.compounds[0].name == "menthol"
+    assert mint.compounds[0].lifestyle_categories == ["digestion"]
+    assert not hasattr(mint, "__dict__")
+    assert catalog["mentha piperita"] is mint  # Built once, then cached
+
+    assert [p.scientific_name for p in catalog.search_fuzzy("lamiaceae")] == ["Mentha piperita", "Salvia officinalis"]
+    assert [p.scientific_name for p in catalog.search_common_name("common")] == ["Salvia officinalis"]
+    assert [p.scientific_name for p in catalog.plants_with_compound("menth")] == ["Mentha piperita"]
+    assert catalog.compound_names() == ["menthol"]
+
+
+def test_data_version_tracks_content(tmp_path):
+    """Test rebuilding with changed data yields a new version, unchanged data the same one"""
+    path = tmp_path / "catalog.sqlite3"
+    first = build_catalog(PLANTS, path)
+    assert build_catalog(PLANTS, path) == first
+
+    changed = [dict(PLANTS[0], family="Labiatae"), PLANTS[1]]
+    assert build_catalog(changed, path) != first
+
+
+def test_shipped_catalog_lookups():
+    """Test the shipped catalog serves the public lookup functions"""
+    assert len(PLANT_COMPOUNDS_DB) > 0
+    plant = get_plant_compounds("Hypericum Perforatum")
+    assert plant.common_names == ["St. John's Wort"]
+    assert plant in search_plant_fuzzy("st. john")
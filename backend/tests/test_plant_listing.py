@@ -0,0 +1,82 @@
+"""Tests for paginated, projected and ETag-cached plant listings"""
+
+from fastapi.testclient import TestClient
+
+from app.data.plant_compounds import PLANT_COMPOUNDS_DB
+from app.main import app
+from app.services.plant_listing import PlantListingService
+
+client = TestClient(app)
+
+
+def test_cursor_pagination_walks_every_plant_once():
+    """Test following next_cursor visits all plants in name order"""
+    names = []
+    cursor = None
+    while True:
+        params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/plants", params=params).json()
+        assert body["total"] == len(PLANT_COMPOUNDS_DB)
+        names += [p["scientific_name"] for p in body["plants"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(names) == len(PLANT_COMPOUNDS_DB)
+    assert names == sorted(names, key=str.lower)
+
+
+def test_fields_projection_and_validation():
+    """Test fields= limits each plant to the requested keys and rejects unknown ones"""
+    body = client.get("/api/plants", params={"limit": 3, "fields": "scientific_name,compounds"}).json()
+    assert [set(p) for p in body["plants"]] == [{"scientific_name", "compounds"}] * 3
+    assert "priority_score" in body["plants"][0]["compounds"][0]
+
+    assert client.get("/api/plants", params={"fields": "bogus"}).status_code == 400
+    assert client.get("/api/plants", params={"cursor": "%%%"}).status_code == 400
+
+
+def test_strong_etag_and_if_none_match():
+    """Test repeated requests revalidate with 304 and different pages have different tags"""
+    first = client.get("/api/plants", params={"limit": 5})
+    etag = first.headers["etag"]
+    assert etag.startswith('"')
+
+    not_modified = client.get("/api/plants", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    other = client.get("/api/plants", params={"limit": 6})
+    assert other.headers["etag"] != etag
+
+    search = client.get("/api/plants/search", params={"q": "mint"})
+    assert search.status_code == 200
+    assert client.get(
+        "/api/plants/search", params={"q": "mint"}, headers={"If-None-Match": search.headers["etag"]}
+    ).status_code == 304
+
+
+def test_listing_rebuilds_when_data_version_changes():
+    """Test precomputed listings are discarded when the catalog version changes"""
+    version = ["v1"]
+    service = PlantListingService(version_func=lambda: version[0])
+
+    body, etag = service.listing_page(5)
+    assert service.listing_page(5) == (body, etag)
+    assert service.version == "v1"
+
+    version[0] = "v2"
+    service._summaries[0]["family"] = "stale"  # Would leak into a reused listing
+    rebuilt, _ = service.listing_page(5)
+    assert b"stale" not in rebuilt
+    assert service.version == "v2"
+
+
+def test_plant_detail_uses_precomputed_entry():
+    """Test the detail endpoint still falls back to fuzzy search"""
+    exact = client.get("/api/plants/Hypericum perforatum")
+    assert exact.status_code == 200
+    assert exact.json()["common_names"] == ["St. John's Wort"]
+    assert client.get("/api/plants/hypericum").json()["scientific_name"] == "Hypericum perforatum"
+    assert client.get("/api/plants/not-a-plant-anywhere").status_code == 404
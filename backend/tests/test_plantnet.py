@@ -0,0 +1,116 @@
+"""Tests for PlantNet client preprocessing and identification caching"""
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.clients.plantnet import PlantNetClient
+from app.services.cache import cache_service
+from app.utils.image_preprocessing import PreparedImage, preprocess_image, sniff_content_type
+
+PLANTNET_RESPONSE = {
+    "results": [{
+        "score": 0.91,
+        "species": {
+            "scientificNameWithoutAuthor": "Mentha piperita",
+            "scientificName": "Mentha piperita L.",
+            "genus": {"scientificName": "Mentha"},
+            "family": {"scientificName": "Lamiaceae"},
+            "commonNames": ["Peppermint"],
+        },
+    }]
+}
+
+
+@pytest.fixture
+def plantnet_client():
+    client = PlantNetClient()
+    client.api_key = "test-key"
+    return client
+
+
+@pytest.fixture
+def plantnet_calls():
+    """Route PlantNet uploads to a mock transport and record them"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=PLANTNET_RESPONSE)
+
+    real_client = httpx.Client
+    with patch("app.clients.plantnet.httpx.Client", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)):
+        yield calls
+
+
+def test_sniff_content_type():
+    """Test uploads are labelled by their actual format"""
+    assert sniff_content_type(b"\x89PNG\r\n\x1a\n....") == "image/png"
+    assert sniff_content_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+    assert sniff_content_type(memoryview(b"\xff\xd8\xff\xe0")) == "image/jpeg"
+
+
+def test_repeat_scan_is_served_from_cache(plantnet_client, plantnet_calls):
+    """Test identifying the same image twice uploads it only once"""
+    image = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+    first = plantnet_client.identify_plant(image, ["leaf"])
+    second = plantnet_client.identify_plant(memoryview(image), ["leaf"])
+
+    assert len(plantnet_calls) == 1
+    assert first["best_match"]["scientific_name"] == "Mentha piperita"
+    assert second["cached"] is True
+    assert second["best_match"] == first["best_match"]
+
+    # Results depend on the organ, so another organ is a separate query
+    plantnet_client.identify_plant(image, ["flower"])
+    assert len(plantnet_calls) == 2
+
+
+def test_near_duplicate_image_hits_perceptual_cache(plantnet_client, plantnet_calls):
+    """Test a re-encoded, resized copy of a photo resolves from the cache"""
+    Image = pytest.importorskip("PIL.Image")
+
+    photo = Image.new("RGB", (3000, 2000))
+    for x in range(0, 3000, 100):
+        photo.paste((x % 255, 120, 255 - x % 255), (x, 0, x + 100, 2000))
+
+    def encode(image, **kwargs):
+        output = io.BytesIO()
+        image.save(output, format="JPEG", **kwargs)
+        return output.getvalue()
+
+    original = encode(photo, quality=95)
+    prepared = preprocess_image(original)
+    assert max(Image.open(io.BytesIO(prepared.data)).size) <= 1280
+    assert len(prepared.data) < len(original)
+
+    plantnet_client.identify_plant(original, ["leaf"])
+    result = plantnet_client.identify_plant(encode(photo.resize((1500, 1000)), quality=70), ["leaf"])
+
+    assert len(plantnet_calls) == 1
+    assert result["cached"] is True
+
+
+def test_concurrent_stores_keep_every_phash_entry(plantnet_client):
+    """Test parallel identifications don't drop each other's perceptual-hash index entries"""
+    images = [
+        PreparedImage(b"", "image/jpeg", "leaf.jpg", content_hash=f"hash{i}", perceptual_hash=i)
+        for i in range(20)
+    ]
+
+    encode = cache_service.codec.encode
+
+    def slow_encode(value):
+        time.sleep(0.005)  # Widen the read-modify-write window
+        return encode(value)
+
+    with patch.object(cache_service.codec, "encode", slow_encode), ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda image: plantnet_client._store_identification(image, "leaf", {}), images))
+
+    index = cache_service.get("plantnet_phash_index", "leaf")
+    assert sorted(entry[1] for entry in index) == sorted(image.content_hash for image in images)
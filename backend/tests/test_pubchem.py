@@ -2,8 +2,9 @@
 
 import pytest
 from unittest.mock import Mock, patch
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
-from app.clients.pubchem import PubChemClient
+from app.clients.pubchem import PubChemClient, compound_cache_key
 from app.models.schemas import CompoundIdentity
 
 
@@ -68,6 +69,80 @@ def test_resolve_compound_not_found(pubchem_client):
         assert "No CID found" in provenance.error_message
 
 
+def test_resolve_compound_404_is_not_retried(pubchem_client):
+    """Test a PubChem 404 fails fast and is flagged as a definitive miss"""
+    import httpx
+
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404, json={"Fault": {"Code": "PUGREST.NotFound"}})
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.Client
+
+    with patch("app.clients.pubchem.httpx.Client", lambda **kw: real_client(transport=transport, **kw)):
+        compound, provenance = pubchem_client.resolve_compound("notacompound")
+
+    assert compound is None
+    assert provenance.not_found is True
+    assert len(calls) == 1
+
+
+def test_resolve_compounds_batch_fills_compound_cache(pubchem_client):
+    """Test batch resolution POSTs CID lists once and caches every name"""
+    from app.services.cache import cache_service
+
+    cache_service.set("compound", "caffeine", CompoundIdentity(ingredient_name="Caffeine", pubchem_cid=2519).model_dump())
+    cids = {"quercetin": [5280343], "apigenin": [5280443], "notacompound": []}
+    posts = []
+
+    def fake_post(url, data):
+        posts.append((url, data))
+        if "/name/cids/" in url:
+            return {"IdentifierList": {"CID": cids[data["name"].lower()]}}
+        cid_list = [int(cid) for cid in data["cid"].split(",")]
+        if "/synonyms/" in url:
+            return {"InformationList": {"Information": [{"CID": cid, "Synonym": [f"syn{cid}"]} for cid in cid_list]}}
+        return {"PropertyTable": {"Properties": [
+            {"CID": cid, "InChIKey": f"KEY{cid}", "CanonicalSMILES": "O"} for cid in cid_list
+        ]}}
+
+    with patch.object(pubchem_client, '_post', side_effect=fake_post):
+        results = pubchem_client.resolve_compounds_batch(["Quercetin", "apigenin", "caffeine", "notacompound"])
+
+    assert set(results) == {"quercetin", "apigenin", "caffeine"}
+    assert results["quercetin"].ingredient_name == "Quercetin"
+    assert results["apigenin"].synonyms == ["syn5280443"]
+    # 3 name lookups + one property POST + one synonym POST for both CIDs
+    assert len(posts) == 5
+    assert cache_service.get("compound", "quercetin")["inchikey"] == "KEY5280343"
+    assert cache_service.is_negative("compound", "notacompound")
+
+
+def test_resolve_compounds_batch_keeps_partial_results_on_timeout(pubchem_client):
+    """Test names looked up before the batch wait runs out are still resolved and cached"""
+    from app.services.cache import cache_service
+
+    def partial_lookups(fetch, keys, max_workers, timeout):
+        assert timeout > 120.0  # Scaled with the batch size
+        yield "quercetin", [5280343]
+        raise FuturesTimeoutError()
+
+    def fake_post(url, data):
+        return {"PropertyTable": {"Properties": [{"CID": 5280343, "InChIKey": "KEY"}]}} if "/property/" in url else {}
+
+    with patch("app.clients.pubchem.iter_concurrent", partial_lookups), \
+         patch.object(pubchem_client, '_post', side_effect=fake_post):
+        results = pubchem_client.resolve_compounds_batch([" Quercetin ", "apigenin"])
+
+    assert set(results) == {"quercetin"}
+    # Per-ingredient lookups read with the same key
+    assert cache_service.get("compound", compound_cache_key("Quercetin "))["inchikey"] == "KEY"
+    assert cache_service.get("compound", "apigenin") is None
+
+
 def test_get_cid_from_inchikey(pubchem_client):
     """Test CID lookup from InChIKey"""
     mock_response = {
@@ -78,3 +153,57 @@ def test_get_cid_from_inchikey(pubchem_client):
         cid = pubchem_client.get_cid_from_inchikey("HEFNNWSXXWATRW-UHFFFAOYSA-N")
 
         assert cid == 3672
+
+
+def test_get_toxicity_data_streams_sections(pubchem_client):
+    """Test toxicity extraction from a streamed, heading-filtered PUG View record"""
+    import json
+    import httpx
+    from app.clients import pubchem as pubchem_module
+
+    record = {
+        "Record": {
+            "RecordNumber": 3672,
+            "Section": [{
+                "TOCHeading": "Toxicity",
+                "Section": [{
+                    "TOCHeading": "Non-Human Toxicity Values",
+                    "Information": [{
+                        "Value": {"StringWithMarkup": [{"String": "LD50 oral rat 636 mg/kg"}]}
+                    }]
+                }]
+            }]
+        }
+    }
+    body = json.dumps(record).encode()
+
+    def handler(request):
+        if request.url.params.get("heading") == "Toxicity":
+            # Deliver the body in small chunks to exercise incremental parsing
+            chunks = (body[i:i + 16] for i in range(0, len(body), 16))
+            return httpx.Response(200, content=chunks)
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.Client
+
+    with patch.object(pubchem_module.httpx, "Client", lambda **kw: real_client(transport=transport, **kw)):
+        result = pubchem_client.get_toxicity_data(3672)
+
+    assert len(result["ld50_values"]) == 1
+    assert result["ld50_values"][0]["value"] == 636.0
+    assert result["ld50_values"][0]["species"] == "rat"
+
+    # Complete extraction is cached and served without new requests
+    with patch.object(pubchem_client, "_iter_pug_view_sections", side_effect=AssertionError):
+        assert pubchem_client.get_toxicity_data(3672) == result
+
+
+def test_byte_stream_reassembles_chunks():
+    """Test the ijson adapter returns the exact byte sequence across chunk boundaries"""
+    from app.clients.pubchem import _ByteStream
+
+    stream = _ByteStream(iter([b"ab", b"cde", b"f"]))
+    assert stream.read(4) == b"abcd"
+    assert stream.read(10) == b"ef"
+    assert stream.read(1) == b""
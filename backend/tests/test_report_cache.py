@@ -0,0 +1,107 @@
+"""Tests for the report-level cache"""
+
+import time
+import pytest
+from unittest.mock import Mock
+
+from app.models.schemas import IngredientInput, BodyImpactReport, CompoundIdentity
+from app.services.cache_codec import HEADER, MAGIC, RAW_CODEC
+from app.services.report_cache import ReportCache, report_cache_key
+
+
+def _report(name, error=None):
+    return BodyImpactReport(
+        ingredient_name=name,
+        compound_identity=CompoundIdentity(ingredient_name=name),
+        final_summary={"error": error} if error else {"total_pathways_affected": 3}
+    )
+
+
+@pytest.fixture
+def reports():
+    return ReportCache()
+
+
+def test_key_is_normalized_and_versioned():
+    """Test keys ignore case/whitespace but include options and version"""
+    a = IngredientInput(ingredient_name="  Curcumin ")
+    b = IngredientInput(ingredient_name="curcumin")
+    c = IngredientInput(ingredient_name="curcumin", enable_predictions=True)
+
+    assert report_cache_key(a) == report_cache_key(b)
+    assert report_cache_key(a) != report_cache_key(c)
+    assert report_cache_key(a, "1.0.0") != report_cache_key(a, "1.1.0")
+
+
+def test_hit_skips_pipeline(reports):
+    """Test a cached report is served without recomputing"""
+    ingredient = IngredientInput(ingredient_name="curcumin")
+    compute = Mock(return_value=_report("curcumin"))
+
+    reports.get_or_compute(ingredient, compute)
+    cached = reports.get_or_compute(ingredient, compute)
+
+    assert cached.ingredient_name == "curcumin"
+    assert compute.call_count == 1
+
+
+def test_hit_serves_encoded_report(reports):
+    """Test cached reports come back as the stored JSON bytes"""
+    ingredient = IngredientInput(ingredient_name="curcumin")
+    report = _report("curcumin")
+    compute = Mock(return_value=report)
+
+    encoded = reports.get_or_compute_json(ingredient, compute)
+    assert reports.get_or_compute_json(ingredient, compute) == encoded
+    assert BodyImpactReport.model_validate_json(encoded) == report
+    assert reports.get_or_compute(ingredient, compute) == report
+    assert compute.call_count == 1
+
+
+def test_report_json_is_stored_raw(reports):
+    """Test the encoded report is cached as raw bytes and served back unchanged"""
+    ingredient = IngredientInput(ingredient_name="curcumin")
+    compute = Mock(return_value=_report("curcumin"))
+    encoded = reports.get_or_compute_json(ingredient, compute)
+
+    key = reports.cache._generate_key("report_json", report_cache_key(ingredient))
+    assert reports.cache.cache.get(key) == HEADER.pack(
+        MAGIC, reports.cache.codec.schema_version, RAW_CODEC.codec_id
+    ) + encoded
+    assert reports.get_or_compute_json(ingredient, compute) == encoded
+    assert compute.call_count == 1
+
+
+def test_error_reports_are_not_cached(reports):
+    """Test failed analyses are recomputed on the next request"""
+    ingredient = IngredientInput(ingredient_name="unknownium")
+    compute = Mock(return_value=_report("unknownium", error="Failed to resolve compound structure"))
+
+    reports.get_or_compute(ingredient, compute)
+    reports.get_or_compute(ingredient, compute)
+
+    assert compute.call_count == 2
+
+
+def test_stale_entry_served_while_refreshing(reports):
+    """Test stale entries return immediately and refresh once in the background"""
+    ingredient = IngredientInput(ingredient_name="curcumin")
+    reports.get_or_compute(ingredient, Mock(return_value=_report("curcumin")))
+    reports.fresh_ttl = 0
+
+    def slow_refresh():
+        time.sleep(0.3)
+        return _report("curcumin")
+
+    refresh = Mock(side_effect=slow_refresh)
+
+    start = time.time()
+    first = reports.get_or_compute(ingredient, refresh)
+    second = reports.get_or_compute(ingredient, refresh)
+    elapsed = time.time() - start
+
+    assert first.ingredient_name == second.ingredient_name == "curcumin"
+    assert elapsed < 0.3
+
+    reports._executor.shutdown(wait=True)
+    assert refresh.call_count == 1
@@ -0,0 +1,138 @@
+"""Tests for the async PhytoHub and Dr. Duke's HTML scrapers"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from app.clients.dr_duke import DrDukeClient
+from app.clients import phytohub
+from app.clients.phytohub import PhytoHubClient
+
+FOOD_SEARCH = '<a href="/foods/42">Peppermint, leaves</a>'
+FOOD_PAGE = "".join(f'<a href="/compounds/PHUB{i}">Compound {i}</a>' for i in range(4))
+COMPOUND_PAGE = (
+    '<dt>Formula:</dt> C15H10O7 '
+    '<dt>Class:</dt> Flavonols<'
+    '<dt>PubChem CID:</dt> 5280343'
+    '<a href="/foods/7">Onion</a>'
+)
+
+
+def _mock_client(client, handler):
+    """Serve a client's async HTTP calls from a handler"""
+    return patch.object(
+        client,
+        "_client",
+        side_effect=lambda: httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    )
+
+
+class Concurrency:
+    """Async handler wrapper recording peak in-flight requests"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, request):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.handler(request)
+
+
+def test_phytohub_enriches_food_compounds_concurrently_and_caches_pages():
+    """Test compound detail pages are fetched in parallel, parsed and reused from cache"""
+    def pages(request):
+        path = request.url.path
+        if path == "/search/foods":
+            return httpx.Response(200, text=FOOD_SEARCH)
+        if path == "/foods/42":
+            return httpx.Response(200, text=FOOD_PAGE)
+        return httpx.Response(200, text=COMPOUND_PAGE)
+
+    client = PhytoHubClient()
+    handler = Concurrency(pages)
+    with _mock_client(client, handler):
+        result = client.get_plant_compounds_for_species("peppermint")
+
+    assert result["found"]
+    assert len(result["compounds"]) == 4
+    assert handler.peak > 1
+    first = result["compounds"][0]
+    assert first["formula"] == "C15H10O7"
+    assert first["compound_class"] == "Flavonols"
+    assert first["pubchem_id"] == "5280343"
+
+    # A compound search reuses the parsed detail page instead of refetching it
+    def search_only(request):
+        if request.url.path == "/search/compounds":
+            return httpx.Response(200, text=FOOD_PAGE)
+        return httpx.Response(500)
+
+    with _mock_client(client, search_only):
+        compound = client.search_compound("Compound 2")
+
+    assert compound.phytohub_id == "PHUB2"
+    assert compound.formula == "C15H10O7"
+
+
+def test_dr_duke_fetches_chemical_activities_concurrently():
+    """Test activities for a plant's chemicals are looked up in parallel"""
+    def pages(request):
+        result_type = request.url.params["type"]
+        if result_type == "plant":
+            return httpx.Response(200, text='<a href="/phytochem/plant/1">Mentha x piperita</a>')
+        if result_type == "chemical":
+            return httpx.Response(200, text="".join(
+                f'<a href="/phytochem/chemical/{i}">Chemical {i}</a>' for i in range(5)
+            ))
+        return httpx.Response(200, text='<a href="/phytochem/activity/9">Sedative</a>')
+
+    client = DrDukeClient()
+    handler = Concurrency(pages)
+    with _mock_client(client, handler):
+        result = client.get_plant_compounds_for_species("Mentha x piperita")
+
+    assert result["found"]
+    assert result["scientific_name"] == "Mentha x piperita"
+    assert [c["activities"] for c in result["compounds"]] == [["Sedative"]] * 5
+    assert handler.peak > 1
+
+
+def test_dr_duke_concentrations_parse_ranges_and_parts():
+    """Test the compiled concentration patterns prefer ranges and find nearby plant parts"""
+    html = "<td>Menthol in leaf 2,000 to 45,000 ppm</td><td>seed 10 ppm</td>"
+
+    concentrations = DrDukeClient()._parse_concentrations(html)
+
+    assert concentrations == [{
+        "plant_part": "Leaf",
+        "concentration_low": 2000.0,
+        "concentration_high": 45000.0,
+        "unit": "ppm",
+    }]
+
+
+def test_phytohub_enrichment_budget_returns_unenriched_compounds():
+    """Test slow detail pages are abandoned after the enrichment budget and the food result isn't cached"""
+    async def pages(request):
+        path = request.url.path
+        if path == "/search/foods":
+            return httpx.Response(200, text=FOOD_SEARCH)
+        if path == "/foods/42":
+            return httpx.Response(200, text=FOOD_PAGE)
+        if path == "/compounds/PHUB0":
+            return httpx.Response(200, text=COMPOUND_PAGE)
+        await asyncio.sleep(5)
+        return httpx.Response(200, text=COMPOUND_PAGE)
+
+    client = PhytoHubClient()
+    with _mock_client(client, pages), patch.object(phytohub.settings, "phytohub_enrich_timeout", 0.2):
+        result = client.search_food("peppermint")
+
+    assert [c.formula for c in result.compounds] == ["C15H10O7", None, None, None]
+    assert client._get_cached("food_peppermint") is None
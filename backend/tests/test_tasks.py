@@ -0,0 +1,142 @@
+"""Tests for Celery analysis tasks"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.models.schemas import BodyImpactReport, CompoundIdentity
+from app.tasks import celery_tasks
+from app.tasks.celery_tasks import analyze_batch_task, summarize_batches_task
+from app.utils.deadline import remaining
+
+
+def _report(name, error=None):
+    return BodyImpactReport(
+        ingredient_name=name,
+        compound_identity=CompoundIdentity(ingredient_name=name),
+        final_summary={"error": error} if error else {"total_pathways_affected": 0}
+    )
+
+
+def test_batch_task_reuses_worker_service():
+    """Test that a batch shares one service and reports per-ingredient failures"""
+    service = Mock()
+
+    def analyze(ingredient_input, force_refresh=False):
+        if ingredient_input.ingredient_name == "boom":
+            raise RuntimeError("upstream down")
+        if ingredient_input.ingredient_name == "unknownium":
+            return _report("unknownium", error="Failed to resolve compound structure")
+        return _report(ingredient_input.ingredient_name)
+
+    service.analyze_ingredient.side_effect = analyze
+
+    with patch.object(celery_tasks, "_analysis_service", service):
+        results = analyze_batch_task.apply(args=[[
+            {"ingredient_name": "caffeine"},
+            {"ingredient_name": "boom"},
+            {"ingredient_name": "unknownium"},
+        ]]).get()
+
+    assert [r["ingredient_name"] for r in results] == ["caffeine", "boom", "unknownium"]
+    assert [r["status"] for r in results] == ["completed", "failed", "failed"]
+    assert service.analyze_ingredient.call_count == 3
+
+
+def test_batch_task_runs_under_task_deadline():
+    """Test every analysis in a batch sees the task time limit as its deadline (threads pool has no hard limit)"""
+    service = Mock()
+    budgets = []
+
+    def analyze(ingredient_input, force_refresh=False):
+        budgets.append(remaining())
+        return _report(ingredient_input.ingredient_name)
+
+    service.analyze_ingredient.side_effect = analyze
+
+    with patch.object(celery_tasks, "_analysis_service", service), \
+         patch.object(celery_tasks.settings, "celery_task_time_limit", 120):
+        analyze_batch_task.apply(args=[[{"ingredient_name": "caffeine"}, {"ingredient_name": "quercetin"}]]).get()
+
+    assert len(budgets) == 2
+    assert all(budget is not None and 0 < budget <= 120 for budget in budgets)
+
+
+def test_analysis_service_created_once_across_threads():
+    """Test concurrent first calls share one AnalysisService"""
+    created = []
+
+    def slow_init(self):
+        created.append(self)
+        time.sleep(0.05)
+
+    barrier = threading.Barrier(4)
+
+    def get():
+        barrier.wait()
+        return celery_tasks.get_analysis_service()
+
+    with patch.object(celery_tasks, "_analysis_service", None), \
+         patch.object(celery_tasks.AnalysisService, "__init__", slow_init):
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(created) == 1
+
+
+def test_summarize_batches():
+    """Test chord callback merges chunk results"""
+    summary = summarize_batches_task.apply(args=[[
+        [{"ingredient_name": "a", "status": "completed"}],
+        [{"ingredient_name": "b", "status": "failed"}, {"ingredient_name": "c", "status": "completed"}],
+    ]]).get()
+
+    assert summary == {"total": 3, "completed": 2, "failed": 1, "failed_ingredients": ["b"]}
+
+
+def test_tasks_route_to_separate_queues():
+    """Test interactive and bulk tasks land on different queues"""
+    routes = celery_tasks.celery_app.conf.task_routes
+    assert routes["analyze_ingredient"]["queue"] == "interactive"
+    assert routes["analyze_ingredient_batch"]["queue"] == "bulk"
+
+
+def test_broker_priority_flips_for_redis():
+    """Test API priority maps onto the broker's priority order"""
+    with patch.object(celery_tasks.settings, "celery_broker_url", "amqp://localhost"):
+        assert celery_tasks.broker_priority(9) == 9
+        assert celery_tasks.broker_priority(42) == 9
+    with patch.object(celery_tasks.settings, "celery_broker_url", "redis://localhost:6379/0"):
+        assert celery_tasks.broker_priority(9) == 0
+
+
+def test_queue_wait_is_recorded():
+    """Test task_prerun records time spent waiting in the queue"""
+    celery_tasks.metrics.reset()
+    task = Mock()
+    task.request.get.return_value = 100.0
+    task.request.delivery_info = {"routing_key": "interactive"}
+
+    with patch.object(celery_tasks.time, "time", return_value=102.5):
+        celery_tasks._record_queue_wait(task=task)
+
+    snapshot = celery_tasks.metrics.snapshot()
+    assert snapshot["latencies"]["queue_wait_seconds.interactive"]["p95"] == 2.5
+    assert snapshot["counters"]["tasks_started.interactive"] == 1
+
+
+def test_bulk_chord_callback_has_no_enqueue_stamp():
+    """Test only chunk tasks carry enqueued_at, so the callback never reports batch runtime as queue wait"""
+    with patch.object(celery_tasks, "chord") as chord:
+        celery_tasks.submit_bulk_analysis([{"ingredient_name": f"i{n}"} for n in range(5)], chunk_size=2)
+
+    header = chord.call_args[0][0]
+    callback = chord.return_value.call_args[0][0]
+    assert len(header.tasks) == 3
+    assert all("enqueued_at" in task.options["headers"] for task in header.tasks)
+    assert "headers" not in callback.options
@@ -0,0 +1,147 @@
+"""Tests for bounded, streaming image upload ingestion"""
+
+import base64
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.plant_identification import PlantIdentificationResult
+from app.utils import uploads
+from app.utils.uploads import decode_base64_to_spool, find_string_field, image_buffer
+
+client = TestClient(app)
+
+IMAGE = bytes(range(256)) * 40
+
+
+def _identify_capture():
+    """Patch identification and record the buffer type and contents it was given"""
+    seen = {}
+
+    def identify(image_data, organs=None):
+        seen["type"] = type(image_data)
+        seen["data"] = bytes(image_data)
+        seen["organs"] = organs
+        return PlantIdentificationResult(success=False, error="stub")
+
+    return seen, patch("app.main.plant_identification_service.identify_plant_from_image", side_effect=identify)
+
+
+def test_base64_is_decoded_incrementally():
+    """Test chunked decoding handles data URLs, line breaks and chunk boundaries"""
+    encoded = base64.encodebytes(IMAGE).decode()  # Wrapped every 76 chars
+    with patch.object(uploads, "BASE64_CHUNK_CHARS", 100):
+        spool = decode_base64_to_spool("data:image/png;base64," + encoded)
+
+    with spool, image_buffer(spool) as view:
+        assert bytes(view) == IMAGE
+
+
+def test_image_buffer_views_rolled_over_spool():
+    """Test spools that rolled to disk are viewed via mmap"""
+    with patch.object(uploads.settings, "upload_spool_max_memory", 100):
+        spool = decode_base64_to_spool(base64.b64encode(IMAGE).decode())
+
+    assert spool._rolled
+    with spool, image_buffer(spool) as view:
+        assert isinstance(view, memoryview)
+        assert bytes(view) == IMAGE
+
+
+def test_identify_plant_streams_base64_body_as_memoryview():
+    """Test the JSON endpoint passes a memoryview of the decoded image, not a bytes copy"""
+    seen, identify = _identify_capture()
+    body = {"image_base64": base64.b64encode(IMAGE).decode(), "organs": ["leaf"]}
+
+    with identify:
+        response = client.post("/identify_plant", json=body)
+
+    assert response.status_code == 200
+    assert seen["type"] is memoryview
+    assert seen["data"] == IMAGE
+    assert seen["organs"] == ["leaf"]
+
+
+def test_find_string_field_skips_nested_and_quoted_keys():
+    """Test only the top-level key is matched, past strings holding JSON syntax"""
+    body = (
+        b'{"note": "{\\"image_base64\\": \\"x\\"}, [", "nested": {"image_base64": "no"},'
+        b' "tags": ["image_base64"], "image_base64" : "aGk=", "organs": ["leaf"]}'
+    )
+    start, end = find_string_field(memoryview(body), "image_base64")
+
+    assert body[start:end] == b"aGk="
+    assert find_string_field(memoryview(b'{"image_base64": null}'), "image_base64") is None
+    assert find_string_field(memoryview(b'{"image_base64": "unterminated'), "image_base64") is None
+
+
+def test_base64_field_decoded_from_spooled_body():
+    """Test the image is decoded in place from a rolled-over body; only the other fields are parsed"""
+    seen, identify = _identify_capture()
+    # Line-wrapped data URL with escaped slashes, as some JSON encoders write it
+    encoded = "data:image/png;base64," + base64.encodebytes(IMAGE).decode()
+    body = json.dumps({"image_base64": encoded, "organs": ["flower"]}).replace("/", "\\/").encode()
+    parsed = []
+    loads = json.loads
+
+    def recording_loads(data, *args, **kwargs):
+        parsed.append(len(data))
+        return loads(data, *args, **kwargs)
+
+    with identify, patch.object(uploads.settings, "upload_spool_max_memory", 1024), \
+         patch.object(uploads, "BASE64_CHUNK_CHARS", 1000), \
+         patch.object(uploads.json, "loads", recording_loads):
+        response = client.post("/identify_plant", content=body, headers={"content-type": "application/json"})
+
+    assert response.status_code == 200
+    assert seen["data"] == IMAGE
+    assert seen["organs"] == ["flower"]
+    assert parsed and max(parsed) < 100
+
+
+def test_upload_endpoint_passes_spooled_file_view():
+    """Test multipart uploads are viewed in place instead of read into bytes"""
+    seen, identify = _identify_capture()
+
+    with identify:
+        response = client.post(
+            "/identify_plant/upload",
+            files={"file": ("leaf.png", IMAGE, "image/png")},
+            data={"organs": "leaf,flower"}
+        )
+
+    assert response.status_code == 200
+    assert seen["type"] is memoryview
+    assert seen["data"] == IMAGE
+    assert seen["organs"] == ["leaf", "flower"]
+
+
+def test_oversized_uploads_are_rejected_early():
+    """Test declared and streamed bodies over the limit get 413 before identification"""
+    seen, identify = _identify_capture()
+
+    encoded = base64.b64encode(IMAGE * 10).decode()  # Past the limit plus body overhead
+
+    with identify, patch.object(uploads.settings, "max_upload_bytes", 1024):
+        too_big = client.post("/identify_plant", json={"image_base64": encoded})
+
+        def chunks():
+            payload = json.dumps({"image_base64": encoded}).encode()
+            for i in range(0, len(payload), 4096):
+                yield payload[i:i + 4096]
+
+        streamed = client.post("/identify_plant", content=chunks(), headers={"content-type": "application/json"})
+        upload = client.post("/identify_plant/upload", files={"file": ("leaf.png", IMAGE * 100, "image/png")})
+
+    assert too_big.status_code == 413
+    assert streamed.status_code == 413
+    assert upload.status_code == 413
+    assert "type" not in seen
+
+
+def test_invalid_base64_and_missing_image():
+    """Test malformed image fields are client errors"""
+    assert client.post("/identify_plant", json={"image_base64": "abc"}).status_code == 400
+    assert client.post("/identify_plant", json={"organs": ["leaf"]}).status_code == 422
@@ -0,0 +1,92 @@
+"""Tests for the cache warmer CLI"""
+
+import time
+from unittest.mock import Mock, patch
+
+from app.cli import warm_cache
+from app.services.cache import cache_service
+from app.models.schemas import BodyImpactReport, CompoundIdentity
+
+
+def _report(name):
+    return BodyImpactReport(
+        ingredient_name=name,
+        compound_identity=CompoundIdentity(ingredient_name=name)
+    )
+
+
+def test_warm_resumes_and_retries_failures(tmp_path):
+    """Test completed ingredients are skipped and failed ones retried on rerun"""
+    state_file = tmp_path / "state.txt"
+    analyzed = []
+
+    def analyze(self, ingredient_input):
+        analyzed.append(ingredient_input.ingredient_name)
+        if ingredient_input.ingredient_name == "flaky":
+            raise RuntimeError("upstream timeout")
+        return _report(ingredient_input.ingredient_name)
+
+    prefetch = Mock()
+    with patch.object(warm_cache.AnalysisService, "__init__", return_value=None), \
+         patch.object(warm_cache.AnalysisService, "prefetch_compounds", prefetch), \
+         patch.object(warm_cache.AnalysisService, "analyze_ingredient", analyze):
+        code = warm_cache.main([
+            "--no-plants", "--ingredients", "caffeine", "Caffeine ", "flaky",
+            "--state-file", str(state_file)
+        ])
+        assert code == 1
+        assert sorted(analyzed) == ["caffeine", "flaky"]
+        prefetch.assert_called_once_with(["caffeine", "flaky"])
+
+        analyzed.clear()
+        prefetch.reset_mock()
+        warm_cache.main(["--no-plants", "--ingredients", "caffeine", "flaky", "--state-file", str(state_file)])
+        assert analyzed == ["flaky"]
+        prefetch.assert_called_once_with(["flaky"])
+
+
+def test_only_confirmed_misses_count_as_warm(tmp_path):
+    """Test error reports are retried unless the name is negative-cached"""
+    state_file = tmp_path / "state.txt"
+    cache_service.set_negative("compound", "notacompound", "No CID found")
+
+    def analyze(self, ingredient_input):
+        report = _report(ingredient_input.ingredient_name)
+        report.final_summary = {"error": "Could not resolve compound"}
+        return report
+
+    with patch.object(warm_cache.AnalysisService, "__init__", return_value=None), \
+         patch.object(warm_cache.AnalysisService, "prefetch_compounds", Mock()), \
+         patch.object(warm_cache.AnalysisService, "analyze_ingredient", analyze):
+        code = warm_cache.main([
+            "--no-plants", "--ingredients", "NotACompound", "caffeine", "--state-file", str(state_file)
+        ])
+
+    state = warm_cache.WarmState(state_file)
+    assert code == 1
+    assert state.is_done("notacompound")
+    assert not state.is_done("caffeine")
+
+
+def test_expired_entries_are_pending(tmp_path):
+    """Test ingredients warmed longer ago than the report TTL are warmed again"""
+    state_file = tmp_path / "state.txt"
+    old = time.time() - 2 * warm_cache.settings.report_cache_stale_ttl
+    state_file.write_text(f"caffeine\t{old:.0f}\ncurcumin\t{time.time():.0f}\nlegacy\n")
+
+    state = warm_cache.WarmState(state_file)
+
+    assert not state.is_done("Caffeine")
+    assert state.is_done("curcumin")
+    assert not state.is_done("legacy")
+
+    state.mark_done("caffeine")
+    assert warm_cache.WarmState(state_file).is_done("caffeine")
+
+
+def test_plant_compounds_are_included():
+    """Test the warmer walks prioritized compounds from the plant database"""
+    names = warm_cache.plant_compound_names()
+
+    assert names
+    assert len(names) == len(set(names))
@@ -78,6 +78,7 @@ export interface ProvenanceRecord {
   cache_hit: boolean;
   response_size?: number;
   error_message?: string;
+  not_found?: boolean;
 }
 
 export interface TopPathwaySummary {
@@ -126,6 +127,8 @@ export interface BodyImpactReport {
   analysis_version: string;
   predictions_enabled: boolean;
   total_analysis_duration_seconds?: number;
+  is_partial?: boolean;
+  skipped_stages?: string[];
   personalized_interactions?: PersonalizedInteraction[];
 }
 